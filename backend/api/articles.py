@@ -1,11 +1,31 @@
-from typing import List
+import os
+import uuid
+from datetime import datetime
+from typing import AsyncIterable, AsyncIterator, Awaitable, Callable, Iterable, List
 
-from fastapi import APIRouter, Depends, Header, HTTPException, Response
+from fastapi import APIRouter, Depends, Header, HTTPException, Path, Query, Request, Response
+from fastapi.responses import FileResponse, StreamingResponse
+from starlette.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
-from backend.schemas.article import ArticleCreate, ArticleResponse
+from backend.core.compression import get_response_encodings, mark_encoded, negotiate
+from backend.core.config import Config
+from backend.core.http_cache import cache_headers, etag_matches, not_modified
+from backend.core.serialization import JSONBytesResponse
+from backend.schemas.article import (
+    ArticleBatch,
+    ArticleCreate,
+    ArticleImportResult,
+    ArticlePage,
+    ArticleResponse,
+    ArticleSearchResult,
+)
+from backend.services.article_export import EXPORT_MEDIA_TYPES, export_chunks
+from backend.services.article_import import ArticleImporter, ErrorFile, OversizedLine
 from backend.services.article_service import ArticleService
-from backend.repositories.article_repository import ArticleRepository
-from backend.core.database import get_db
+from backend.services.article_cache import get_article_cache
+from backend.services.search_index import ArticleSearchEngine, get_article_search_engine
+from backend.repositories.article_repository import ARTICLE_SORTS, ArticleQuery, ArticleRepository
+from backend.core.database import get_db, get_read_db
 from backend.api.auth import extract_bearer_token, get_auth_service
 from backend.schemas.auth_schema import UserResponse
 from backend.services.auth_service import AuthService
@@ -15,7 +35,16 @@ router = APIRouter()
 
 def get_article_service(db: Session = Depends(get_db)) -> ArticleService:
     article_repository = ArticleRepository(db)
-    return ArticleService(article_repository)
+    return ArticleService(
+        article_repository, search_engine=get_article_search_engine(), article_cache=get_article_cache()
+    )
+
+
+def get_read_article_service(db: Session = Depends(get_read_db)) -> ArticleService:
+    """Article service bound to the read replica (or the primary when none is configured)."""
+    return ArticleService(
+        ArticleRepository(db), search_engine=get_article_search_engine(), article_cache=get_article_cache()
+    )
 
 
 def get_current_user(
@@ -27,54 +56,279 @@ def get_current_user(
     return auth_service.get_current_user(token, x_csrf_token)
 
 
+def get_article_query(
+    published: bool | None = None,
+    author_id: int | None = Query(None, ge=1),
+    created_after: datetime | None = None,
+    created_before: datetime | None = None,
+    title_prefix: str | None = Query(None, min_length=1, max_length=200),
+    sort: str | None = Query(None, pattern="^(" + "|".join(ARTICLE_SORTS) + ")$"),
+) -> ArticleQuery:
+    """Listing filters and sort order from the query string."""
+    return ArticleQuery(
+        published=published,
+        author_id=author_id,
+        created_after=created_after,
+        created_before=created_before,
+        title_prefix=title_prefix,
+        sort=sort,
+    )
+
+
+def get_article_ids(ids: str = Query(..., description="Comma-separated article ids")) -> List[int]:
+    """Ids of a batch read, at most ARTICLES_BATCH_MAX_IDS of them."""
+    try:
+        article_ids = [int(value) for value in ids.split(",")]
+    except ValueError as exc:
+        raise HTTPException(status_code=422, detail="ids must be comma-separated integers") from exc
+    if len(article_ids) > Config.ARTICLES_BATCH_MAX_IDS:
+        raise HTTPException(status_code=422, detail=f"At most {Config.ARTICLES_BATCH_MAX_IDS} ids per request")
+    return article_ids
+
+
 @router.post("/articles/", response_model=ArticleResponse)
 def create_article(
     article: ArticleCreate,
     service: ArticleService = Depends(get_article_service),
-    _: UserResponse = Depends(get_current_user),
+    user: UserResponse = Depends(get_current_user),
 ):
     """
     Endpoint to create a new article.
     """
-    return service.create_article(article)
+    return JSONBytesResponse(service.create_article(article, author_id=user.id))
 
 
-@router.get("/articles/", response_model=List[ArticleResponse])
-def read_articles(
+async def _ndjson_lines(chunks: AsyncIterator[bytes], max_line_bytes: int) -> AsyncIterator[bytes | OversizedLine]:
+    """
+    Lines of a streamed NDJSON body. A line longer than `max_line_bytes`
+    comes out as an OversizedLine and the rest of it is dropped as it
+    arrives, so the buffer never holds much more than one chunk past the
+    limit.
+    """
+    buffer = b""
+    oversized: OversizedLine | None = None
+    async for chunk in chunks:
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            if oversized is not None:
+                # `line` is the tail of the oversized line.
+                yield oversized
+                oversized = None
+            elif len(line) > max_line_bytes:
+                yield OversizedLine(line, max_line_bytes)
+            else:
+                yield line
+        if oversized is None and len(buffer) > max_line_bytes:
+            oversized = OversizedLine(buffer, max_line_bytes)
+        if oversized is not None:
+            buffer = b""
+    if oversized is not None:
+        yield oversized
+    elif buffer:
+        yield buffer
+
+
+def _import_error_path(user_id: int, import_id: str) -> str:
+    # Named after the importing user, so nobody else can download the file.
+    return os.path.join(Config.IMPORT_ERROR_DIR, f"bulk-{user_id}-{import_id}.jsonl")
+
+
+async def run_bulk_import(
+    request: Request,
+    user_id: int,
+    article_repository: ArticleRepository,
+    search_engine: ArticleSearchEngine | None,
+    batch_size: int,
+    run: Callable[..., Awaitable],
+) -> ArticleImportResult:
+    """
+    Feed the NDJSON request body to an ArticleImporter in batches. The
+    importer works on a sync session, so each call goes through `run`:
+    run_in_threadpool here, AsyncSession.run_sync on the async router.
+    """
+    import_id = uuid.uuid4().hex
+    error_file = ErrorFile(_import_error_path(user_id, import_id))
+    importer = ArticleImporter(
+        article_repository,
+        batch_size=batch_size,
+        error_sink=error_file,
+        search_engine=search_engine,
+    )
+    try:
+        lines: List[bytes] = []
+        async for line in _ndjson_lines(request.stream(), Config.IMPORT_MAX_LINE_BYTES):
+            lines.append(line)
+            if len(lines) >= batch_size:
+                await run(importer.feed, lines)
+                lines = []
+        await run(importer.feed, lines)
+        report = await run(importer.close)
+    finally:
+        error_file.close()
+    error_url = request.app.url_path_for("read_import_errors", import_id=import_id) if error_file.used else None
+    return ArticleImportResult(**report.to_dict(), error_url=error_url)
+
+
+def import_errors_response(user_id: int, import_id: str) -> FileResponse:
+    path = _import_error_path(user_id, import_id)
+    if not os.path.isfile(path):
+        raise HTTPException(status_code=404, detail="Import errors not found")
+    return FileResponse(path, media_type="application/x-ndjson", filename=f"import-errors-{import_id}.jsonl")
+
+
+@router.post("/articles/bulk", response_model=ArticleImportResult)
+async def bulk_import_articles(
+    request: Request,
+    batch_size: int = Query(Config.IMPORT_BATCH_SIZE, ge=1, le=100_000),
     service: ArticleService = Depends(get_article_service),
+    user: UserResponse = Depends(get_current_user),
+):
+    """
+    Import articles from an NDJSON request body, one {"title", "content"}
+    object per line. The body is consumed as it streams in and inserted in
+    batches; rejected lines, including any over IMPORT_MAX_LINE_BYTES, can
+    be downloaded by the same user from the returned `error_url`.
+    """
+    return await run_bulk_import(
+        request, user.id, service.article_repository, service.search_engine, batch_size, run_in_threadpool
+    )
+
+
+@router.get("/articles/bulk/{import_id}/errors", name="read_import_errors")
+def read_import_errors(
+    import_id: str = Path(..., pattern="^[0-9a-f]{32}$"),
+    user: UserResponse = Depends(get_current_user),
+):
+    """Lines a bulk import by the current user rejected, as NDJSON error records."""
+    return import_errors_response(user.id, import_id)
+
+
+@router.get("/articles/", response_model=ArticlePage)
+def read_articles(
+    limit: int = Query(Config.ARTICLES_PAGE_DEFAULT_LIMIT, ge=1, le=Config.ARTICLES_PAGE_MAX_LIMIT),
+    after: str | None = None,
+    query: ArticleQuery = Depends(get_article_query),
+    if_none_match: str | None = Header(None),
+    service: ArticleService = Depends(get_read_article_service),
     _: UserResponse = Depends(get_current_user),
 ):
     """
-    Endpoint to get all articles.
+    Endpoint to get a page of article summaries, optionally filtered by
+    `published`, `author_id`, a `created_after`/`created_before` range or a
+    `title_prefix`, and ordered by `sort`. Only combinations an index can
+    serve are accepted; others answer 400 listing the allowed ones. Pass the
+    returned `next_cursor` as `after` to fetch the following page. Answers
+    304 when `If-None-Match` carries the current collection ETag.
     """
-    return service.get_articles()
+    etag = service.get_articles_etag()
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+    return JSONBytesResponse(service.get_articles_page(limit, after, query), headers=cache_headers(etag))
 
 
-@router.get("/articles/search", response_model=List[ArticleResponse])
+@router.get("/articles/search", response_model=List[ArticleSearchResult])
 def search_articles(
     q: str,
-    service: ArticleService = Depends(get_article_service),
+    limit: int = Query(Config.ARTICLES_PAGE_DEFAULT_LIMIT, ge=1, le=Config.ARTICLES_PAGE_MAX_LIMIT),
+    offset: int = Query(0, ge=0),
+    service: ArticleService = Depends(get_read_article_service),
+    _: UserResponse = Depends(get_current_user),
+):
+    """
+    Search articles by title or content, ranked by relevance with
+    highlighted snippets.
+    """
+    return JSONBytesResponse(service.search_articles(q, limit=limit, offset=offset))
+
+
+@router.get("/articles/search/stats")
+def search_stats(_: UserResponse = Depends(get_current_user)):
+    """
+    Size and hit/miss statistics of the in-process search index.
+    """
+    engine = get_article_search_engine()
+    if engine is None:
+        raise HTTPException(status_code=404, detail="Search index is disabled")
+    return engine.stats()
+
+
+@router.get("/articles/cache/stats")
+def cache_stats(_: UserResponse = Depends(get_current_user)):
+    """
+    Hit ratio of the read-through article cache.
+    """
+    cache = get_article_cache()
+    if cache is None:
+        raise HTTPException(status_code=404, detail="Article cache is disabled")
+    return cache.stats()
+
+
+@router.get("/articles/batch", response_model=ArticleBatch)
+def read_articles_batch(
+    article_ids: List[int] = Depends(get_article_ids),
+    service: ArticleService = Depends(get_read_article_service),
     _: UserResponse = Depends(get_current_user),
 ):
     """
-    Search articles by title or content.
+    Several articles in one request, e.g. `?ids=3,1,2`. Found articles come
+    back in the order requested, and ids that do not exist under `missing`.
+    Articles not in the article cache are read with a single query.
     """
-    return service.search_articles(q)
+    return JSONBytesResponse(service.get_articles_batch_json(article_ids))
+
+
+def export_response(chunks: Iterable[bytes] | AsyncIterable[bytes], format: str, gzip: bool) -> StreamingResponse:
+    filename = f"articles.{format}.gz" if gzip else f"articles.{format}"
+    return StreamingResponse(
+        chunks,
+        media_type="application/gzip" if gzip else EXPORT_MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
+@router.get("/articles/export")
+def export_articles(
+    format: str = Query("ndjson", pattern="^(ndjson|csv)$"),
+    gzip: bool = False,
+    service: ArticleService = Depends(get_read_article_service),
+    _: UserResponse = Depends(get_current_user),
+):
+    """
+    Stream every article as NDJSON or CSV, optionally gzipped. Rows are read
+    in batches from a server-side cursor, so memory stays flat.
+    """
+    return export_response(export_chunks(service.article_repository.iter_articles(), format, gzip=gzip), format, gzip)
 
 
 @router.get("/articles/{article_id}", response_model=ArticleResponse)
 def read_article(
     article_id: int,
-    service: ArticleService = Depends(get_article_service),
+    if_none_match: str | None = Header(None),
+    accept_encoding: str | None = Header(None),
+    service: ArticleService = Depends(get_read_article_service),
     _: UserResponse = Depends(get_current_user),
 ):
     """
-    Endpoint to get a single article by its ID.
+    Endpoint to get a single article by its ID. A matching `If-None-Match`
+    is answered with 304 after a version lookup that never reads `content`.
+    Clients accepting a compressed encoding get the copy stored in the
+    article cache, so the body is not compressed per request.
     """
-    article = service.get_article_by_id(article_id)
-    if article is None:
+    if if_none_match:
+        etag = service.get_article_etag(article_id)
+        if etag is None:
+            raise HTTPException(status_code=404, detail="Article not found")
+        if etag_matches(if_none_match, etag):
+            return not_modified(etag)
+    found = service.get_article_json(article_id, encoding=negotiate(accept_encoding, get_response_encodings()))
+    if found is None:
         raise HTTPException(status_code=404, detail="Article not found")
-    return article
+    body, etag, encoding = found
+    response = JSONBytesResponse(body, headers=cache_headers(etag))
+    if encoding is not None:
+        mark_encoded(response.headers, encoding)
+    return response
 
 
 @router.delete("/articles/{article_id}", status_code=204)
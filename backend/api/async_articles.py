@@ -0,0 +1,191 @@
+from typing import List
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Path, Query, Request, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.api.articles import (
+    export_response,
+    get_article_ids,
+    get_article_query,
+    import_errors_response,
+    run_bulk_import,
+)
+from backend.api.async_auth import get_async_auth_service
+from backend.api.auth import extract_bearer_token
+from backend.core.async_database import get_async_db, get_async_read_db
+from backend.core.compression import get_response_encodings, mark_encoded, negotiate
+from backend.core.config import Config
+from backend.core.http_cache import cache_headers, etag_matches, not_modified
+from backend.core.serialization import JSONBytesResponse
+from backend.repositories.article_repository import ArticleQuery, ArticleRepository
+from backend.repositories.async_article_repository import AsyncArticleRepository
+from backend.schemas.article import (
+    ArticleBatch,
+    ArticleCreate,
+    ArticleImportResult,
+    ArticlePage,
+    ArticleResponse,
+    ArticleSearchResult,
+)
+from backend.schemas.auth_schema import UserResponse
+from backend.services.async_article_service import AsyncArticleService
+from backend.services.async_auth_service import AsyncAuthService
+from backend.services.article_cache import get_article_cache
+from backend.services.article_export import aexport_chunks
+from backend.services.search_index import get_article_search_engine
+
+router = APIRouter()
+
+
+def get_async_article_service(db: AsyncSession = Depends(get_async_db)) -> AsyncArticleService:
+    return AsyncArticleService(
+        AsyncArticleRepository(db), search_engine=get_article_search_engine(), article_cache=get_article_cache()
+    )
+
+
+def get_async_read_article_service(db: AsyncSession = Depends(get_async_read_db)) -> AsyncArticleService:
+    """Article service bound to the read replica (or the primary when none is configured)."""
+    return AsyncArticleService(
+        AsyncArticleRepository(db), search_engine=get_article_search_engine(), article_cache=get_article_cache()
+    )
+
+
+async def get_current_user(
+    authorization: str | None = Header(None),
+    x_csrf_token: str | None = Header(None),
+    auth_service: AsyncAuthService = Depends(get_async_auth_service),
+) -> UserResponse:
+    token = extract_bearer_token(authorization)
+    return await auth_service.get_current_user(token, x_csrf_token)
+
+
+@router.post("/articles/", response_model=ArticleResponse)
+async def create_article(
+    article: ArticleCreate,
+    service: AsyncArticleService = Depends(get_async_article_service),
+    user: UserResponse = Depends(get_current_user),
+):
+    return JSONBytesResponse(await service.create_article(article, author_id=user.id))
+
+
+@router.post("/articles/bulk", response_model=ArticleImportResult)
+async def bulk_import_articles(
+    request: Request,
+    batch_size: int = Query(Config.IMPORT_BATCH_SIZE, ge=1, le=100_000),
+    db: AsyncSession = Depends(get_async_db),
+    user: UserResponse = Depends(get_current_user),
+):
+    # The importer is written against a sync session; run_sync hands it the
+    # one behind `db`.
+    async def run(method, *args):
+        return await db.run_sync(lambda _: method(*args))
+
+    return await run_bulk_import(
+        request, user.id, ArticleRepository(db.sync_session), get_article_search_engine(), batch_size, run
+    )
+
+
+@router.get("/articles/bulk/{import_id}/errors", name="read_import_errors")
+async def read_import_errors(
+    import_id: str = Path(..., pattern="^[0-9a-f]{32}$"),
+    user: UserResponse = Depends(get_current_user),
+):
+    return import_errors_response(user.id, import_id)
+
+
+@router.get("/articles/", response_model=ArticlePage)
+async def read_articles(
+    limit: int = Query(Config.ARTICLES_PAGE_DEFAULT_LIMIT, ge=1, le=Config.ARTICLES_PAGE_MAX_LIMIT),
+    after: str | None = None,
+    query: ArticleQuery = Depends(get_article_query),
+    if_none_match: str | None = Header(None),
+    service: AsyncArticleService = Depends(get_async_read_article_service),
+    _: UserResponse = Depends(get_current_user),
+):
+    etag = await service.get_articles_etag()
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+    return JSONBytesResponse(await service.get_articles_page(limit, after, query), headers=cache_headers(etag))
+
+
+@router.get("/articles/search", response_model=List[ArticleSearchResult])
+async def search_articles(
+    q: str,
+    limit: int = Query(Config.ARTICLES_PAGE_DEFAULT_LIMIT, ge=1, le=Config.ARTICLES_PAGE_MAX_LIMIT),
+    offset: int = Query(0, ge=0),
+    service: AsyncArticleService = Depends(get_async_read_article_service),
+    _: UserResponse = Depends(get_current_user),
+):
+    return JSONBytesResponse(await service.search_articles(q, limit=limit, offset=offset))
+
+
+@router.get("/articles/search/stats")
+async def search_stats(_: UserResponse = Depends(get_current_user)):
+    engine = get_article_search_engine()
+    if engine is None:
+        raise HTTPException(status_code=404, detail="Search index is disabled")
+    return engine.stats()
+
+
+@router.get("/articles/cache/stats")
+async def cache_stats(_: UserResponse = Depends(get_current_user)):
+    cache = get_article_cache()
+    if cache is None:
+        raise HTTPException(status_code=404, detail="Article cache is disabled")
+    return cache.stats()
+
+
+@router.get("/articles/batch", response_model=ArticleBatch)
+async def read_articles_batch(
+    article_ids: List[int] = Depends(get_article_ids),
+    service: AsyncArticleService = Depends(get_async_read_article_service),
+    _: UserResponse = Depends(get_current_user),
+):
+    return JSONBytesResponse(await service.get_articles_batch_json(article_ids))
+
+
+@router.get("/articles/export")
+async def export_articles(
+    format: str = Query("ndjson", pattern="^(ndjson|csv)$"),
+    gzip: bool = False,
+    service: AsyncArticleService = Depends(get_async_read_article_service),
+    _: UserResponse = Depends(get_current_user),
+):
+    rows = service.article_repository.iter_articles()
+    return export_response(aexport_chunks(rows, format, gzip=gzip), format, gzip)
+
+
+@router.get("/articles/{article_id}", response_model=ArticleResponse)
+async def read_article(
+    article_id: int,
+    if_none_match: str | None = Header(None),
+    accept_encoding: str | None = Header(None),
+    service: AsyncArticleService = Depends(get_async_read_article_service),
+    _: UserResponse = Depends(get_current_user),
+):
+    if if_none_match:
+        etag = await service.get_article_etag(article_id)
+        if etag is None:
+            raise HTTPException(status_code=404, detail="Article not found")
+        if etag_matches(if_none_match, etag):
+            return not_modified(etag)
+    found = await service.get_article_json(article_id, encoding=negotiate(accept_encoding, get_response_encodings()))
+    if found is None:
+        raise HTTPException(status_code=404, detail="Article not found")
+    body, etag, encoding = found
+    response = JSONBytesResponse(body, headers=cache_headers(etag))
+    if encoding is not None:
+        mark_encoded(response.headers, encoding)
+    return response
+
+
+@router.delete("/articles/{article_id}", status_code=204)
+async def delete_article(
+    article_id: int,
+    service: AsyncArticleService = Depends(get_async_article_service),
+    _: UserResponse = Depends(get_current_user),
+):
+    deleted = await service.delete_article(article_id)
+    if not deleted:
+        raise HTTPException(status_code=404, detail="Article not found")
+    return Response(status_code=204)
@@ -0,0 +1,68 @@
+from fastapi import APIRouter, Depends, Header, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.api.auth import extract_bearer_token
+from backend.core.async_database import get_async_db
+from backend.core.serialization import JSONBytesResponse
+from backend.core.tokens import get_key_ring
+from backend.repositories.async_auth_repository import AsyncAuthRepository
+from backend.schemas.auth_schema import (
+    TokenRefreshRequest,
+    TokenResponse,
+    UserCreate,
+    UserLogin,
+    UserResponse,
+)
+from backend.services.async_auth_service import AsyncAuthService
+from backend.services.auth_cache import get_auth_token_cache
+from backend.services.token_revocation import get_token_revocations
+
+router = APIRouter()
+
+
+def get_async_auth_service(db: AsyncSession = Depends(get_async_db)) -> AsyncAuthService:
+    return AsyncAuthService(
+        AsyncAuthRepository(db), token_cache=get_auth_token_cache(), revocations=get_token_revocations()
+    )
+
+
+@router.post("/auth/register", response_model=TokenResponse, status_code=status.HTTP_201_CREATED)
+async def register_user(payload: UserCreate, auth_service: AsyncAuthService = Depends(get_async_auth_service)):
+    user = await auth_service.register_user(payload)
+    return JSONBytesResponse(auth_service.issue_tokens(user), status_code=status.HTTP_201_CREATED)
+
+
+@router.post("/auth/login", response_model=TokenResponse)
+async def login(payload: UserLogin, auth_service: AsyncAuthService = Depends(get_async_auth_service)):
+    return JSONBytesResponse(await auth_service.login(payload))
+
+
+@router.post("/auth/refresh", response_model=TokenResponse)
+async def refresh_tokens(
+    payload: TokenRefreshRequest,
+    auth_service: AsyncAuthService = Depends(get_async_auth_service),
+):
+    return JSONBytesResponse(await auth_service.refresh_tokens(payload.refresh_token))
+
+
+@router.post("/auth/logout", status_code=status.HTTP_204_NO_CONTENT)
+async def logout(payload: TokenRefreshRequest, auth_service: AsyncAuthService = Depends(get_async_auth_service)):
+    await auth_service.logout(payload.refresh_token)
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
+
+
+@router.get("/auth/jwks.json")
+async def read_jwks():
+    """Public keys (JWKS) that verify issued tokens; empty when only HMAC keys are configured."""
+    return JSONBytesResponse(get_key_ring().jwks())
+
+
+@router.get("/auth/me", response_model=UserResponse)
+async def read_profile(
+    authorization: str | None = Header(None),
+    x_csrf_token: str | None = Header(None),
+    auth_service: AsyncAuthService = Depends(get_async_auth_service),
+):
+    token = extract_bearer_token(authorization)
+    return JSONBytesResponse(await auth_service.get_current_user(token, x_csrf_token))
+
@@ -1,8 +1,10 @@
-from fastapi import APIRouter, Depends, Header, HTTPException, status
+from fastapi import APIRouter, Depends, Header, HTTPException, Response, status
 from sqlalchemy.orm import Session
 
 from backend.core.security import credentials_exception
 from backend.core.database import get_db
+from backend.core.serialization import JSONBytesResponse
+from backend.core.tokens import get_key_ring
 from backend.repositories.auth_repository import AuthRepository
 from backend.schemas.auth_schema import (
     TokenRefreshRequest,
@@ -11,13 +13,15 @@ from backend.schemas.auth_schema import (
     UserLogin,
     UserResponse,
 )
+from backend.services.auth_cache import get_auth_token_cache
 from backend.services.auth_service import AuthService
+from backend.services.token_revocation import get_token_revocations
 
 router = APIRouter()
 
 
 def get_auth_service(db: Session = Depends(get_db)) -> AuthService:
-    return AuthService(AuthRepository(db))
+    return AuthService(AuthRepository(db), token_cache=get_auth_token_cache(), revocations=get_token_revocations())
 
 
 def extract_bearer_token(authorization: str | None) -> str:
@@ -29,15 +33,17 @@ def extract_bearer_token(authorization: str | None) -> str:
     return parts[1]
 
 
+# Async so that bcrypt is awaited on the password pool: a sync handler would
+# hold a threadpool thread for every job queued there.
 @router.post("/auth/register", response_model=TokenResponse, status_code=status.HTTP_201_CREATED)
-def register_user(payload: UserCreate, auth_service: AuthService = Depends(get_auth_service)):
-    auth_service.register_user(payload)
-    return auth_service.login(UserLogin(email=payload.email, password=payload.password))
+async def register_user(payload: UserCreate, auth_service: AuthService = Depends(get_auth_service)):
+    user = await auth_service.aregister_user(payload)
+    return JSONBytesResponse(auth_service.issue_tokens(user), status_code=status.HTTP_201_CREATED)
 
 
 @router.post("/auth/login", response_model=TokenResponse)
-def login(payload: UserLogin, auth_service: AuthService = Depends(get_auth_service)):
-    return auth_service.login(payload)
+async def login(payload: UserLogin, auth_service: AuthService = Depends(get_auth_service)):
+    return JSONBytesResponse(await auth_service.alogin(payload))
 
 
 @router.post("/auth/refresh", response_model=TokenResponse)
@@ -45,7 +51,19 @@ def refresh_tokens(
     payload: TokenRefreshRequest,
     auth_service: AuthService = Depends(get_auth_service),
 ):
-    return auth_service.refresh_tokens(payload.refresh_token)
+    return JSONBytesResponse(auth_service.refresh_tokens(payload.refresh_token))
+
+
+@router.post("/auth/logout", status_code=status.HTTP_204_NO_CONTENT)
+def logout(payload: TokenRefreshRequest, auth_service: AuthService = Depends(get_auth_service)):
+    auth_service.logout(payload.refresh_token)
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
+
+
+@router.get("/auth/jwks.json")
+def read_jwks():
+    """Public keys (JWKS) that verify issued tokens; empty when only HMAC keys are configured."""
+    return JSONBytesResponse(get_key_ring().jwks())
 
 
 @router.get("/auth/me", response_model=UserResponse)
@@ -55,4 +73,5 @@ def read_profile(
     auth_service: AuthService = Depends(get_auth_service),
 ):
     token = extract_bearer_token(authorization)
-    return auth_service.get_current_user(token, x_csrf_token)
+    return JSONBytesResponse(auth_service.get_current_user(token, x_csrf_token))
+
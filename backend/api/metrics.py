@@ -0,0 +1,25 @@
+from fastapi import APIRouter, HTTPException
+from fastapi.responses import PlainTextResponse
+
+from backend.core.load_shedding import get_concurrency_limiter
+from backend.core.metrics import get_metrics
+
+router = APIRouter()
+
+PROMETHEUS_MEDIA_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+@router.get("/metrics", response_class=PlainTextResponse, include_in_schema=False)
+def read_metrics():
+    """
+    Per-route request latency, SQL count and time, bcrypt/JWT timings and,
+    with load shedding on, concurrency limits in the Prometheus text format.
+    """
+    metrics = get_metrics()
+    if metrics is None:
+        raise HTTPException(status_code=404, detail="Metrics are disabled")
+    body = metrics.render()
+    limiter = get_concurrency_limiter()
+    if limiter is not None:
+        body += limiter.render()
+    return PlainTextResponse(body, media_type=PROMETHEUS_MEDIA_TYPE)
@@ -0,0 +1,116 @@
+"""
+Micro-benchmarks for the ArticleRepository and AuthService hot paths
+against a database filled by `backend.benchmarks.datagen`.
+
+    python -m backend.benchmarks.datagen --database-url sqlite:///./bench-100k.db --rows 100000
+    python -m backend.benchmarks.bench_hot_paths --database-url sqlite:///./bench-100k.db --output hot-100k.json
+
+bcrypt runs at `--bcrypt-rounds` (default 4) so that login measures the
+service around the hash. Use bench_login for the cost of the hash itself.
+"""
+import argparse
+import random
+import sys
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import sessionmaker
+
+from backend.benchmarks.datagen import vocabulary
+from backend.benchmarks.results import measure, write_results
+from backend.core import security
+from backend.core.database import create_engine_from_config
+from backend.models.article import Article
+from backend.models.schema import create_schema
+from backend.repositories.article_repository import ArticleRepository
+from backend.repositories.auth_repository import AuthRepository
+from backend.schemas.auth_schema import UserCreate, UserLogin
+from backend.services.auth_cache import AuthTokenCache
+from backend.services.auth_service import AuthService
+
+PASSWORD = "benchmark-password"
+
+
+def article_benchmarks(db, rows: int, iterations: int) -> dict:
+    repository = ArticleRepository(db)
+    rng = random.Random(1)
+    words = vocabulary()
+    random_id = lambda: rng.randint(1, rows)  # noqa: E731
+
+    def create_and_delete():
+        article = repository.create_article("Benchmark", "body " * 100)
+        repository.delete_article(article.id)
+
+    return {
+        "articles.page_first": measure(lambda: repository.get_articles_page(20), iterations),
+        "articles.page_deep": measure(lambda: repository.get_articles_page(20, after=(rows // 2,)), iterations),
+        "articles.get_by_id": measure(lambda: repository.get_article_by_id(random_id()), iterations),
+        "articles.get_version": measure(lambda: repository.get_article_version(random_id()), iterations),
+        "articles.collection_version": measure(repository.get_collection_version, iterations),
+        "articles.search_common": measure(lambda: repository.search_articles(words[0]), iterations),
+        "articles.search_rare": measure(lambda: repository.search_articles(words[-1]), iterations),
+        "articles.search_two_terms": measure(lambda: repository.search_articles(f"{words[1]} {words[5]}"), iterations),
+        "articles.create_delete": measure(create_and_delete, iterations),
+    }
+
+
+def auth_benchmarks(db, iterations: int) -> dict:
+    repository = AuthRepository(db)
+    service = AuthService(repository)
+    cached_service = AuthService(repository, token_cache=AuthTokenCache())
+    email = "hot-paths@example.com"
+    if repository.get_by_email(email) is None:
+        service.register_user(UserCreate(email=email, password=PASSWORD))
+    tokens = service.login(UserLogin(email=email, password=PASSWORD))
+    # Refresh tokens are single use, so each refresh presents the one issued by the last.
+    latest = [service.login(UserLogin(email=email, password=PASSWORD))]
+
+    def refresh():
+        latest[0] = service.refresh_tokens(latest[0].refresh_token)
+
+    return {
+        "auth.login": measure(lambda: service.login(UserLogin(email=email, password=PASSWORD)), iterations),
+        "auth.decode_token": measure(lambda: security.decode_token(tokens.access_token), iterations),
+        "auth.current_user": measure(
+            lambda: service.get_current_user(tokens.access_token, tokens.csrf_token), iterations
+        ),
+        "auth.current_user_cached": measure(
+            lambda: cached_service.get_current_user(tokens.access_token, tokens.csrf_token), iterations
+        ),
+        "auth.refresh": measure(refresh, iterations),
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--database-url", default="sqlite:///./bench.db")
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--bcrypt-rounds", type=int, default=4)
+    parser.add_argument("--output", help="write results as JSON to this path")
+    args = parser.parse_args(argv)
+
+    security.get_pwd_context().update(bcrypt__rounds=args.bcrypt_rounds)
+    db_engine = create_engine_from_config(args.database_url)
+    create_schema(db_engine)
+    db = sessionmaker(bind=db_engine)()
+    try:
+        rows = db.execute(select(func.max(Article.id))).scalar() or 0
+        if not rows:
+            print("no articles; run backend.benchmarks.datagen first", file=sys.stderr)
+            return 1
+        results = {**article_benchmarks(db, rows, args.iterations), **auth_benchmarks(db, args.iterations)}
+    finally:
+        db.close()
+        db_engine.dispose()
+
+    parameters = {
+        "database_url": args.database_url,
+        "rows": rows,
+        "iterations": args.iterations,
+        "bcrypt_rounds": args.bcrypt_rounds,
+    }
+    write_results(args.output, "hot_paths", parameters, results)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,218 @@
+"""
+In-process load driver: concurrent clients call the real ASGI app through
+httpx, without sockets. It reports p50/p99 latency and requests per second
+for login, list, get, batch, search and delete, against a database filled by
+`backend.benchmarks.datagen`.
+
+    python -m backend.benchmarks.bench_load --database-url sqlite:///./bench-100k.db \\
+        --concurrency 16 --requests 2000 --output load-100k.json
+
+Delete runs against articles it creates first, so the generated data stays
+intact between runs.
+
+With `--base-url` the same scenarios go over HTTP to a running server
+instead, e.g. gunicorn started with DATABASE_URL set to the same database
+(and BCRYPT_ROUNDS matching `--bcrypt-rounds`):
+
+    python -m backend.benchmarks.bench_load --database-url sqlite:///./bench-100k.db \
+        --base-url http://127.0.0.1:8000 --concurrency 32
+
+`--load-shedding` puts the LoadSheddingMiddleware of main.py in front of the
+in-process app. Requests it rejects are counted as `shed`, apart from the
+latencies, which then cover admitted requests only.
+"""
+import argparse
+import asyncio
+import random
+import sys
+import time
+from typing import Callable, Dict, Tuple
+
+import httpx
+from fastapi import FastAPI
+from sqlalchemy import func, select
+from sqlalchemy.orm import sessionmaker
+
+from backend.api import articles, auth
+from backend.benchmarks.datagen import vocabulary
+from backend.benchmarks.results import summarize, write_results
+from backend.core import security
+from backend.core.database import create_engine_from_config, get_db, get_read_db
+from backend.core.load_shedding import LoadSheddingMiddleware, build_concurrency_limiter
+from backend.core.pagination import encode_cursor
+from backend.models.article import Article
+from backend.models.schema import create_schema
+from backend.repositories.article_repository import ArticleRepository
+
+PASSWORD = "benchmark-password"
+EMAIL = "load@example.com"
+
+RequestSpec = Tuple[str, str, Dict]
+
+
+def build_app(session_factory, load_shedding: bool = False) -> FastAPI:
+    """The API routers as main.py mounts them, bound to the benchmark database."""
+
+    def override_get_db():
+        db = session_factory()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app = FastAPI()
+    app.include_router(auth.router, prefix="/api")
+    app.include_router(articles.router, prefix="/api")
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
+    if load_shedding:
+        app.add_middleware(LoadSheddingMiddleware, limiter=build_concurrency_limiter())
+    return app
+
+
+async def drive(client: httpx.AsyncClient, build: Callable[[int], RequestSpec], total: int, concurrency: int) -> dict:
+    latencies = []
+    errors = 0
+    shed = 0
+    next_index = 0
+
+    async def worker():
+        nonlocal next_index, errors, shed
+        while next_index < total:
+            index = next_index
+            next_index += 1
+            method, url, options = build(index)
+            start = time.perf_counter()
+            response = await client.request(method, url, **options)
+            elapsed = time.perf_counter() - start
+            if response.status_code in (429, 503) and "retry-after" in response.headers:
+                shed += 1
+                continue
+            latencies.append(elapsed)
+            if response.status_code >= 400:
+                errors += 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+    result = summarize(latencies)
+    result["rps"] = round(total / elapsed, 1)
+    result["errors"] = errors
+    result["shed"] = shed
+    return result
+
+
+async def run(
+    session_factory,
+    rows: int,
+    requests: int,
+    login_requests: int,
+    concurrency: int,
+    base_url: str | None = None,
+    load_shedding: bool = False,
+) -> dict:
+    rng = random.Random(2)
+    words = vocabulary()[:200]
+    db = session_factory()
+    try:
+        repository = ArticleRepository(db)
+        doomed = [repository.create_article("Load test", "to be deleted").id for _ in range(requests)]
+    finally:
+        db.close()
+
+    if base_url is None:
+        app = build_app(session_factory, load_shedding)
+        client_options = {"transport": httpx.ASGITransport(app=app), "base_url": "http://bench"}
+    else:
+        client_options = {"base_url": base_url, "limits": httpx.Limits(max_connections=concurrency)}
+    async with httpx.AsyncClient(**client_options) as client:
+        await client.post("/api/auth/register", json={"email": EMAIL, "password": PASSWORD})
+        tokens = (await client.post("/api/auth/login", json={"email": EMAIL, "password": PASSWORD})).json()
+        headers = {"Authorization": f"Bearer {tokens['access_token']}", "X-CSRF-Token": tokens["csrf_token"]}
+
+        scenarios: Dict[str, Tuple[Callable[[int], RequestSpec], int]] = {
+            "login": (
+                lambda i: ("POST", "/api/auth/login", {"json": {"email": EMAIL, "password": PASSWORD}}),
+                login_requests,
+            ),
+            "list": (
+                lambda i: (
+                    "GET",
+                    "/api/articles/",
+                    {"params": {"after": encode_cursor({"s": "id", "k": [rng.randint(0, rows)]})}, "headers": headers},
+                ),
+                requests,
+            ),
+            "get": (lambda i: ("GET", f"/api/articles/{rng.randint(1, rows)}", {"headers": headers}), requests),
+            "batch": (
+                lambda i: (
+                    "GET",
+                    "/api/articles/batch",
+                    {"params": {"ids": ",".join(str(rng.randint(1, rows)) for _ in range(20))}, "headers": headers},
+                ),
+                requests,
+            ),
+            "search": (
+                lambda i: ("GET", "/api/articles/search", {"params": {"q": rng.choice(words)}, "headers": headers}),
+                requests,
+            ),
+            "delete": (lambda i: ("DELETE", f"/api/articles/{doomed[i]}", {"headers": headers}), requests),
+        }
+        results = {}
+        for name, (build, total) in scenarios.items():
+            results[name] = await drive(client, build, total, concurrency)
+        return results
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--database-url", default="sqlite:///./bench.db")
+    parser.add_argument("--requests", type=int, default=1000, help="requests per scenario")
+    parser.add_argument("--login-requests", type=int, default=100)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--bcrypt-rounds", type=int, default=4)
+    parser.add_argument("--base-url", help="drive a running server over HTTP instead of the in-process app")
+    parser.add_argument("--load-shedding", action="store_true", help="shed load as main.py does (LOAD_SHEDDING_*)")
+    parser.add_argument("--output", help="write results as JSON to this path")
+    args = parser.parse_args(argv)
+
+    security.get_pwd_context().update(bcrypt__rounds=args.bcrypt_rounds)
+    db_engine = create_engine_from_config(args.database_url)
+    create_schema(db_engine)
+    session_factory = sessionmaker(autocommit=False, autoflush=False, bind=db_engine)
+    with session_factory() as db:
+        rows = db.execute(select(func.max(Article.id))).scalar() or 0
+    if not rows:
+        print("no articles; run backend.benchmarks.datagen first", file=sys.stderr)
+        return 1
+    try:
+        results = asyncio.run(
+            run(
+                session_factory,
+                rows,
+                args.requests,
+                args.login_requests,
+                args.concurrency,
+                args.base_url,
+                args.load_shedding,
+            )
+        )
+    finally:
+        db_engine.dispose()
+
+    parameters = {
+        "database_url": args.database_url,
+        "rows": rows,
+        "requests": args.requests,
+        "login_requests": args.login_requests,
+        "concurrency": args.concurrency,
+        "base_url": args.base_url,
+        "bcrypt_rounds": args.bcrypt_rounds,
+        "load_shedding": args.load_shedding,
+    }
+    write_results(args.output, "load", parameters, results)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
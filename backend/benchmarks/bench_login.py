@@ -0,0 +1,101 @@
+"""
+Logins per second with bcrypt inline in the request thread versus offloaded
+to the bounded password pool, and the cost of registration with and without
+the redundant verify.
+
+    python -m backend.benchmarks.bench_login --rounds 12 --clients 16 --logins 64
+"""
+import argparse
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from fastapi import HTTPException
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from backend.core import security
+from backend.core.database import Base
+from backend.core.password_pool import PasswordWorkerPool
+from backend.repositories.auth_repository import AuthRepository
+from backend.schemas.auth_schema import UserCreate, UserLogin
+from backend.services.auth_service import AuthService
+import backend.models  # noqa: F401 - ensure models are imported for metadata
+
+PASSWORD = "benchmark-password"
+
+
+def _session_factory():
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(bind=engine)
+    return sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+def _logins_per_second(session_factory, email: str, clients: int, logins: int) -> dict:
+    rejected = 0
+
+    def login(_):
+        nonlocal rejected
+        db = session_factory()
+        try:
+            AuthService(AuthRepository(db)).login(UserLogin(email=email, password=PASSWORD))
+        except HTTPException as exc:
+            if exc.status_code != 429:
+                raise
+            rejected += 1
+        finally:
+            db.close()
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=clients) as callers:
+        list(callers.map(login, range(logins)))
+    elapsed = time.perf_counter() - start
+    return {"logins_per_second": round((logins - rejected) / elapsed, 2), "rejected": rejected}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rounds", type=int, default=12)
+    parser.add_argument("--clients", type=int, default=16)
+    parser.add_argument("--logins", type=int, default=64)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--queue-size", type=int, default=64)
+    args = parser.parse_args()
+
+    security.get_pwd_context().update(bcrypt__rounds=args.rounds)
+    session_factory = _session_factory()
+    db = session_factory()
+    service = AuthService(AuthRepository(db))
+    email = "bench@example.com"
+    service.register_user(UserCreate(email=email, password=PASSWORD))
+
+    inline = PasswordWorkerPool(max_workers=args.clients, queue_size=0)
+    pooled = PasswordWorkerPool(max_workers=args.workers, queue_size=args.queue_size)
+    results = {}
+    for label, pool in (("inline", inline), ("pooled", pooled)):
+        original = security.get_password_pool
+        security.get_password_pool = lambda pool=pool: pool
+        try:
+            results[label] = _logins_per_second(session_factory, email, args.clients, args.logins)
+        finally:
+            security.get_password_pool = original
+            pool.shutdown()
+
+    start = time.perf_counter()
+    user = service.register_user(UserCreate(email="register-old@example.com", password=PASSWORD))
+    service.login(UserLogin(email=user.email, password=PASSWORD))
+    register_with_verify = time.perf_counter() - start
+    start = time.perf_counter()
+    user = service.register_user(UserCreate(email="register-new@example.com", password=PASSWORD))
+    service.issue_tokens(user)
+    register_direct = time.perf_counter() - start
+    db.close()
+
+    print(f"bcrypt rounds={args.rounds} clients={args.clients} logins={args.logins}")
+    for label, result in results.items():
+        print(f"  {label:<8} {result['logins_per_second']:>8} logins/s  rejected={result['rejected']}")
+    print(f"  register+login: {register_with_verify * 1000:.1f} ms   register+issue: {register_direct * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
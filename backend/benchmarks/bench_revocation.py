@@ -0,0 +1,109 @@
+"""
+Per-request cost of token revocation checks, and the time to build the
+revocation filter at startup, against `--revoked` revocations in a fresh
+SQLite database.
+
+    python -m backend.benchmarks.bench_revocation --revoked 100000 --output revocation.json
+
+`auth.current_user_cached` is the cached access-token path with no
+revocation check (the cost before rotation), `+filter` adds the Bloom
+filter check and `+database` the exact lookup it replaces.
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+from sqlalchemy import insert
+from sqlalchemy.orm import sessionmaker
+
+from backend.benchmarks.results import measure, summarize, write_results
+from backend.core import security
+from backend.core.database import create_engine_from_config
+from backend.models.revoked_token import RevokedToken
+from backend.models.schema import create_schema
+from backend.repositories.auth_repository import AuthRepository
+from backend.schemas.auth_schema import UserCreate, UserLogin
+from backend.services.auth_cache import AuthTokenCache
+from backend.services.auth_service import AuthService
+from backend.services.token_revocation import TokenRevocationList
+
+PASSWORD = "benchmark-password"
+
+
+def _fill(db, revoked: int, batch_size: int = 10000) -> None:
+    expires_at = datetime.utcnow() + timedelta(days=7)
+    for start in range(0, revoked, batch_size):
+        db.execute(
+            insert(RevokedToken),
+            [{"token_id": f"revoked-{i}", "expires_at": expires_at} for i in range(start, min(revoked, start + batch_size))],
+        )
+    db.commit()
+
+
+class _UncheckedService(AuthService):
+    # The cached path as it was before revocation checks.
+    def _is_revoked(self, token_id):
+        return False
+
+
+def benchmarks(db, revoked: int, iterations: int, rebuilds: int) -> dict:
+    repository = AuthRepository(db)
+    AuthService(repository).register_user(UserCreate(email="revocation@example.com", password=PASSWORD))
+    tokens = AuthService(repository).login(UserLogin(email="revocation@example.com", password=PASSWORD))
+    _fill(db, revoked)
+
+    def rebuild():
+        revocations = TokenRevocationList(capacity=revoked)
+        revocations.sync(repository)
+        return revocations
+
+    revocations = rebuild()
+    services = {
+        "auth.current_user_cached": _UncheckedService(repository, token_cache=AuthTokenCache()),
+        "auth.current_user_cached+filter": AuthService(repository, token_cache=AuthTokenCache(), revocations=revocations),
+        "auth.current_user_cached+database": AuthService(repository, token_cache=AuthTokenCache()),
+    }
+    results = {}
+    for name, service in services.items():
+        results[name] = measure(lambda: service.get_current_user(tokens.access_token, tokens.csrf_token), iterations)
+    results["revocation.filter_check"] = measure(lambda: "not-revoked" in revocations, iterations)
+
+    samples = []
+    for _ in range(rebuilds):
+        start = time.perf_counter()
+        rebuild()
+        samples.append(time.perf_counter() - start)
+    results["revocation.startup_rebuild"] = summarize(samples)
+    return results
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--revoked", type=int, default=100000)
+    parser.add_argument("--iterations", type=int, default=5000)
+    parser.add_argument("--rebuilds", type=int, default=5)
+    parser.add_argument("--bcrypt-rounds", type=int, default=4)
+    parser.add_argument("--output", help="write results as JSON to this path")
+    args = parser.parse_args(argv)
+
+    security.get_pwd_context().update(bcrypt__rounds=args.bcrypt_rounds)
+    with tempfile.TemporaryDirectory() as directory:
+        db_engine = create_engine_from_config(f"sqlite:///{os.path.join(directory, 'revocation.db')}")
+        create_schema(db_engine)
+        db = sessionmaker(bind=db_engine)()
+        try:
+            results = benchmarks(db, args.revoked, args.iterations, args.rebuilds)
+        finally:
+            db.close()
+            db_engine.dispose()
+
+    parameters = {"revoked": args.revoked, "iterations": args.iterations, "rebuilds": args.rebuilds}
+    write_results(args.output, "revocation", parameters, results)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
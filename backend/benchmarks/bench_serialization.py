@@ -0,0 +1,67 @@
+"""
+Cost of turning article payloads into response bytes, per 1k articles:
+
+  response_model  validate against the response model, then encode with
+                  jsonable_encoder + json.dumps (FastAPI's default path)
+  dumps           core.serialization.dumps over the service's models
+  cached bytes    joining per-article bytes already held by ArticleCache
+
+    python -m backend.benchmarks.bench_serialization --articles 1000 --content-size 2000
+"""
+import argparse
+import json
+import time
+from typing import List
+
+from fastapi.encoders import jsonable_encoder
+from pydantic import TypeAdapter
+
+from backend.core import serialization
+from backend.schemas.article import ArticleResponse
+
+
+def _articles(count: int, content_size: int) -> List[ArticleResponse]:
+    body = ("Lorem ipsum dolor sit amet, café ünïcode. " * (content_size // 40 + 1))[:content_size]
+    return [ArticleResponse(id=i, title=f"Article {i}", content=body) for i in range(1, count + 1)]
+
+
+def _best_of(repeat: int, func) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--articles", type=int, default=1000)
+    parser.add_argument("--content-size", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    articles = _articles(args.articles, args.content_size)
+    adapter = TypeAdapter(List[ArticleResponse])
+    cached = [serialization.dumps(article) for article in articles]
+
+    def response_model():
+        validated = adapter.validate_python(articles, from_attributes=True)
+        return json.dumps(jsonable_encoder(validated), ensure_ascii=False, separators=(",", ":")).encode()
+
+    def dumps():
+        return serialization.dumps(articles)
+
+    def cached_bytes():
+        return b"[" + b",".join(cached) + b"]"
+
+    assert json.loads(response_model()) == json.loads(dumps()) == json.loads(cached_bytes())
+    encoder = "orjson" if serialization.orjson is not None else "json"
+    per_1k = 1000 / args.articles
+    print(f"articles={args.articles} content_size={args.content_size} encoder={encoder}")
+    for label, func in (("response_model", response_model), ("dumps", dumps), ("cached bytes", cached_bytes)):
+        print(f"  {label:<15} {_best_of(args.repeat, func) * per_1k * 1000:>8.2f} ms per 1k articles")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""
+Cold-start cost of the API: each run is a fresh interpreter that imports
+`backend.main`, runs its lifespan (migrations, optional seeding) and serves
+a first request (registering a user, which loads bcrypt and JWT signing).
+
+    python -m backend.benchmarks.bench_startup --runs 10 --output startup.json
+
+"fresh" runs start from an empty database; "existing" runs reuse one that
+is already migrated and seeded, as a restarted or additional worker would.
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Dict, List
+
+from backend.benchmarks.results import summarize, write_results
+
+PHASES = ("import", "lifespan", "first_request")
+
+
+def child() -> None:
+    """Runs inside the spawned interpreter; prints phase timings in seconds as JSON."""
+    start = time.perf_counter()
+    from backend.main import app
+
+    import_seconds = time.perf_counter() - start
+    # The test client is harness, not app: keep its import out of the phases.
+    from fastapi.testclient import TestClient
+
+    start = time.perf_counter()
+    with TestClient(app) as client:
+        lifespan_seconds = time.perf_counter() - start
+        start = time.perf_counter()
+        response = client.post("/api/auth/register", json={"email": "start@example.com", "password": "startup-pw"})
+        request_seconds = time.perf_counter() - start
+    response.raise_for_status()
+    print(json.dumps({"import": import_seconds, "lifespan": lifespan_seconds, "first_request": request_seconds}))
+
+
+def spawn(database_url: str, seed: bool, bcrypt_rounds: int) -> Dict[str, float]:
+    env = {
+        **os.environ,
+        "DATABASE_URL": database_url,
+        "SEED_ON_STARTUP": "true" if seed else "false",
+        "BCRYPT_ROUNDS": str(bcrypt_rounds),
+    }
+    start = time.perf_counter()
+    output = subprocess.run(
+        [sys.executable, "-m", "backend.benchmarks.bench_startup", "--child"],
+        env=env, capture_output=True, text=True, check=True,
+    ).stdout
+    timings = json.loads(output.strip().splitlines()[-1])
+    timings["process"] = time.perf_counter() - start
+    return timings
+
+
+def run(runs: int, seed: bool, bcrypt_rounds: int) -> dict:
+    samples: Dict[str, Dict[str, List[float]]] = {"fresh": {}, "existing": {}}
+    with tempfile.TemporaryDirectory() as directory:
+        existing_url = f"sqlite:///{os.path.join(directory, 'existing.db')}"
+        spawn(existing_url, seed, bcrypt_rounds)
+        for index in range(runs):
+            fresh_url = f"sqlite:///{os.path.join(directory, f'fresh-{index}.db')}"
+            for scenario, url in (("fresh", fresh_url), ("existing", existing_url)):
+                if scenario == "existing":
+                    # The user from the previous run would make registering fail.
+                    _delete_user(url)
+                for phase, seconds in spawn(url, seed, bcrypt_rounds).items():
+                    samples[scenario].setdefault(phase, []).append(seconds)
+    return {
+        f"startup.{scenario}.{phase}": summarize(values)
+        for scenario, phases in samples.items()
+        for phase, values in phases.items()
+    }
+
+
+def _delete_user(database_url: str) -> None:
+    from sqlalchemy import create_engine, text
+
+    db_engine = create_engine(database_url)
+    with db_engine.begin() as connection:
+        connection.execute(text("DELETE FROM users"))
+    db_engine.dispose()
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--seed", action="store_true", help="run with SEED_ON_STARTUP=true")
+    parser.add_argument("--bcrypt-rounds", type=int, default=4)
+    parser.add_argument("--output", help="write results as JSON to this path")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.child:
+        child()
+        return 0
+    results = run(args.runs, args.seed, args.bcrypt_rounds)
+    parameters = {"runs": args.runs, "seed": args.seed, "bcrypt_rounds": args.bcrypt_rounds}
+    write_results(args.output, "startup", parameters, results)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
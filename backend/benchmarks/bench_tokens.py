@@ -0,0 +1,90 @@
+"""
+Issue and verify cost of access tokens per signing algorithm, through the
+key ring used by the API. python-jose, which the API used before, is
+measured alongside for HS256 and ES256 when it is installed.
+
+    python -m backend.benchmarks.bench_tokens --iterations 5000 --output tokens.json
+"""
+import argparse
+import sys
+import time
+
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ec, ed25519
+
+from backend.benchmarks.results import measure, write_results
+from backend.core.tokens import KeyRing, asymmetric_key, hmac_key
+
+SECRET = b"benchmark-secret-benchmark-secret"
+
+
+def _private_pem(private_key) -> str:
+    return private_key.private_bytes(
+        serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8, serialization.NoEncryption()
+    ).decode()
+
+
+def claims() -> dict:
+    now = int(time.time())
+    return {"sub": "42", "iat": now, "exp": now + 3600, "type": "access", "csrf": "x" * 22}
+
+
+def _with_rps(result: dict) -> dict:
+    # Operations per second, under the key results.compare checks for throughput.
+    result["rps"] = round(1000 / result["mean_ms"], 1) if result["mean_ms"] else 0.0
+    return result
+
+
+def key_ring_benchmarks(iterations: int) -> dict:
+    keys = {
+        "HS256": hmac_key("hs", "HS256", SECRET),
+        "ES256": asymmetric_key("es", "ES256", _private_pem(ec.generate_private_key(ec.SECP256R1())), None),
+        "EdDSA": asymmetric_key("ed", "EdDSA", _private_pem(ed25519.Ed25519PrivateKey.generate()), None),
+    }
+    results = {}
+    for alg, key in keys.items():
+        ring = KeyRing([key], active=key.kid)
+        token = ring.encode(claims())
+        results[f"keyring.{alg}.issue"] = _with_rps(measure(lambda: ring.encode(claims()), iterations))
+        results[f"keyring.{alg}.verify"] = _with_rps(measure(lambda: ring.decode(token), iterations))
+    return results
+
+
+def jose_benchmarks(iterations: int) -> dict:
+    try:
+        from jose import jwt
+    except ImportError:
+        print("python-jose not installed; skipping the baseline", file=sys.stderr)
+        return {}
+    es_pem = _private_pem(ec.generate_private_key(ec.SECP256R1()))
+    es_public = (
+        serialization.load_pem_private_key(es_pem.encode(), None)
+        .public_key()
+        .public_bytes(serialization.Encoding.PEM, serialization.PublicFormat.SubjectPublicKeyInfo)
+        .decode()
+    )
+    results = {}
+    for alg, signing_key, verifying_key in (("HS256", SECRET, SECRET), ("ES256", es_pem, es_public)):
+        token = jwt.encode(claims(), signing_key, algorithm=alg)
+        results[f"jose.{alg}.issue"] = _with_rps(
+            measure(lambda: jwt.encode(claims(), signing_key, algorithm=alg), iterations)
+        )
+        results[f"jose.{alg}.verify"] = _with_rps(
+            measure(lambda: jwt.decode(token, verifying_key, algorithms=[alg]), iterations)
+        )
+    return results
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=5000)
+    parser.add_argument("--output", help="write results as JSON to this path")
+    args = parser.parse_args(argv)
+
+    results = {**key_ring_benchmarks(args.iterations), **jose_benchmarks(args.iterations)}
+    write_results(args.output, "tokens", {"iterations": args.iterations}, results)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,91 @@
+"""
+Fill a database with deterministic synthetic articles for benchmarking.
+Row `n` always gets the same title and content, so databases generated on
+different machines or commits are comparable. An existing database is
+topped up to `--rows`.
+
+    python -m backend.benchmarks.datagen --database-url sqlite:///./bench-100k.db --rows 100000
+
+Typical sizes are 10k, 100k and 1M rows.
+"""
+import argparse
+import random
+import sys
+import time
+from itertools import accumulate
+from typing import Dict, Iterator, List
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import sessionmaker
+
+from backend.core.database import create_engine_from_config
+from backend.models.article import Article
+from backend.models.schema import create_schema
+from backend.repositories.article_repository import ArticleRepository
+
+VOCABULARY_SIZE = 5000
+_SYLLABLES = ("ka", "lo", "mi", "ne", "ru", "sa", "ti", "vo", "ze", "qu", "bra", "cen", "dor", "fel", "gri")
+
+
+def vocabulary(size: int = VOCABULARY_SIZE) -> List[str]:
+    """Pronounceable pseudo-words; rank 0 is the most frequent once Zipf-weighted."""
+    rng = random.Random(0)
+    words = set()
+    while len(words) < size:
+        words.add("".join(rng.choice(_SYLLABLES) for _ in range(rng.randint(2, 4))))
+    return sorted(words, key=lambda word: (len(word), word))
+
+
+def article_rows(start: int, count: int, min_words: int = 40, max_words: int = 160) -> Iterator[Dict[str, str]]:
+    """Rows `start` .. `start + count - 1`, each seeded by its own number."""
+    words = vocabulary()
+    cum_weights = list(accumulate(1 / rank for rank in range(1, len(words) + 1)))
+    for number in range(start, start + count):
+        rng = random.Random(number)
+        title = " ".join(rng.choices(words, cum_weights=cum_weights, k=rng.randint(3, 8))).capitalize()
+        content = " ".join(rng.choices(words, cum_weights=cum_weights, k=rng.randint(min_words, max_words)))
+        yield {"title": title, "content": content}
+
+
+def generate(database_url: str, rows: int, batch_size: int = 10_000, min_words: int = 40, max_words: int = 160) -> int:
+    """Top the articles table up to `rows` rows; returns how many were inserted."""
+    db_engine = create_engine_from_config(database_url)
+    create_schema(db_engine)
+    db = sessionmaker(bind=db_engine)()
+    try:
+        existing = db.execute(select(func.count(Article.id))).scalar()
+        repository = ArticleRepository(db)
+        inserted = 0
+        started = time.perf_counter()
+        batch = []
+        for row in article_rows(existing + 1, max(0, rows - existing), min_words, max_words):
+            batch.append(row)
+            if len(batch) >= batch_size:
+                inserted += repository.bulk_create_articles(batch)
+                batch = []
+                rate = inserted / (time.perf_counter() - started)
+                print(f"\r{existing + inserted:,} rows ({rate:,.0f} rows/s)", end="", file=sys.stderr, flush=True)
+        inserted += repository.bulk_create_articles(batch)
+        print(file=sys.stderr)
+        return inserted
+    finally:
+        db.close()
+        db_engine.dispose()
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--database-url", default="sqlite:///./bench.db")
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--batch-size", type=int, default=10_000)
+    parser.add_argument("--min-words", type=int, default=40)
+    parser.add_argument("--max-words", type=int, default=160)
+    args = parser.parse_args(argv)
+
+    inserted = generate(args.database_url, args.rows, args.batch_size, args.min_words, args.max_words)
+    print(f"inserted {inserted:,} articles into {args.database_url}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,129 @@
+"""
+Timing summaries and JSON result files shared by the benchmark scripts, plus
+a comparison of two result files:
+
+    python -m backend.benchmarks.results before.json after.json --threshold 0.15
+
+exits with status 1 when any p50/p99 got slower, or any throughput dropped,
+by more than the threshold.
+"""
+import argparse
+import json
+import math
+import os
+import platform
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from typing import Callable, Dict, List
+
+import sqlalchemy
+
+# Metrics compared between runs; True when bigger is better.
+COMPARED_METRICS = {"p50_ms": False, "p99_ms": False, "rps": True}
+
+
+def percentile(sorted_samples: List[float], q: float) -> float:
+    """Nearest-rank percentile of already sorted samples."""
+    if not sorted_samples:
+        return 0.0
+    rank = max(1, math.ceil(q / 100 * len(sorted_samples)))
+    return sorted_samples[rank - 1]
+
+
+def summarize(samples: List[float]) -> Dict[str, float]:
+    """Latency summary in milliseconds of samples given in seconds."""
+    ordered = sorted(samples)
+    return {
+        "count": len(ordered),
+        "mean_ms": round(sum(ordered) / len(ordered) * 1000, 4) if ordered else 0.0,
+        "p50_ms": round(percentile(ordered, 50) * 1000, 4),
+        "p99_ms": round(percentile(ordered, 99) * 1000, 4),
+        "max_ms": round(ordered[-1] * 1000, 4) if ordered else 0.0,
+    }
+
+
+def measure(func: Callable[[], object], iterations: int, warmup: int = 5) -> Dict[str, float]:
+    """Call `func` `iterations` times after a warmup and summarize per-call latency."""
+    for _ in range(warmup):
+        func()
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - start)
+    return summarize(samples)
+
+
+def _git_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def environment() -> Dict[str, object]:
+    return {
+        "commit": _git_commit(),
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "sqlalchemy": sqlalchemy.__version__,
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+    }
+
+
+def write_results(path: str | None, suite: str, parameters: Dict[str, object], results: Dict[str, dict]) -> dict:
+    """Print a summary table and, when `path` is given, save the run as JSON."""
+    document = {"suite": suite, "environment": environment(), "parameters": parameters, "results": results}
+    print(f"{suite} {json.dumps(parameters)}")
+    for name, result in results.items():
+        rps = f"  {result['rps']:>9.1f} rps" if "rps" in result else ""
+        print(f"  {name:<28} p50 {result['p50_ms']:>9.3f} ms  p99 {result['p99_ms']:>9.3f} ms{rps}")
+    if path:
+        with open(path, "w", encoding="utf-8") as output:
+            json.dump(document, output, indent=2)
+            output.write("\n")
+    return document
+
+
+def compare(before: dict, after: dict, threshold: float) -> List[str]:
+    """Regressions beyond `threshold` (a fraction) for every result present in both runs."""
+    regressions = []
+    for name, old in before["results"].items():
+        new = after["results"].get(name)
+        if new is None:
+            continue
+        for metric, higher_is_better in COMPARED_METRICS.items():
+            if metric not in old or metric not in new or not old[metric]:
+                continue
+            change = (new[metric] - old[metric]) / old[metric]
+            if (-change if higher_is_better else change) > threshold:
+                regressions.append(f"{name} {metric}: {old[metric]} -> {new[metric]} ({change:+.1%})")
+    return regressions
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("before")
+    parser.add_argument("after")
+    parser.add_argument("--threshold", type=float, default=0.15)
+    args = parser.parse_args(argv)
+
+    with open(args.before, encoding="utf-8") as before, open(args.after, encoding="utf-8") as after:
+        before_run, after_run = json.load(before), json.load(after)
+    if before_run.get("parameters") != after_run.get("parameters"):
+        print("warning: the runs used different parameters", file=sys.stderr)
+    regressions = compare(before_run, after_run, args.threshold)
+    for line in regressions:
+        print(f"REGRESSION {line}")
+    if not regressions:
+        print(f"no regressions beyond {args.threshold:.0%}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
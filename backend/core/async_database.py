@@ -0,0 +1,53 @@
+from functools import lru_cache
+
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+
+from backend.core.config import Config
+from backend.core.database import engine_options, install_sqlite_pragmas, sqlite_pragmas
+from backend.core.metrics import install_query_metrics
+
+# Async driver used for each sync dialect in DATABASE_URL.
+ASYNC_DRIVERS = {
+    "sqlite": "sqlite+aiosqlite",
+    "postgresql": "postgresql+asyncpg",
+}
+
+
+def to_async_url(url: str) -> str:
+    scheme, separator, rest = url.partition("://")
+    dialect = scheme.split("+", 1)[0]
+    return f"{ASYNC_DRIVERS.get(dialect, scheme)}{separator}{rest}"
+
+
+def _create_async_engine(url: str, read_only: bool = False) -> AsyncEngine:
+    engine = create_async_engine(url, **engine_options(url))
+    if engine.dialect.name == "sqlite":
+        install_sqlite_pragmas(engine.sync_engine, sqlite_pragmas(url, read_only=read_only))
+    if Config.METRICS_ENABLED:
+        install_query_metrics(engine.sync_engine)
+    return engine
+
+
+@lru_cache(maxsize=None)
+def get_async_sessionmaker() -> async_sessionmaker[AsyncSession]:
+    url = Config.ASYNC_DATABASE_URL or to_async_url(Config.DATABASE_URL)
+    return async_sessionmaker(_create_async_engine(url), autoflush=False, expire_on_commit=False)
+
+
+@lru_cache(maxsize=None)
+def get_async_read_sessionmaker() -> async_sessionmaker[AsyncSession]:
+    """Sessions for GET routes: on DATABASE_REPLICA_URL when set, as get_read_db, else the primary."""
+    if not Config.DATABASE_REPLICA_URL:
+        return get_async_sessionmaker()
+    engine = _create_async_engine(to_async_url(Config.DATABASE_REPLICA_URL), read_only=True)
+    return async_sessionmaker(engine, autoflush=False, expire_on_commit=False)
+
+
+async def get_async_db():
+    async with get_async_sessionmaker()() as db:
+        yield db
+
+
+async def get_async_read_db():
+    async with get_async_read_sessionmaker()() as db:
+        yield db
@@ -0,0 +1,47 @@
+import hashlib
+import math
+
+_LOW_64 = (1 << 64) - 1
+
+
+class BloomFilter:
+    """
+    Set membership with false positives but no false negatives, in about
+    1.2 bytes per item at a 0.1% error rate. `error_rate` holds while at
+    most `capacity` items have been added; past that it degrades, so owners
+    rebuild into a larger filter (see `full`).
+    """
+
+    def __init__(self, capacity: int, error_rate: float = 0.001):
+        self.capacity = max(1, capacity)
+        self.error_rate = error_rate
+        self.size = max(8, math.ceil(-self.capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hashes = max(1, round(self.size / self.capacity * math.log(2)))
+        self.count = 0
+        self._bits = bytearray((self.size + 7) // 8)
+
+    def _hashes(self, item: str):
+        # Double hashing: the k positions come from the two halves of one digest.
+        digest = int.from_bytes(hashlib.blake2b(item.encode(), digest_size=16).digest(), "little")
+        return digest & _LOW_64, (digest >> 64) | 1
+
+    def add(self, item: str) -> None:
+        first, second = self._hashes(item)
+        bits, size = self._bits, self.size
+        for i in range(self.hashes):
+            position = (first + i * second) % size
+            bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, item: str) -> bool:
+        first, second = self._hashes(item)
+        bits, size = self._bits, self.size
+        for i in range(self.hashes):
+            position = (first + i * second) % size
+            if not bits[position >> 3] & (1 << (position & 7)):
+                return False
+        return True
+
+    @property
+    def full(self) -> bool:
+        return self.count > self.capacity
@@ -0,0 +1,133 @@
+"""
+Compression of stored article bodies.
+
+New bodies are written with ARTICLE_BODY_CODEC ("zstd", "zlib" or "plain")
+and every row records the codec that wrote it, so changing the setting
+never requires rewriting old rows. zstd can also use a dictionary trained
+on existing articles (`python -m backend.train_body_dictionary`): articles
+share most of their vocabulary, which a dictionary lets each body refer to
+instead of spelling it out, and that matters most for short bodies.
+Dictionaries are stored in the database by id, and each row records the
+dictionary it was compressed with.
+"""
+import threading
+import zlib
+from functools import lru_cache
+from typing import Dict, Iterable, List, Set, Tuple
+
+from backend.core.config import Config
+
+try:
+    import zstandard
+except ImportError:  # optional: bodies fall back to zlib
+    zstandard = None
+
+PLAIN = "plain"
+ZLIB = "zlib"
+ZSTD = "zstd"
+
+# zstd gains little from higher levels on article-sized inputs, least of
+# all with a dictionary, and levels above ~10 cost 10-50x the time per write.
+DEFAULT_LEVELS = {ZLIB: 6, ZSTD: 3}
+
+# (codec, dictionary id, stored bytes) of one body.
+EncodedBody = Tuple[str, int | None, bytes]
+
+
+class MissingDictionary(LookupError):
+    """A body was compressed with a dictionary this process has not loaded yet."""
+
+    def __init__(self, dictionary_id: int):
+        super().__init__(f"compression dictionary {dictionary_id} is not loaded")
+        self.dictionary_id = dictionary_id
+
+
+class BodyCodec:
+    """
+    Encodes bodies for storage and decodes them with whatever wrote them.
+    Dictionaries are registered with `add_dictionary` (repositories load
+    them on demand); `active_dictionary` is the one new bodies use.
+    """
+
+    def __init__(self, codec: str = ZSTD, level: int | None = None):
+        if codec == ZSTD and zstandard is None:
+            codec = ZLIB
+        if codec not in (PLAIN, ZLIB, ZSTD):
+            raise ValueError(f"unknown article body codec {codec}")
+        self.codec = codec
+        self.level = level if level is not None else DEFAULT_LEVELS.get(codec, 0)
+        self.active_dictionary: int | None = None
+        self._dictionaries: Dict[int, "zstandard.ZstdCompressionDict"] = {}
+        # zstd (de)compressors must not be shared between threads.
+        self._local = threading.local()
+
+    def encode(self, text: str) -> EncodedBody:
+        data = text.encode()
+        dictionary_id = None
+        if self.codec == ZLIB:
+            compressed = zlib.compress(data, self.level)
+        elif self.codec == ZSTD:
+            dictionary_id = self.active_dictionary
+            compressed = self._zstd("compressors", dictionary_id).compress(data)
+        else:
+            return PLAIN, None, data
+        if len(compressed) >= len(data):
+            return PLAIN, None, data
+        return self.codec, dictionary_id, compressed
+
+    def decode(self, codec: str, dictionary_id: int | None, data: bytes) -> str:
+        if codec == PLAIN:
+            return data.decode()
+        if codec == ZLIB:
+            return zlib.decompress(data).decode()
+        if codec == ZSTD:
+            if zstandard is None:
+                raise RuntimeError("zstd-compressed article bodies need the zstandard package")
+            return self._zstd("decompressors", dictionary_id).decompress(data).decode()
+        raise ValueError(f"unknown article body codec {codec}")
+
+    def add_dictionary(self, dictionary_id: int, data: bytes, activate: bool = False) -> None:
+        if zstandard is None:
+            return
+        dictionary = zstandard.ZstdCompressionDict(data)
+        if self.codec == ZSTD:
+            dictionary.precompute_compress(level=self.level)
+        self._dictionaries[dictionary_id] = dictionary
+        if activate:
+            self.active_dictionary = dictionary_id
+
+    def missing_dictionaries(self, dictionary_ids: Iterable[int | None]) -> Set[int]:
+        """Ids among `dictionary_ids` that must be loaded before their bodies can be decoded."""
+        wanted = {dictionary_id for dictionary_id in dictionary_ids if dictionary_id is not None}
+        return wanted - self._dictionaries.keys()
+
+    def _zstd(self, kind: str, dictionary_id: int | None):
+        cache = getattr(self._local, kind, None)
+        if cache is None:
+            cache = {}
+            setattr(self._local, kind, cache)
+        instance = cache.get(dictionary_id)
+        if instance is None:
+            dictionary = None
+            if dictionary_id is not None:
+                dictionary = self._dictionaries.get(dictionary_id)
+                if dictionary is None:
+                    raise MissingDictionary(dictionary_id)
+            if kind == "compressors":
+                instance = zstandard.ZstdCompressor(level=self.level, dict_data=dictionary)
+            else:
+                instance = zstandard.ZstdDecompressor(dict_data=dictionary)
+            cache[dictionary_id] = instance
+        return instance
+
+
+def train_dictionary(samples: List[bytes], size: int) -> bytes:
+    """A zstd dictionary of at most `size` bytes trained on `samples`."""
+    if zstandard is None:
+        raise RuntimeError("training a dictionary needs the zstandard package")
+    return zstandard.train_dictionary(size, samples).as_bytes()
+
+
+@lru_cache(maxsize=None)
+def get_body_codec() -> BodyCodec:
+    return BodyCodec(Config.ARTICLE_BODY_CODEC, Config.ARTICLE_BODY_LEVEL)
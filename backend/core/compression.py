@@ -0,0 +1,207 @@
+import zlib
+from functools import lru_cache
+from typing import Callable, Dict, Iterable, Tuple
+
+from starlette.datastructures import Headers, MutableHeaders
+
+from backend.core.config import Config
+
+try:
+    import brotli
+except ImportError:  # optional: no "br" without it
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # optional: no "zstd" without it
+    zstandard = None
+
+# Content types worth compressing; everything else (images, archives) already is.
+COMPRESSIBLE_TYPES = ("text/", "application/json", "application/x-ndjson", "application/javascript")
+
+
+class _StreamCompressor:
+    __slots__ = ("_compress", "_finish")
+
+    def __init__(self, compress: Callable[[bytes], bytes], finish: Callable[[], bytes]):
+        self._compress = compress
+        self._finish = finish
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compress(data)
+
+    def finish(self) -> bytes:
+        return self._finish()
+
+
+def _gzip(level: int, size: int = -1) -> _StreamCompressor:
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 31)  # wbits 31: gzip container
+    return _StreamCompressor(compressor.compress, compressor.flush)
+
+
+def _brotli(level: int, size: int = -1) -> _StreamCompressor:
+    compressor = brotli.Compressor(quality=level)
+    return _StreamCompressor(compressor.process, compressor.finish)
+
+
+def _zstd(level: int, size: int = -1) -> _StreamCompressor:
+    # Knowing the size up front lets zstd size its window to the input,
+    # which at high levels is most of the cost of compressing a short body.
+    compressor = zstandard.ZstdCompressor(level=level).compressobj(size=size)
+    return _StreamCompressor(compressor.compress, compressor.flush)
+
+
+# Encoding -> (compressor factory, level for responses, level for stored copies).
+# Responses favour speed; stored copies are compressed once, so they favour size
+# (br stops at 10: 11 costs three times as much for no gain on article bodies).
+CODECS: Dict[str, Tuple[Callable[[int, int], _StreamCompressor], int, int]] = {"gzip": (_gzip, 6, 9)}
+if brotli is not None:
+    CODECS["br"] = (_brotli, 4, 10)
+if zstandard is not None:
+    CODECS["zstd"] = (_zstd, 3, 19)
+
+
+def available_encodings(names: Iterable[str]) -> Tuple[str, ...]:
+    """`names` in order, minus those whose library is not installed."""
+    return tuple(name.strip() for name in names if name.strip() in CODECS)
+
+
+def compress(data: bytes, encoding: str, stored: bool = False) -> bytes:
+    factory, response_level, stored_level = CODECS[encoding]
+    compressor = factory(stored_level if stored else response_level, len(data))
+    return compressor.compress(data) + compressor.finish()
+
+
+@lru_cache(maxsize=None)
+def get_response_encodings() -> Tuple[str, ...]:
+    """Encodings responses may use, in preference order; empty when compression is off."""
+    return available_encodings(Config.COMPRESSION_ENCODINGS) if Config.COMPRESSION_ENABLED else ()
+
+
+@lru_cache(maxsize=256)
+def negotiate(accept_encoding: str | None, encodings: Tuple[str, ...]) -> str | None:
+    """
+    The encoding to answer `Accept-Encoding` with, from `encodings` (in
+    server preference order), or None for identity. Clients send a handful
+    of distinct headers, so results are cached.
+    """
+    if not accept_encoding:
+        return None
+    weights: Dict[str, float] = {}
+    for item in accept_encoding.split(","):
+        name, _, params = item.partition(";")
+        weight = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                weight = float(params[2:])
+            except ValueError:
+                weight = 0.0
+        weights[name.strip().lower()] = weight
+    best, best_weight = None, 0.0
+    for encoding in encodings:
+        weight = weights.get(encoding, weights.get("*", 0.0))
+        if weight > best_weight:
+            best, best_weight = encoding, weight
+    return best
+
+
+def mark_encoded(headers: MutableHeaders, encoding: str) -> None:
+    """Headers of a representation encoded with `encoding`."""
+    headers["Content-Encoding"] = encoding
+    headers.add_vary_header("Accept-Encoding")
+    etag = headers.get("etag")
+    # The bytes differ from the identity representation, so a strong ETag
+    # would be wrong; weak ETags still satisfy If-None-Match.
+    if etag and not etag.startswith("W/"):
+        headers["ETag"] = f"W/{etag}"
+
+
+def _compressible(headers: Headers) -> bool:
+    content_type = headers.get("content-type", "")
+    return content_type.startswith(COMPRESSIBLE_TYPES) and "no-transform" not in headers.get("cache-control", "")
+
+
+class CompressionMiddleware:
+    """
+    Pure ASGI middleware compressing responses with the best encoding the
+    client accepts. Bodies below `minimum_size` are left alone, as are
+    responses that already carry a Content-Encoding (precompressed
+    articles). Streaming responses are compressed chunk by chunk.
+    """
+
+    def __init__(self, app, minimum_size: int = 1000, encodings: Iterable[str] = ("zstd", "br", "gzip")):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.encodings = available_encodings(encodings)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] == "HEAD":
+            await self.app(scope, receive, send)
+            return
+        encoding = negotiate(Headers(scope=scope).get("accept-encoding"), self.encodings)
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+        await _CompressedResponder(self.app, encoding, self.minimum_size)(scope, receive, send)
+
+
+class _CompressedResponder:
+    def __init__(self, app, encoding: str, minimum_size: int):
+        self.app = app
+        self.encoding = encoding
+        self.minimum_size = minimum_size
+        self.send = None
+        self.start = None
+        self.compressor: _StreamCompressor | None = None
+        self.passthrough = False
+
+    async def __call__(self, scope, receive, send):
+        self.send = send
+        await self.app(scope, receive, self.send_compressed)
+
+    async def send_compressed(self, message):
+        if self.passthrough:
+            await self.send(message)
+            return
+        if message["type"] == "http.response.start":
+            self.start = message
+            return
+        if message["type"] != "http.response.body":
+            await self.send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+        if self.compressor is None:
+            headers = MutableHeaders(raw=self.start["headers"])
+            compressible = "content-encoding" not in headers and _compressible(headers)
+            if (
+                not compressible
+                or self.start["status"] in (204, 304)
+                or (not more_body and len(body) < self.minimum_size)
+            ):
+                if compressible:
+                    headers.add_vary_header("Accept-Encoding")
+                self.passthrough = True
+                await self.send(self.start)
+                await self.send(message)
+                return
+            factory, level, _ = CODECS[self.encoding]
+            self.compressor = factory(level, -1 if more_body else len(body))
+            mark_encoded(headers, self.encoding)
+            if more_body:
+                del headers["content-length"]
+            else:
+                body = self.compressor.compress(body) + self.compressor.finish()
+                headers["content-length"] = str(len(body))
+                await self.send(self.start)
+                await self.send({"type": "http.response.body", "body": body})
+                return
+            await self.send(self.start)
+
+        chunk = self.compressor.compress(body)
+        if not more_body:
+            chunk += self.compressor.finish()
+        if chunk or not more_body:
+            await self.send({"type": "http.response.body", "body": chunk, "more_body": more_body})
@@ -1,12 +1,105 @@
 import os
+import tempfile
+
+
+def _optional_int(name: str) -> int | None:
+    value = os.getenv(name)
+    return int(value) if value not in (None, "") else None
+
+
+def _optional_bool(name: str) -> bool | None:
+    value = os.getenv(name)
+    return value.lower() == "true" if value not in (None, "") else None
+
+
+def _default_password_workers() -> int:
+    return max(1, min(4, (os.cpu_count() or 1) // 2))
 
 
 class Config:
     # Default to SQLite for development; overridable via env
     DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./test.db")
     SQLALCHEMY_DATABASE_URI = DATABASE_URL
+    # Optional read replica for GET routes
+    DATABASE_REPLICA_URL = os.getenv("DATABASE_REPLICA_URL")
+    # Connection pool; unset values fall back to per-dialect defaults in core/database.py
+    DB_POOL_SIZE = _optional_int("DB_POOL_SIZE")
+    DB_MAX_OVERFLOW = _optional_int("DB_MAX_OVERFLOW")
+    DB_POOL_TIMEOUT = _optional_int("DB_POOL_TIMEOUT")
+    DB_POOL_RECYCLE = _optional_int("DB_POOL_RECYCLE")
+    DB_POOL_PRE_PING = _optional_bool("DB_POOL_PRE_PING")
+    # SQLite PRAGMAs applied to every new connection
+    SQLITE_JOURNAL_MODE = os.getenv("SQLITE_JOURNAL_MODE", "WAL")
+    SQLITE_SYNCHRONOUS = os.getenv("SQLITE_SYNCHRONOUS", "NORMAL")
+    SQLITE_MMAP_SIZE = int(os.getenv("SQLITE_MMAP_SIZE", str(256 * 1024 * 1024)))
+    SQLITE_CACHE_SIZE = int(os.getenv("SQLITE_CACHE_SIZE", "-65536"))
+    SQLITE_BUSY_TIMEOUT_MS = int(os.getenv("SQLITE_BUSY_TIMEOUT_MS", "5000"))
+    # Async routes use DATABASE_URL with its async driver unless this is set
+    ASYNC_DATABASE_URL = os.getenv("ASYNC_DATABASE_URL")
+    ASYNC_ROUTES = os.getenv("ASYNC_ROUTES", "false").lower() == "true"
     SQLALCHEMY_TRACK_MODIFICATIONS = False
     SECRET_KEY = os.getenv("JWT_SECRET", "blogs-secret-key")
     JWT_ALGORITHM = os.getenv("JWT_ALGORITHM", "HS256")
+    # JSON key ring for signing/verifying tokens by `kid` (see core/tokens.py);
+    # without it, JWT_SECRET with JWT_ALGORITHM is the only key
+    JWT_KEYS_FILE = os.getenv("JWT_KEYS_FILE")
     ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "60"))
     REFRESH_TOKEN_EXPIRE_MINUTES = int(os.getenv("REFRESH_TOKEN_EXPIRE_MINUTES", str(60 * 24 * 7)))
+    ARTICLES_PAGE_DEFAULT_LIMIT = int(os.getenv("ARTICLES_PAGE_DEFAULT_LIMIT", "20"))
+    ARTICLES_PAGE_MAX_LIMIT = int(os.getenv("ARTICLES_PAGE_MAX_LIMIT", "100"))
+    ARTICLE_EXCERPT_LENGTH = int(os.getenv("ARTICLE_EXCERPT_LENGTH", "200"))
+    ARTICLES_BATCH_MAX_IDS = int(os.getenv("ARTICLES_BATCH_MAX_IDS", "100"))
+    # Compression of new article bodies: "zstd" (needs zstandard, else zlib), "zlib" or "plain"
+    ARTICLE_BODY_CODEC = os.getenv("ARTICLE_BODY_CODEC", "zstd")
+    ARTICLE_BODY_LEVEL = _optional_int("ARTICLE_BODY_LEVEL")
+    SEARCH_INDEX_ENABLED = os.getenv("SEARCH_INDEX_ENABLED", "false").lower() == "true"
+    SEARCH_CACHE_SIZE = int(os.getenv("SEARCH_CACHE_SIZE", "1024"))
+    SEARCH_CACHE_TTL_SECONDS = float(os.getenv("SEARCH_CACHE_TTL_SECONDS", "60"))
+    AUTH_TOKEN_CACHE_SIZE = int(os.getenv("AUTH_TOKEN_CACHE_SIZE", "10000"))
+    # Bloom filter over revoked refresh tokens and token families; 0 checks the database every time
+    TOKEN_REVOCATION_FILTER_CAPACITY = int(os.getenv("TOKEN_REVOCATION_FILTER_CAPACITY", "100000"))
+    TOKEN_REVOCATION_FILTER_ERROR_RATE = float(os.getenv("TOKEN_REVOCATION_FILTER_ERROR_RATE", "0.001"))
+    BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", "12"))
+    PASSWORD_POOL_KIND = os.getenv("PASSWORD_POOL_KIND", "thread")
+    PASSWORD_WORKERS = int(os.getenv("PASSWORD_WORKERS", str(_default_password_workers())))
+    PASSWORD_QUEUE_SIZE = int(os.getenv("PASSWORD_QUEUE_SIZE", "32"))
+    IMPORT_BATCH_SIZE = int(os.getenv("IMPORT_BATCH_SIZE", "5000"))
+    IMPORT_ERROR_DIR = os.getenv("IMPORT_ERROR_DIR", "./import_errors")
+    # Longer NDJSON lines in a bulk import are rejected without being buffered
+    IMPORT_MAX_LINE_BYTES = int(os.getenv("IMPORT_MAX_LINE_BYTES", str(1024 * 1024)))
+    # Authenticated responses: let clients keep a copy but revalidate it with If-None-Match
+    ARTICLE_CACHE_CONTROL = os.getenv("ARTICLE_CACHE_CONTROL", "private, no-cache")
+    # Read-through article cache: "memory", "redis" or "none"
+    ARTICLE_CACHE_BACKEND = os.getenv("ARTICLE_CACHE_BACKEND", "memory")
+    ARTICLE_CACHE_SIZE = int(os.getenv("ARTICLE_CACHE_SIZE", "10000"))
+    ARTICLE_CACHE_TTL_SECONDS = float(os.getenv("ARTICLE_CACHE_TTL_SECONDS", "300"))
+    ARTICLE_CACHE_REDIS_URL = os.getenv("ARTICLE_CACHE_REDIS_URL", "redis://localhost:6379/0")
+    # Run migrations (and seeding, if enabled) in the app's lifespan, one worker at a time
+    SEED_ON_STARTUP = os.getenv("SEED_ON_STARTUP", "false").lower() == "true"
+    STARTUP_LOCK_FILE = os.getenv("STARTUP_LOCK_FILE", os.path.join(tempfile.gettempdir(), "backend-startup.lock"))
+    # Memory-mapped counters through which workers on one host invalidate each
+    # other's in-process caches; empty keeps them private to each process
+    SHARED_STATE_DIR = os.getenv("SHARED_STATE_DIR", os.path.join(tempfile.gettempdir(), "backend-shared-state"))
+    SHARED_STATE_SLOTS = int(os.getenv("SHARED_STATE_SLOTS", "65536"))
+    # Negotiated response compression (zstd and br need the optional
+    # zstandard / brotli packages); smaller bodies are sent as they are
+    COMPRESSION_ENABLED = os.getenv("COMPRESSION_ENABLED", "true").lower() == "true"
+    COMPRESSION_MIN_SIZE = int(os.getenv("COMPRESSION_MIN_SIZE", "1000"))
+    COMPRESSION_ENCODINGS = tuple(filter(None, os.getenv("COMPRESSION_ENCODINGS", "zstd,br,gzip").split(",")))
+    # Compressed copies kept in article cache entries, made when an entry is stored
+    ARTICLE_PRECOMPRESS = tuple(filter(None, os.getenv("ARTICLE_PRECOMPRESS", "zstd,br,gzip").split(",")))
+    # Adaptive concurrency limits per route class (password routes, writes,
+    # reads); requests beyond a class's current limit are rejected at once.
+    # The maxima add up to the 40 threads sync handlers share by default, and
+    # limits start there; off by default
+    LOAD_SHEDDING_ENABLED = os.getenv("LOAD_SHEDDING_ENABLED", "false").lower() == "true"
+    LOAD_SHEDDING_AUTH_MAX = int(os.getenv("LOAD_SHEDDING_AUTH_MAX", "8"))
+    LOAD_SHEDDING_WRITE_MAX = int(os.getenv("LOAD_SHEDDING_WRITE_MAX", "8"))
+    LOAD_SHEDDING_READ_MAX = int(os.getenv("LOAD_SHEDDING_READ_MAX", "24"))
+    # A request slower than this multiple of its route's unloaded latency shrinks the limit by BACKOFF
+    LOAD_SHEDDING_LATENCY_TOLERANCE = float(os.getenv("LOAD_SHEDDING_LATENCY_TOLERANCE", "2.0"))
+    LOAD_SHEDDING_BACKOFF = float(os.getenv("LOAD_SHEDDING_BACKOFF", "0.9"))
+    # Per-route latency/DB/crypto histograms served at /metrics; off by default
+    METRICS_ENABLED = os.getenv("METRICS_ENABLED", "false").lower() == "true"
+    # Log requests slower than this, with their SQL statements
+    METRICS_SLOW_REQUEST_MS = _optional_int("METRICS_SLOW_REQUEST_MS")
@@ -1,12 +1,125 @@
-from sqlalchemy import create_engine
-from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from typing import Any, Dict, List
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.orm import declarative_base, sessionmaker
+from sqlalchemy.pool import StaticPool
 from backend.core.config import Config
 
 DATABASE_URL = Config.DATABASE_URL
 
-engine = create_engine(DATABASE_URL, connect_args={"check_same_thread": False})
+# Pool defaults per dialect; DB_POOL_* settings in Config override them.
+# SQLite connections are cheap and local, so the pool mostly bounds how many
+# threads can hold a connection at once; server databases need pre-ping and
+# recycling to survive idle timeouts and failovers.
+POOL_DEFAULTS: Dict[str, Dict[str, Any]] = {
+    "sqlite": {"pool_size": 20, "max_overflow": 10, "pool_pre_ping": False, "pool_recycle": -1},
+    "default": {"pool_size": 10, "max_overflow": 20, "pool_pre_ping": True, "pool_recycle": 1800},
+}
+
+
+def is_memory_sqlite(url: str) -> bool:
+    parsed = make_url(url)
+    return parsed.get_backend_name() == "sqlite" and parsed.database in (None, "", ":memory:")
+
+
+def engine_options(url: str) -> Dict[str, Any]:
+    """Keyword arguments for create_engine/create_async_engine for this URL."""
+    backend = make_url(url).get_backend_name()
+    if backend == "sqlite":
+        options: Dict[str, Any] = {"connect_args": {"check_same_thread": False}}
+        if is_memory_sqlite(url):
+            # One shared connection, otherwise every checkout sees an empty database.
+            options["poolclass"] = StaticPool
+            return options
+    else:
+        options = {}
+    pool = dict(POOL_DEFAULTS.get(backend, POOL_DEFAULTS["default"]))
+    overrides = {
+        "pool_size": Config.DB_POOL_SIZE,
+        "max_overflow": Config.DB_MAX_OVERFLOW,
+        "pool_pre_ping": Config.DB_POOL_PRE_PING,
+        "pool_recycle": Config.DB_POOL_RECYCLE,
+        "pool_timeout": Config.DB_POOL_TIMEOUT,
+    }
+    pool.update({key: value for key, value in overrides.items() if value is not None})
+    options.update(pool)
+    return options
+
+
+def sqlite_pragmas(url: str, read_only: bool = False) -> Dict[str, Any]:
+    pragmas: Dict[str, Any] = {
+        "synchronous": Config.SQLITE_SYNCHRONOUS,
+        "mmap_size": Config.SQLITE_MMAP_SIZE,
+        "cache_size": Config.SQLITE_CACHE_SIZE,
+        "busy_timeout": Config.SQLITE_BUSY_TIMEOUT_MS,
+        "temp_store": "MEMORY",
+    }
+    if not is_memory_sqlite(url):
+        # WAL lets readers proceed while a writer holds the lock; it is a
+        # property of the database file, so :memory: keeps its default.
+        pragmas = {"journal_mode": Config.SQLITE_JOURNAL_MODE, **pragmas}
+    if read_only:
+        pragmas["query_only"] = "ON"
+    return pragmas
+
+
+def install_sqlite_pragmas(engine: Engine, pragmas: Dict[str, Any]) -> None:
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for name, value in pragmas.items():
+                cursor.execute(f"PRAGMA {name}={value}")
+        finally:
+            cursor.close()
+
+
+def create_engine_from_config(url: str, read_only: bool = False) -> Engine:
+    db_engine = create_engine(url, **engine_options(url))
+    if db_engine.dialect.name == "sqlite":
+        install_sqlite_pragmas(db_engine, sqlite_pragmas(url, read_only=read_only))
+    return db_engine
+
+
+class QueryCounter:
+    """
+    Records the SQL statements an engine executes while the counter is
+    active. Tests wrap a single request in it to pin the number of queries
+    an endpoint issues.
+    """
+
+    def __init__(self, db_engine: Engine):
+        self.engine = db_engine
+        self.statements: List[str] = []
+
+    @property
+    def count(self) -> int:
+        return len(self.statements)
+
+    def _record(self, conn, cursor, statement, parameters, context, executemany):
+        self.statements.append(statement)
+
+    def __enter__(self) -> "QueryCounter":
+        self.statements = []
+        event.listen(self.engine, "before_cursor_execute", self._record)
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        event.remove(self.engine, "before_cursor_execute", self._record)
+
+
+engine = create_engine_from_config(DATABASE_URL)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+# GET routes read through this engine; it is the primary unless a replica is configured.
+read_engine = (
+    create_engine_from_config(Config.DATABASE_REPLICA_URL, read_only=True)
+    if Config.DATABASE_REPLICA_URL
+    else engine
+)
+ReadSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=read_engine)
+
 Base = declarative_base()
 
 
@@ -16,3 +129,11 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+def get_read_db():
+    db = ReadSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
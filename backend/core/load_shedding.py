@@ -0,0 +1,227 @@
+import json
+import time
+from functools import lru_cache
+from typing import Dict, Hashable, Iterable
+
+from backend.core.config import Config
+from backend.core.metrics import route_template
+
+AUTH = "auth"
+WRITE = "write"
+READ = "read"
+
+# Routes whose handlers hash or verify a password; bcrypt makes them the
+# most expensive requests, so they get a budget of their own.
+CRYPTO_PATHS = frozenset({"/api/auth/login", "/api/auth/register"})
+SAFE_METHODS = frozenset({"GET", "HEAD"})
+
+# Rejected with 429 like the password pool does; the other classes with 503.
+REJECT_STATUS = {AUTH: 429, WRITE: 503, READ: 503}
+
+
+def route_class(method: str, path: str) -> str | None:
+    """The budget a request draws from; None for requests that are never shed."""
+    if method == "OPTIONS":
+        return None
+    if path in CRYPTO_PATHS:
+        return AUTH
+    return READ if method in SAFE_METHODS else WRITE
+
+
+class LatencyBaseline:
+    """
+    Latency of one kind of request: `value`, a slow moving average over
+    about `window` samples, and `recent`, a fast one over the last few.
+    Samples taken while requests queue move `value` ten times slower, so it
+    follows slow drifts (a growing table) but not the delays of a spike.
+    Averages rather than a minimum keep a normal spread of latencies from
+    looking like a slowdown.
+    """
+
+    RECENT_SAMPLES = 10
+
+    def __init__(self, window: int = 100):
+        self.window = window
+        self.value: float | None = None
+        self.recent: float | None = None
+
+    def observe(self, seconds: float, queueing: bool = False) -> None:
+        if self.value is None:
+            self.value = self.recent = seconds
+            return
+        self.value += (seconds - self.value) / (self.window * 10 if queueing else self.window)
+        self.recent += (seconds - self.recent) / self.RECENT_SAMPLES
+
+
+class AdaptiveLimit:
+    """
+    Concurrency limit adjusted by AIMD on latency. Recent latency is
+    compared to the LatencyBaseline of its kind (route and status class),
+    since one class mixes fast and slow routes. Only requests that ran with
+    at least half the limit in use can cut it: when recent latency exceeds
+    `tolerance` times the baseline, or the request failed, the limit shrinks
+    by `backoff`. Otherwise each sample adds 1/limit, so the limit grows by
+    about one per limit's worth of requests, back to `maximum` once load
+    has passed. A lightly loaded server is never shed.
+    """
+
+    def __init__(
+        self,
+        initial: int,
+        minimum: int = 1,
+        maximum: int = 100,
+        tolerance: float = 2.0,
+        backoff: float = 0.9,
+        window: int = 100,
+    ):
+        self.minimum = minimum
+        self.maximum = maximum
+        self.tolerance = tolerance
+        self.backoff = backoff
+        self.window = window
+        self.limit = float(min(maximum, max(minimum, initial)))
+        self.baselines: Dict[Hashable, LatencyBaseline] = {}
+
+    def admits(self, inflight: int) -> bool:
+        return inflight < int(self.limit)
+
+    def on_sample(self, seconds: float, inflight: int, failed: bool = False, kind: Hashable = None) -> None:
+        """Record a finished request of `kind` that ran alongside `inflight` others (itself included)."""
+        # Slowness without requests queueing for the limit is noise or a
+        # slow dependency; shedding would not make it faster.
+        queueing = inflight * 2 >= self.limit
+        slow = failed
+        if not failed:
+            baseline = self.baselines.get(kind)
+            if baseline is None:
+                baseline = self.baselines[kind] = LatencyBaseline(self.window)
+            baseline.observe(seconds, queueing)
+            slow = baseline.recent > baseline.value * self.tolerance
+        if slow:
+            if queueing:
+                self.limit = max(self.minimum, self.limit * self.backoff)
+        else:
+            self.limit = min(self.maximum, self.limit + 1 / self.limit)
+
+
+class ConcurrencyLimiter:
+    """
+    Requests in flight per route class against each class's AdaptiveLimit.
+    Used from the event loop only (see LoadSheddingMiddleware), so the
+    counters need no lock.
+    """
+
+    def __init__(self, limits: Dict[str, AdaptiveLimit]):
+        self.limits = limits
+        self.inflight = {name: 0 for name in limits}
+        self.rejected = {name: 0 for name in limits}
+
+    def try_acquire(self, name: str) -> bool:
+        if not self.limits[name].admits(self.inflight[name]):
+            self.rejected[name] += 1
+            return False
+        self.inflight[name] += 1
+        return True
+
+    def release(self, name: str, seconds: float, failed: bool, kind: Hashable = None) -> None:
+        self.limits[name].on_sample(seconds, self.inflight[name], failed, kind)
+        self.inflight[name] -= 1
+
+    def render(self) -> str:
+        """Current limits, requests in flight and rejections per class, in the Prometheus text format."""
+        families = (
+            ("concurrency_limit", "gauge", "Current adaptive concurrency limit.",
+             {name: int(limit.limit) for name, limit in self.limits.items()}),
+            ("concurrency_inflight", "gauge", "Admitted requests in flight.", self.inflight),
+            ("requests_shed_total", "counter", "Requests rejected over the concurrency limit.", self.rejected),
+        )
+        lines = []
+        for metric, kind, help_text, values in families:
+            lines.append(f"# HELP {metric} {help_text}")
+            lines.append(f"# TYPE {metric} {kind}")
+            lines.extend(f'{metric}{{class="{name}"}} {value}' for name, value in values.items())
+        return "\n".join(lines) + "\n"
+
+
+class LoadSheddingMiddleware:
+    """
+    Pure ASGI middleware that admits a request only while its route class
+    is under its concurrency limit. Anything beyond gets an immediate 503
+    (429 for password routes) with Retry-After, instead of waiting for a
+    threadpool thread while every queued request times out.
+    """
+
+    def __init__(self, app, limiter: ConcurrencyLimiter, retry_after: int = 1, exempt_paths: Iterable[str] = ()):
+        self.app = app
+        self.limiter = limiter
+        self.retry_after = retry_after
+        self.exempt_paths = frozenset(exempt_paths)
+
+    async def __call__(self, scope, receive, send):
+        name = None
+        if scope["type"] == "http" and scope["path"] not in self.exempt_paths:
+            name = route_class(scope["method"], scope["path"])
+        if name is None:
+            await self.app(scope, receive, send)
+            return
+        if not self.limiter.try_acquire(name):
+            await self._reject(send, REJECT_STATUS[name])
+            return
+        status = 500
+
+        async def send_with_status(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            kind = (scope["method"], route_template(scope), status // 100)
+            self.limiter.release(name, time.perf_counter() - start, status >= 500, kind)
+
+    async def _reject(self, send, status: int) -> None:
+        body = json.dumps({"detail": "Server busy, retry shortly"}).encode()
+        await send(
+            {
+                "type": "http.response.start",
+                "status": status,
+                "headers": [
+                    (b"content-type", b"application/json"),
+                    (b"content-length", str(len(body)).encode()),
+                    (b"retry-after", str(self.retry_after).encode()),
+                ],
+            }
+        )
+        await send({"type": "http.response.body", "body": body})
+
+
+def _limit(maximum: int) -> AdaptiveLimit:
+    # Start at the maximum: until latencies have been seen there is no
+    # evidence of overload, so a fresh worker sheds nothing below the cap.
+    return AdaptiveLimit(
+        initial=maximum,
+        minimum=1,
+        maximum=maximum,
+        tolerance=Config.LOAD_SHEDDING_LATENCY_TOLERANCE,
+        backoff=Config.LOAD_SHEDDING_BACKOFF,
+    )
+
+
+def build_concurrency_limiter() -> ConcurrencyLimiter:
+    return ConcurrencyLimiter(
+        {
+            AUTH: _limit(Config.LOAD_SHEDDING_AUTH_MAX),
+            WRITE: _limit(Config.LOAD_SHEDDING_WRITE_MAX),
+            READ: _limit(Config.LOAD_SHEDDING_READ_MAX),
+        }
+    )
+
+
+@lru_cache(maxsize=None)
+def get_concurrency_limiter() -> ConcurrencyLimiter | None:
+    if not Config.LOAD_SHEDDING_ENABLED:
+        return None
+    return build_concurrency_limiter()
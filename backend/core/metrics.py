@@ -0,0 +1,233 @@
+import contextvars
+import logging
+import threading
+import time
+from bisect import bisect_left
+from contextlib import nullcontext
+from functools import lru_cache
+from typing import Dict, List, Sequence, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from backend.core.config import Config
+
+logger = logging.getLogger("backend.metrics")
+
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+UNMATCHED_ROUTE = "unmatched"
+
+
+class Histogram:
+    """Cumulative-bucket histogram in the Prometheus sense. Not thread-safe on its own."""
+
+    __slots__ = ("buckets", "counts", "sum", "count")
+
+    def __init__(self, buckets: Sequence[float]):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self) -> List[Tuple[str, int]]:
+        total = 0
+        result = []
+        for bound, count in zip(self.buckets + (float("inf"),), self.counts):
+            total += count
+            result.append(("+Inf" if bound == float("inf") else repr(bound), total))
+        return result
+
+
+class RequestMetrics:
+    """What one request spent on the database and on timed operations."""
+
+    __slots__ = ("queries", "db_seconds", "timings", "statements")
+
+    def __init__(self, collect_statements: bool = False):
+        self.queries = 0
+        self.db_seconds = 0.0
+        self.timings: List[Tuple[str, float]] = []
+        self.statements: List[str] | None = [] if collect_statements else None
+
+
+_current: contextvars.ContextVar[RequestMetrics | None] = contextvars.ContextVar("request_metrics", default=None)
+
+
+class _Timer:
+    __slots__ = ("request", "name", "start")
+
+    def __init__(self, request: RequestMetrics, name: str):
+        self.request = request
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.request.timings.append((self.name, time.perf_counter() - self.start))
+
+
+_NULL_TIMER = nullcontext()
+
+
+def timer(name: str):
+    """
+    Time a block against the current request, e.g. `with timer("jwt_decode"):`.
+    Outside an instrumented request (metrics disabled, CLIs) this is a no-op.
+    """
+    request = _current.get()
+    if request is None:
+        return _NULL_TIMER
+    return _Timer(request, name)
+
+
+class Metrics:
+    """Per-route latency, database and operation histograms, rendered as Prometheus text."""
+
+    def __init__(self, slow_request_ms: int | None = None):
+        self.slow_request_ms = slow_request_ms
+        self._requests: Dict[Tuple[str, str, int], Histogram] = {}
+        self._queries: Dict[str, Histogram] = {}
+        self._db_seconds: Dict[str, Histogram] = {}
+        self._operations: Dict[Tuple[str, str], Histogram] = {}
+        self._lock = threading.Lock()
+
+    def record_request(self, method: str, route: str, status: int, seconds: float, request: RequestMetrics) -> None:
+        with self._lock:
+            self._histogram(self._requests, (method, route, status), LATENCY_BUCKETS).observe(seconds)
+            self._histogram(self._queries, route, QUERY_COUNT_BUCKETS).observe(request.queries)
+            self._histogram(self._db_seconds, route, LATENCY_BUCKETS).observe(request.db_seconds)
+            for name, elapsed in request.timings:
+                self._histogram(self._operations, (name, route), LATENCY_BUCKETS).observe(elapsed)
+        if self.slow_request_ms is not None and seconds * 1000 >= self.slow_request_ms:
+            statements = "\n".join(f"  {statement}" for statement in request.statements or ())
+            logger.warning(
+                "slow request %s %s %d: %.1f ms, %d queries in %.1f ms\n%s",
+                method, route, status, seconds * 1000, request.queries, request.db_seconds * 1000, statements,
+            )
+
+    def render(self) -> str:
+        lines: List[str] = []
+        with self._lock:
+            self._render(
+                lines, "http_request_duration_seconds", "Request latency by route.",
+                {("method", "route", "status"): self._requests},
+            )
+            self._render(
+                lines, "db_queries_per_request", "SQL statements executed per request.",
+                {("route",): self._queries},
+            )
+            self._render(
+                lines, "db_query_duration_seconds", "Time spent in SQL per request.",
+                {("route",): self._db_seconds},
+            )
+            self._render(
+                lines, "operation_duration_seconds", "Timed operations (bcrypt, JWT decode) by route.",
+                {("operation", "route"): self._operations},
+            )
+        return "\n".join(lines) + "\n"
+
+    def reset(self) -> None:
+        with self._lock:
+            for histograms in (self._requests, self._queries, self._db_seconds, self._operations):
+                histograms.clear()
+
+    @staticmethod
+    def _histogram(histograms: dict, key, buckets: Sequence[float]) -> Histogram:
+        histogram = histograms.get(key)
+        if histogram is None:
+            histogram = histograms[key] = Histogram(buckets)
+        return histogram
+
+    @staticmethod
+    def _render(lines: List[str], name: str, help_text: str, families: dict) -> None:
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} histogram")
+        for label_names, histograms in families.items():
+            for key, histogram in sorted(histograms.items(), key=lambda item: str(item[0])):
+                values = key if isinstance(key, tuple) else (key,)
+                labels = ",".join(f'{label}="{_escape(value)}"' for label, value in zip(label_names, values))
+                for bound, count in histogram.cumulative():
+                    lines.append(f'{name}_bucket{{{labels},le="{bound}"}} {count}')
+                lines.append(f"{name}_sum{{{labels}}} {histogram.sum}")
+                lines.append(f"{name}_count{{{labels}}} {histogram.count}")
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class MetricsMiddleware:
+    """
+    Pure ASGI middleware recording latency, status and the request's
+    RequestMetrics under the matched route template, so ids in paths do not
+    explode the label set.
+    """
+
+    def __init__(self, app, metrics: Metrics):
+        self.app = app
+        self.metrics = metrics
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        request = RequestMetrics(collect_statements=self.metrics.slow_request_ms is not None)
+        token = _current.set(request)
+        status = 500
+
+        async def send_with_status(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            elapsed = time.perf_counter() - start
+            _current.reset(token)
+            route = route_template(scope)
+            self.metrics.record_request(scope["method"], route, status, elapsed, request)
+
+
+def route_template(scope) -> str:
+    # FastAPI keeps routes of included routers unprefixed and records the
+    # full template in its own scope entry; plain Starlette routes carry it.
+    context = scope.get("fastapi", {}).get("effective_route_context")
+    if context is not None:
+        return context.path
+    return getattr(scope.get("route"), "path", UNMATCHED_ROUTE)
+
+
+def install_query_metrics(db_engine: Engine) -> None:
+    """Attribute every statement run on this engine, and its duration, to the current request."""
+
+    @event.listens_for(db_engine, "before_cursor_execute")
+    def _start_query(conn, cursor, statement, parameters, context, executemany):
+        conn.info["metrics_query_start"] = time.perf_counter()
+
+    @event.listens_for(db_engine, "after_cursor_execute")
+    def _end_query(conn, cursor, statement, parameters, context, executemany):
+        request = _current.get()
+        if request is None:
+            return
+        request.queries += 1
+        request.db_seconds += time.perf_counter() - conn.info["metrics_query_start"]
+        if request.statements is not None:
+            request.statements.append(statement)
+
+
+@lru_cache(maxsize=None)
+def get_metrics() -> Metrics | None:
+    if not Config.METRICS_ENABLED:
+        return None
+    return Metrics(slow_request_ms=Config.METRICS_SLOW_REQUEST_MS)
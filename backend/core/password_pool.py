@@ -0,0 +1,77 @@
+import asyncio
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, Callable
+
+from fastapi import HTTPException, status
+
+from backend.core.config import Config
+
+
+class PasswordWorkerPool:
+    """
+    Size-limited executor for password hashing. At most `max_workers` jobs
+    run at once and `queue_size` more may wait; anything beyond that is
+    rejected immediately with 429 instead of tying up request threads.
+    `run` blocks its calling thread until the job is done; request handlers
+    await `run_async`, so queued jobs hold no threadpool thread.
+    """
+
+    def __init__(self, max_workers: int, queue_size: int, kind: str = "thread"):
+        self.max_workers = max_workers
+        self.queue_size = queue_size
+        self.kind = kind
+        self._slots = threading.BoundedSemaphore(max_workers + queue_size)
+        self._executor: Executor | None = None
+        self._executor_lock = threading.Lock()
+
+    def run(self, fn: Callable[..., Any], *args: Any) -> Any:
+        self._acquire_slot()
+        try:
+            return self._get_executor().submit(fn, *args).result()
+        finally:
+            self._slots.release()
+
+    async def run_async(self, fn: Callable[..., Any], *args: Any) -> Any:
+        """Like `run`, but awaits the job without blocking the event loop or a threadpool thread."""
+        self._acquire_slot()
+        try:
+            return await asyncio.wrap_future(self._get_executor().submit(fn, *args))
+        finally:
+            self._slots.release()
+
+    def shutdown(self) -> None:
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+                self._executor = None
+
+    def _acquire_slot(self) -> None:
+        if not self._slots.acquire(blocking=False):
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail="Too many authentication requests, retry shortly",
+                headers={"Retry-After": "1"},
+            )
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            with self._executor_lock:
+                if self._executor is None:
+                    if self.kind == "process":
+                        self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+                    else:
+                        self._executor = ThreadPoolExecutor(
+                            max_workers=self.max_workers, thread_name_prefix="password"
+                        )
+        return self._executor
+
+
+@lru_cache(maxsize=None)
+def get_password_pool() -> PasswordWorkerPool:
+    return PasswordWorkerPool(
+        max_workers=Config.PASSWORD_WORKERS,
+        queue_size=Config.PASSWORD_QUEUE_SIZE,
+        kind=Config.PASSWORD_POOL_KIND,
+    )
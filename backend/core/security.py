@@ -1,28 +1,64 @@
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from typing import Any, Dict
 import secrets
 
 from fastapi import HTTPException, status
-from jose import JWTError, jwt
-from passlib.context import CryptContext
 
 from backend.core.config import Config
+from backend.core.metrics import timer
+from backend.core.password_pool import get_password_pool
+from backend.core.tokens import TokenError, get_key_ring
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# passlib is imported on first use, so processes that never hash, and every
+# worker's boot, skip it.
 
 
+@lru_cache(maxsize=None)
+def get_pwd_context():
+    from passlib.context import CryptContext
+
+    return CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=Config.BCRYPT_ROUNDS)
+
+
+def _hash(password: str) -> str:
+    return get_pwd_context().hash(password)
+
+
+def _verify(plain_password: str, hashed_password: str) -> bool:
+    return get_pwd_context().verify(plain_password, hashed_password)
+
+
+# bcrypt timings include any wait for a pool slot, which is what the request pays.
 def hash_password(password: str) -> str:
-    return pwd_context.hash(password)
+    with timer("bcrypt_hash"):
+        return get_password_pool().run(_hash, password)
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return pwd_context.verify(plain_password, hashed_password)
+    with timer("bcrypt_verify"):
+        return get_password_pool().run(_verify, plain_password, hashed_password)
+
+
+async def ahash_password(password: str) -> str:
+    with timer("bcrypt_hash"):
+        return await get_password_pool().run_async(_hash, password)
+
+
+async def averify_password(plain_password: str, hashed_password: str) -> bool:
+    with timer("bcrypt_verify"):
+        return await get_password_pool().run_async(_verify, plain_password, hashed_password)
 
 
 def create_csrf_token() -> str:
     return secrets.token_urlsafe(16)
 
 
+def create_token_id() -> str:
+    """Random id for the `jti` and `fam` claims."""
+    return secrets.token_urlsafe(16)
+
+
 def credentials_exception() -> HTTPException:
     return HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
@@ -38,7 +74,9 @@ def create_token(
     csrf_token: str,
     additional_claims: Dict[str, Any] | None = None,
 ) -> str:
-    now = datetime.utcnow()
+    # Aware, so .timestamp() is right whatever the local timezone; PyJWT
+    # rejects an `iat` in the future.
+    now = datetime.now(timezone.utc)
     payload: Dict[str, Any] = {
         "sub": subject,
         "iat": int(now.timestamp()),
@@ -48,13 +86,14 @@ def create_token(
     }
     if additional_claims:
         payload.update(additional_claims)
-    return jwt.encode(payload, Config.SECRET_KEY, algorithm=Config.JWT_ALGORITHM)
+    return get_key_ring().encode(payload)
 
 
 def decode_token(token: str) -> Dict[str, Any]:
     try:
-        return jwt.decode(token, Config.SECRET_KEY, algorithms=[Config.JWT_ALGORITHM])
-    except JWTError as exc:
+        with timer("jwt_decode"):
+            return get_key_ring().decode(token)
+    except TokenError as exc:
         raise credentials_exception() from exc
 
 
@@ -0,0 +1,86 @@
+import mmap
+import os
+import struct
+import threading
+from functools import lru_cache
+
+from backend.core.config import Config
+
+try:
+    import fcntl
+except ImportError:  # Windows: counters stay private to the process
+    fcntl = None
+
+_COUNTER = struct.Struct("<Q")
+
+
+class SharedCounters:
+    """
+    Fixed array of 64-bit counters in a memory-mapped file, shared by every
+    process on the host that maps the same path (the workers of one server).
+    Per-process caches record a counter when they store an entry and treat
+    the entry as stale once it has moved, so a write handled by one worker
+    invalidates the copies held by all of them.
+
+    Keys are spread over `slots` counters, so unrelated keys can share one:
+    a bump then invalidates slightly more than needed, never less. Reads are
+    plain loads; bumps are serialized by a thread lock plus an fcntl lock on
+    the file. Without a path the counters live in anonymous memory, shared
+    only with processes forked afterwards.
+    """
+
+    def __init__(self, path: str | None = None, slots: int = 65536):
+        self.path = path
+        self.slots = slots
+        size = slots * _COUNTER.size
+        self._lock = threading.Lock()
+        self._fd = None
+        if path is None or fcntl is None:
+            self._map = mmap.mmap(-1, size)
+            return
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+        fcntl.flock(self._fd, fcntl.LOCK_EX)
+        try:
+            # Only ever grow the file: another process may already be using it.
+            if os.fstat(self._fd).st_size < size:
+                os.ftruncate(self._fd, size)
+        finally:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+        self._map = mmap.mmap(self._fd, size)
+
+    def slot(self, key: int) -> int:
+        return key % self.slots
+
+    def get(self, key: int) -> int:
+        return _COUNTER.unpack_from(self._map, self.slot(key) * _COUNTER.size)[0]
+
+    def bump(self, key: int) -> int:
+        """Increment the counter for `key` and return its new value."""
+        offset = self.slot(key) * _COUNTER.size
+        with self._lock:
+            if self._fd is not None:
+                fcntl.flock(self._fd, fcntl.LOCK_EX)
+            try:
+                value = _COUNTER.unpack_from(self._map, offset)[0] + 1
+                _COUNTER.pack_into(self._map, offset, value)
+                return value
+            finally:
+                if self._fd is not None:
+                    fcntl.flock(self._fd, fcntl.LOCK_UN)
+
+    def close(self) -> None:
+        self._map.close()
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+
+@lru_cache(maxsize=None)
+def get_shared_counters(name: str, slots: int | None = None) -> SharedCounters:
+    """Counters named `name` under SHARED_STATE_DIR (process-local when it is empty)."""
+    directory = Config.SHARED_STATE_DIR
+    path = os.path.join(directory, f"{name}.counters") if directory else None
+    return SharedCounters(path, slots=slots or Config.SHARED_STATE_SLOTS)
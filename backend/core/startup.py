@@ -0,0 +1,63 @@
+import logging
+import os
+from contextlib import contextmanager
+
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from backend.core.config import Config
+from backend.models.schema import create_schema
+from backend.repositories.article_repository import ArticleRepository
+from backend.repositories.auth_repository import AuthRepository
+from backend.services.token_revocation import get_token_revocations
+
+try:
+    import fcntl
+except ImportError:  # Windows: no advisory file locks, run unguarded
+    fcntl = None
+
+logger = logging.getLogger("backend.startup")
+
+
+@contextmanager
+def startup_lock(path: str):
+    """
+    Exclusive advisory lock on `path`, held for the block. Workers of one
+    server (uvicorn --workers, gunicorn) start together; the first one
+    migrates and seeds while the others wait, then find nothing left to do.
+    """
+    if fcntl is None:
+        yield
+        return
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, "a") as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+def prepare_database(db_engine: Engine, seed: bool = False) -> None:
+    """
+    Bring the schema up to date and, when asked, seed an empty database.
+    Also loads the newest body compression dictionary and builds the token
+    revocation filter, which each worker needs in its own process, after
+    pruning revocations of expired tokens.
+    """
+    with startup_lock(Config.STARTUP_LOCK_FILE):
+        create_schema(db_engine)
+        with Session(db_engine) as db:
+            ArticleRepository(db).activate_latest_dictionary()
+            auth_repository = AuthRepository(db)
+            auth_repository.prune_revocations()
+            revocations = get_token_revocations()
+            if revocations is not None:
+                revocations.sync(auth_repository)
+        if seed:
+            from backend.seed_data import seed_articles
+
+            if seed_articles(db_engine):
+                logger.info("seeded the articles table")
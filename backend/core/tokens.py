@@ -0,0 +1,166 @@
+"""
+JWT signing and verification over a ring of keys, on top of PyJWT.
+
+Each key has a `kid` that goes into the token header, so several keys can
+verify at once while one of them (the active key) signs. Rotation is: add
+the new key, make it active, and drop the old one once the longest-lived
+token it signed (a refresh token) has expired.
+
+PyJWT does the JWS work (HS256/384/512, ES256 and EdDSA); the ring only
+picks the key by `kid` and publishes the public halves as a JWKS, so other
+services can check tokens from `/api/auth/jwks.json` without holding a
+secret. Key material is parsed into `PyJWK` objects once, when the ring is
+built.
+"""
+import base64
+import json
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List
+
+import jwt
+from jwt import PyJWK
+
+from backend.core.config import Config
+
+DEFAULT_KID = "default"
+HMAC_ALGORITHMS = ("HS256", "HS384", "HS512")
+# The curve each asymmetric algorithm signs with.
+CURVES = {"ES256": "P-256", "EdDSA": "Ed25519"}
+
+
+class TokenError(Exception):
+    """The token is malformed, expired, signed by an unknown key or forged."""
+
+
+class SigningKey:
+    """One parsed key. Without private material it can only verify."""
+
+    def __init__(self, kid: str, alg: str, verifying: PyJWK, signing: PyJWK | None = None,
+                 public: Dict[str, str] | None = None):
+        self.kid = kid
+        self.alg = alg
+        self.verifying = verifying
+        self.signing = signing
+        # The JWK published for an asymmetric key; None for HMAC secrets.
+        self._public = public
+
+    @property
+    def can_sign(self) -> bool:
+        return self.signing is not None
+
+    def public_jwk(self) -> Dict[str, str] | None:
+        return {**self._public, "use": "sig"} if self._public is not None else None
+
+    @classmethod
+    def from_dict(cls, spec: Dict[str, Any]) -> "SigningKey":
+        """
+        Build a key from its configuration: `kid`, `alg`, and either `secret`
+        (HMAC) or `private_key` / `public_key` PEM text, or `*_file` paths.
+        """
+        kid, alg = spec["kid"], spec["alg"]
+        if alg in HMAC_ALGORITHMS:
+            return hmac_key(kid, alg, _material(spec, "secret").encode())
+        if alg in CURVES:
+            private_pem = _material(spec, "private_key", required=False)
+            public_pem = _material(spec, "public_key", required=False)
+            if private_pem is None and public_pem is None:
+                raise ValueError(f"key {kid}: private_key or public_key is required for {alg}")
+            return asymmetric_key(kid, alg, private_pem, public_pem)
+        raise ValueError(f"key {kid}: unsupported algorithm {alg}")
+
+
+def _material(spec: Dict[str, Any], name: str, required: bool = True) -> str | None:
+    if spec.get(name):
+        return spec[name]
+    path = spec.get(f"{name}_file")
+    if path:
+        with open(path, encoding="utf-8") as source:
+            return source.read()
+    if required:
+        raise ValueError(f"key {spec.get('kid')}: {name} or {name}_file is required")
+    return None
+
+
+def hmac_key(kid: str, alg: str, secret: bytes) -> SigningKey:
+    encoded = base64.urlsafe_b64encode(secret).rstrip(b"=").decode()
+    key = PyJWK({"kty": "oct", "k": encoded, "kid": kid, "alg": alg})
+    return SigningKey(kid, alg, verifying=key, signing=key)
+
+
+def asymmetric_key(kid: str, alg: str, private_pem: str | None, public_pem: str | None) -> SigningKey:
+    algorithm = jwt.get_algorithm_by_name(alg)
+    try:
+        private_key = algorithm.prepare_key(private_pem) if private_pem else None
+        public_key = private_key.public_key() if private_key is not None else algorithm.prepare_key(public_pem)
+    except jwt.InvalidKeyError as exc:
+        raise ValueError(f"key {kid}: {exc}") from exc
+    public = {**algorithm.to_jwk(public_key, as_dict=True), "kid": kid, "alg": alg}
+    if public.get("crv") != CURVES[alg]:
+        raise ValueError(f"key {kid}: {alg} needs a {CURVES[alg]} key")
+    signing = None
+    if private_key is not None:
+        signing = PyJWK({**algorithm.to_jwk(private_key, as_dict=True), "kid": kid, "alg": alg})
+    return SigningKey(kid, alg, verifying=PyJWK(public), signing=signing, public=public)
+
+
+class KeyRing:
+    """
+    Keys by `kid`; `active` signs new tokens, every key verifies. Tokens
+    without a `kid` (issued before key rotation existed) are checked
+    against `fallback`, when one is set.
+    """
+
+    def __init__(self, keys: Iterable[SigningKey], active: str, fallback: str | None = None):
+        self.keys = {key.kid: key for key in keys}
+        if active not in self.keys or not self.keys[active].can_sign:
+            raise ValueError(f"active key {active} is missing or cannot sign")
+        self.active = self.keys[active]
+        self.fallback = self.keys.get(fallback) if fallback else None
+
+    def encode(self, claims: Dict[str, Any]) -> str:
+        key = self.active
+        return jwt.encode(claims, key.signing, algorithm=key.alg, headers={"kid": key.kid})
+
+    def decode(self, token: str) -> Dict[str, Any]:
+        """Verified claims of `token`. Raises TokenError when it cannot be trusted or has expired."""
+        try:
+            kid = jwt.get_unverified_header(token).get("kid")
+            key = self.keys.get(kid) if isinstance(kid, str) else self.fallback if kid is None else None
+            if key is None:
+                raise TokenError("unknown signing key")
+            # The key decides the algorithm; a header naming another one is
+            # rejected rather than trusted (no "none", no HS256-with-public-key).
+            return jwt.decode(token, key.verifying, algorithms=[key.alg], options={"require": ["exp"]})
+        except jwt.PyJWTError as exc:
+            raise TokenError(str(exc)) from exc
+
+    def jwks(self) -> Dict[str, List[Dict[str, str]]]:
+        """Public keys for other verifiers; HMAC secrets are never published."""
+        return {"keys": [jwk for jwk in (key.public_jwk() for key in self.keys.values()) if jwk is not None]}
+
+
+def load_key_ring(path: str | None = None) -> KeyRing:
+    """
+    The ring described by the JSON file at `path` (JWT_KEYS_FILE):
+
+        {"active": "2026-10", "fallback": "default", "keys": [{"kid": ..., "alg": ..., ...}]}
+
+    Without a file, a single HMAC key from JWT_SECRET / JWT_ALGORITHM.
+    """
+    if not path:
+        if Config.JWT_ALGORITHM not in HMAC_ALGORITHMS:
+            raise ValueError(
+                f"JWT_ALGORITHM={Config.JWT_ALGORITHM} needs a key ring in JWT_KEYS_FILE; "
+                f"JWT_SECRET alone only signs with {', '.join(HMAC_ALGORITHMS)}"
+            )
+        key = hmac_key(DEFAULT_KID, Config.JWT_ALGORITHM, Config.SECRET_KEY.encode())
+        return KeyRing([key], active=DEFAULT_KID, fallback=DEFAULT_KID)
+    with open(path, encoding="utf-8") as source:
+        spec = json.load(source)
+    keys = [SigningKey.from_dict(entry) for entry in spec["keys"]]
+    return KeyRing(keys, active=spec["active"], fallback=spec.get("fallback"))
+
+
+@lru_cache(maxsize=None)
+def get_key_ring() -> KeyRing:
+    return load_key_ring(Config.JWT_KEYS_FILE)
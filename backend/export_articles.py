@@ -0,0 +1,36 @@
+"""
+Stream every article to a file (or stdout) as NDJSON or CSV.
+
+    python -m backend.export_articles --format csv --gzip -o articles.csv.gz
+"""
+import argparse
+import sys
+
+from backend.core.database import ReadSessionLocal
+from backend.repositories.article_repository import ArticleRepository
+from backend.services.article_export import EXPORT_MEDIA_TYPES, export_chunks
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--format", choices=sorted(EXPORT_MEDIA_TYPES), default="ndjson")
+    parser.add_argument("--gzip", action="store_true")
+    parser.add_argument("--batch-size", type=int, default=1000)
+    parser.add_argument("-o", "--output", default="-", help="output path, or - for stdout")
+    args = parser.parse_args(argv)
+
+    output = sys.stdout.buffer if args.output == "-" else open(args.output, "wb")
+    db = ReadSessionLocal()
+    try:
+        rows = ArticleRepository(db).iter_articles(batch_size=args.batch_size)
+        for chunk in export_chunks(rows, args.format, gzip=args.gzip):
+            output.write(chunk)
+    finally:
+        db.close()
+        if output is not sys.stdout.buffer:
+            output.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,37 @@
+"""
+Multi-process serving: gunicorn supervises uvicorn workers.
+
+    gunicorn -c backend/gunicorn_conf.py backend.main:app
+
+Settings come from the environment: WEB_CONCURRENCY (worker count, default
+one per CPU), BIND, GUNICORN_TIMEOUT, GUNICORN_KEEPALIVE and
+GUNICORN_MAX_REQUESTS. The app is imported once in the master and forked;
+migrations and seeding still run in each worker's lifespan, serialized by
+the startup lock, and the workers share cache invalidations through
+SHARED_STATE_DIR.
+"""
+import os
+
+# The article endpoints are CPU-bound Python around short SQLite reads, so
+# more workers than cores only adds context switches.
+workers = int(os.getenv("WEB_CONCURRENCY", str(os.cpu_count() or 1)))
+worker_class = "uvicorn_worker.UvicornWorker"
+bind = os.getenv("BIND", "0.0.0.0:8000")
+preload_app = True
+timeout = int(os.getenv("GUNICORN_TIMEOUT", "60"))
+graceful_timeout = 30
+keepalive = int(os.getenv("GUNICORN_KEEPALIVE", "5"))
+# Recycle workers now and then to bound slow leaks; jitter keeps them from restarting together.
+max_requests = int(os.getenv("GUNICORN_MAX_REQUESTS", "0"))
+max_requests_jitter = max_requests // 10
+accesslog = None
+
+
+def post_fork(server, worker):
+    # Connections opened in the master (if any) must not be shared with the
+    # children; drop them from this worker's pools without closing them.
+    from backend.core.database import engine, read_engine
+
+    engine.dispose(close=False)
+    if read_engine is not engine:
+        read_engine.dispose(close=False)
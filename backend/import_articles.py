@@ -0,0 +1,61 @@
+"""
+Stream a JSONL file of {"title", "content"} objects into the articles table.
+
+    python -m backend.import_articles articles.jsonl --batch-size 5000 --errors failed.jsonl
+
+Use `-` to read from stdin.
+"""
+import argparse
+import sys
+
+from backend.core.config import Config
+from backend.core.database import SessionLocal, engine
+from backend.models.schema import create_schema
+from backend.repositories.article_repository import ArticleRepository
+from backend.services.article_import import ArticleImporter, ImportReport
+
+
+def _print_progress(report: ImportReport) -> None:
+    print(
+        f"\rimported={report.imported} failed={report.failed} "
+        f"({report.rows_per_second:,.0f} rows/s)",
+        end="",
+        file=sys.stderr,
+        flush=True,
+    )
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("path", help="JSONL file to import, or - for stdin")
+    parser.add_argument("--batch-size", type=int, default=Config.IMPORT_BATCH_SIZE)
+    parser.add_argument("--errors", default="import_errors.jsonl", help="where to write rejected rows")
+    args = parser.parse_args(argv)
+
+    create_schema(engine)
+
+    source = sys.stdin.buffer if args.path == "-" else open(args.path, "rb")
+    db = SessionLocal()
+    try:
+        repository = ArticleRepository(db)
+        repository.activate_latest_dictionary()
+        with open(args.errors, "w", encoding="utf-8") as error_sink:
+            importer = ArticleImporter(
+                repository,
+                batch_size=args.batch_size,
+                error_sink=error_sink,
+                progress=_print_progress,
+            )
+            importer.feed(source)
+            report = importer.close()
+    finally:
+        db.close()
+        if source is not sys.stdin.buffer:
+            source.close()
+    print(file=sys.stderr)
+    print(report.to_dict())
+    return 1 if report.failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,20 +1,58 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
+from starlette.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
-from backend.api import articles, auth
-from backend.core.database import Base, engine
+from backend.api import articles, auth, metrics
+from backend.core.compression import CompressionMiddleware, get_response_encodings
+from backend.core.config import Config
+from backend.core.database import engine, read_engine
+from backend.core.load_shedding import LoadSheddingMiddleware, get_concurrency_limiter
+from backend.core.metrics import MetricsMiddleware, get_metrics, install_query_metrics
+from backend.core.startup import prepare_database
+
 
-# ensure models are imported so Base has metadata
-import backend.models
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Migrations run here rather than at import time, so importing the app
+    # (tests, tooling, forking workers) stays cheap.
+    await run_in_threadpool(prepare_database, engine, Config.SEED_ON_STARTUP)
+    yield
 
-app = FastAPI()
 
-# create tables from models
-Base.metadata.create_all(bind=engine)
+app = FastAPI(lifespan=lifespan)
 
 origins = [
     "http://localhost:5173",
 ]
 
+if Config.COMPRESSION_ENABLED:
+    app.add_middleware(
+        CompressionMiddleware, minimum_size=Config.COMPRESSION_MIN_SIZE, encodings=get_response_encodings()
+    )
+
+if Config.METRICS_ENABLED:
+    install_query_metrics(engine)
+    if read_engine is not engine:
+        install_query_metrics(read_engine)
+    app.add_middleware(MetricsMiddleware, metrics=get_metrics())
+    app.include_router(metrics.router, tags=["metrics"])
+
+if Config.ASYNC_ROUTES:
+    from backend.api import async_articles, async_auth
+
+    app.include_router(async_auth.router, prefix="/api", tags=["auth"])
+    app.include_router(async_articles.router, prefix="/api", tags=["articles"])
+else:
+    app.include_router(auth.router, prefix="/api", tags=["auth"])
+    app.include_router(articles.router, prefix="/api", tags=["articles"])
+
+# Outside metrics and compression, so shed requests cost no more than the rejection.
+if Config.LOAD_SHEDDING_ENABLED:
+    app.add_middleware(LoadSheddingMiddleware, limiter=get_concurrency_limiter(), exempt_paths=("/metrics",))
+
+# Added last so it is the outermost middleware: every response, a shed 429/503
+# included, carries the CORS headers the frontend needs to read it.
 app.add_middleware(
     CORSMiddleware,
     allow_origins=origins,
@@ -22,6 +60,3 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
-
-app.include_router(auth.router, prefix="/api", tags=["auth"])
-app.include_router(articles.router, prefix="/api", tags=["articles"])
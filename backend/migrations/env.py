@@ -0,0 +1,57 @@
+from alembic import context
+from sqlalchemy import engine_from_config, pool
+
+from backend.core.config import Config
+from backend.core.database import Base
+from backend.models.article_search import FTS_TABLE
+import backend.models  # noqa: F401 - ensure models are imported for metadata
+
+config = context.config
+target_metadata = Base.metadata
+
+
+def include_object(obj, name, type_, reflected, compare_to):
+    # The FTS5 table and its shadow tables are managed by article_search, not the models.
+    return not (type_ == "table" and name.startswith(FTS_TABLE))
+
+
+def run_migrations(connection) -> None:
+    context.configure(
+        connection=connection,
+        target_metadata=target_metadata,
+        include_object=include_object,
+        # SQLite can only add columns in place; everything else recreates the table.
+        render_as_batch=connection.dialect.name == "sqlite",
+    )
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def run_migrations_offline() -> None:
+    context.configure(
+        url=Config.DATABASE_URL,
+        target_metadata=target_metadata,
+        include_object=include_object,
+        literal_binds=True,
+    )
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def run_migrations_online() -> None:
+    # create_schema hands over its own connection; the alembic CLI connects itself.
+    connection = config.attributes.get("connection")
+    if connection is not None:
+        run_migrations(connection)
+        return
+    connectable = engine_from_config(
+        {"sqlalchemy.url": Config.DATABASE_URL}, prefix="sqlalchemy.", poolclass=pool.NullPool
+    )
+    with connectable.connect() as connection:
+        run_migrations(connection)
+
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    run_migrations_online()
@@ -0,0 +1,125 @@
+"""Initial schema: users, articles, collection versions and the search index.
+
+Databases created by `create_all` before migrations existed already have
+some of these tables, possibly without the columns added since. They are
+adopted here: missing tables are created, missing columns are added, and
+the migration is recorded as applied.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0001"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+# Migrations keep their own copy of the DDL they run, so replaying them
+# builds the same schema whatever the models look like today.
+FTS_TABLE = "articles_fts"
+
+# External-content FTS5 table kept in sync with `articles` by triggers.
+SQLITE_SEARCH_DDL = [
+    f"""
+    CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5(
+        title, content, content='articles', content_rowid='id',
+        tokenize='unicode61 remove_diacritics 2'
+    )
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS articles_fts_ai AFTER INSERT ON articles BEGIN
+        INSERT INTO {FTS_TABLE}(rowid, title, content) VALUES (new.id, new.title, new.content);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS articles_fts_ad AFTER DELETE ON articles BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, title, content)
+        VALUES ('delete', old.id, old.title, old.content);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS articles_fts_au AFTER UPDATE ON articles BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, title, content)
+        VALUES ('delete', old.id, old.title, old.content);
+        INSERT INTO {FTS_TABLE}(rowid, title, content) VALUES (new.id, new.title, new.content);
+    END
+    """,
+]
+
+POSTGRESQL_SEARCH_DDL = [
+    """
+    CREATE INDEX IF NOT EXISTS ix_articles_search ON articles
+    USING GIN (to_tsvector('simple', coalesce(title, '') || ' ' || coalesce(content, '')))
+    """,
+]
+
+
+
+def later_article_columns():
+    """Columns that shipped after the articles table itself."""
+    return [
+        sa.Column("version", sa.Integer(), nullable=False, server_default="1"),
+        sa.Column("updated_at", sa.DateTime(), nullable=True),
+    ]
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+
+    if not inspector.has_table("users"):
+        op.create_table(
+            "users",
+            sa.Column("id", sa.Integer(), primary_key=True),
+            sa.Column("email", sa.String(), nullable=False),
+            sa.Column("full_name", sa.String(), nullable=True),
+            sa.Column("hashed_password", sa.String(), nullable=False),
+            sa.Column("is_active", sa.Boolean(), nullable=True),
+            sa.Column("created_at", sa.DateTime(), nullable=True),
+        )
+        op.create_index("ix_users_id", "users", ["id"])
+        op.create_index("ix_users_email", "users", ["email"], unique=True)
+
+    if not inspector.has_table("articles"):
+        op.create_table(
+            "articles",
+            sa.Column("id", sa.Integer(), primary_key=True),
+            sa.Column("title", sa.String(), nullable=True),
+            sa.Column("content", sa.String(), nullable=True),
+            sa.Column("published", sa.Boolean(), nullable=True),
+            *later_article_columns(),
+        )
+        op.create_index("ix_articles_id", "articles", ["id"])
+        op.create_index("ix_articles_title", "articles", ["title"])
+    else:
+        existing = {column["name"] for column in inspector.get_columns("articles")}
+        for column in later_article_columns():
+            if column.name not in existing:
+                op.add_column("articles", column)
+
+    if not inspector.has_table("collection_versions"):
+        op.create_table(
+            "collection_versions",
+            sa.Column("name", sa.String(), primary_key=True),
+            sa.Column("version", sa.Integer(), nullable=False),
+        )
+
+    if bind.dialect.name == "sqlite":
+        existed = sa.inspect(bind).has_table(FTS_TABLE)
+        for statement in SQLITE_SEARCH_DDL:
+            op.execute(statement)
+        if not existed:
+            op.execute(f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')")
+    elif bind.dialect.name == "postgresql":
+        for statement in POSTGRESQL_SEARCH_DDL:
+            op.execute(statement)
+
+
+def downgrade() -> None:
+    op.execute(f"DROP TABLE IF EXISTS {FTS_TABLE}")
+    op.drop_table("collection_versions")
+    op.drop_table("articles")
+    op.drop_table("users")
@@ -0,0 +1,96 @@
+"""Article and user timestamps, article authors, and listing indexes.
+
+- articles.created_at (backfilled from updated_at) and users.updated_at
+- articles.author_id -> users.id, cleared when the user is deleted
+- (published, created_at, id) for published articles by recency and
+  (author_id, created_at, id) for an author's articles; both end in `id`
+  so keyset pagination on (created_at, id) is answered from the index
+- the unused title index and the redundant index on the primary key go
+
+On SQLite the articles changes run as a batch, which rebuilds the table, so
+the search triggers are recreated afterwards.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0002"
+down_revision = "0001"
+branch_labels = None
+depends_on = None
+
+FTS_TABLE = "articles_fts"
+
+# The triggers of revision 0001, dropped with the table a batch rebuilds.
+SQLITE_TRIGGERS_DDL = [
+    f"""
+    CREATE TRIGGER IF NOT EXISTS articles_fts_ai AFTER INSERT ON articles BEGIN
+        INSERT INTO {FTS_TABLE}(rowid, title, content) VALUES (new.id, new.title, new.content);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS articles_fts_ad AFTER DELETE ON articles BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, title, content)
+        VALUES ('delete', old.id, old.title, old.content);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS articles_fts_au AFTER UPDATE ON articles BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, title, content)
+        VALUES ('delete', old.id, old.title, old.content);
+        INSERT INTO {FTS_TABLE}(rowid, title, content) VALUES (new.id, new.title, new.content);
+    END
+    """,
+]
+
+
+def _restore_search_triggers() -> None:
+    if op.get_bind().dialect.name == "sqlite":
+        for statement in SQLITE_TRIGGERS_DDL:
+            op.execute(statement)
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("users") as batch:
+        batch.add_column(sa.Column("updated_at", sa.DateTime(), nullable=True))
+
+    with op.batch_alter_table("articles") as batch:
+        batch.add_column(sa.Column("created_at", sa.DateTime(), nullable=True))
+        batch.add_column(sa.Column("author_id", sa.Integer(), nullable=True))
+    op.execute("UPDATE articles SET created_at = COALESCE(updated_at, CURRENT_TIMESTAMP)")
+
+    # Adopted pre-migration databases may lack the old indexes.
+    existing_indexes = {index["name"] for index in sa.inspect(op.get_bind()).get_indexes("articles")}
+    with op.batch_alter_table("articles") as batch:
+        batch.alter_column(
+            "created_at", existing_type=sa.DateTime(), nullable=False, server_default=sa.func.current_timestamp()
+        )
+        batch.create_foreign_key(
+            "fk_articles_author_id_users", "users", ["author_id"], ["id"], ondelete="SET NULL"
+        )
+        for name in ("ix_articles_title", "ix_articles_id"):
+            if name in existing_indexes:
+                batch.drop_index(name)
+        batch.create_index("ix_articles_published_created_at", ["published", "created_at", "id"])
+        batch.create_index("ix_articles_author_id_created_at", ["author_id", "created_at", "id"])
+
+    _restore_search_triggers()
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("articles") as batch:
+        batch.drop_index("ix_articles_author_id_created_at")
+        batch.drop_index("ix_articles_published_created_at")
+        batch.create_index("ix_articles_id", ["id"])
+        batch.create_index("ix_articles_title", ["title"])
+        batch.drop_constraint("fk_articles_author_id_users", type_="foreignkey")
+        batch.drop_column("author_id")
+        batch.drop_column("created_at")
+
+    with op.batch_alter_table("users") as batch:
+        batch.drop_column("updated_at")
+
+    _restore_search_triggers()
@@ -0,0 +1,20 @@
+"""Index articles by (title, id) for title-prefix listings sorted by title.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-18
+"""
+from alembic import op
+
+revision = "0003"
+down_revision = "0002"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_articles_title_id", "articles", ["title", "id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_articles_title_id", table_name="articles")
@@ -0,0 +1,252 @@
+"""Move article content into compressed, separately stored bodies.
+
+- article_bodies holds each article's content, compressed by the codec
+  configured when it was written (see core/body_codec.py); bodies moved
+  here are written with zlib, which `train_body_dictionary --recompress`
+  can rewrite later
+- article_body_dictionaries holds trained zstd dictionaries
+- articles.excerpt keeps the start of the content inline for listings, and
+  articles.content goes
+- the search index no longer reads `articles`: on SQLite it becomes a
+  contentless FTS5 table, on PostgreSQL a table of tsvectors, both filled
+  by the application instead of triggers
+
+Content is moved in batches of BATCH_SIZE articles. The downgrade
+decompresses it back into articles.content and restores the old index.
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-18
+"""
+import zlib
+
+from alembic import op
+import sqlalchemy as sa
+
+try:
+    import zstandard
+except ImportError:  # only needed to downgrade bodies the app wrote with zstd
+    zstandard = None
+
+revision = "0004"
+down_revision = "0003"
+branch_labels = None
+depends_on = None
+
+BATCH_SIZE = 2000
+EXCERPT_LENGTH = 500
+ZLIB_LEVEL = 6
+
+FTS_TABLE = "articles_fts"
+
+# The index this revision introduces. Contentless: only the index is
+# stored, so removing a row needs the values it was indexed with.
+SQLITE_DDL = [
+    f"""
+    CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5(
+        title, content, content='',
+        tokenize='unicode61 remove_diacritics 2'
+    )
+    """,
+]
+POSTGRESQL_DDL = [
+    f"""
+    CREATE TABLE IF NOT EXISTS {FTS_TABLE} (
+        article_id INTEGER PRIMARY KEY REFERENCES articles (id) ON DELETE CASCADE,
+        document TSVECTOR NOT NULL
+    )
+    """,
+    f"CREATE INDEX IF NOT EXISTS ix_{FTS_TABLE}_document ON {FTS_TABLE} USING GIN (document)",
+]
+INDEX_SQL = {
+    "sqlite": f"INSERT INTO {FTS_TABLE}(rowid, title, content) VALUES (:id, :title, :content)",
+    "postgresql": f"""
+        INSERT INTO {FTS_TABLE} (article_id, document)
+        VALUES (:id, setweight(to_tsvector('simple', :title), 'A') || to_tsvector('simple', :content))
+    """,
+}
+
+# The external-content index of revisions 0001-0003, kept for the downgrade.
+OLD_SQLITE_TRIGGERS = ("articles_fts_ai", "articles_fts_ad", "articles_fts_au")
+OLD_SQLITE_DDL = [
+    f"""
+    CREATE VIRTUAL TABLE {FTS_TABLE} USING fts5(
+        title, content, content='articles', content_rowid='id',
+        tokenize='unicode61 remove_diacritics 2'
+    )
+    """,
+    f"""
+    CREATE TRIGGER articles_fts_ai AFTER INSERT ON articles BEGIN
+        INSERT INTO {FTS_TABLE}(rowid, title, content) VALUES (new.id, new.title, new.content);
+    END
+    """,
+    f"""
+    CREATE TRIGGER articles_fts_ad AFTER DELETE ON articles BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, title, content)
+        VALUES ('delete', old.id, old.title, old.content);
+    END
+    """,
+    f"""
+    CREATE TRIGGER articles_fts_au AFTER UPDATE ON articles BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, title, content)
+        VALUES ('delete', old.id, old.title, old.content);
+        INSERT INTO {FTS_TABLE}(rowid, title, content) VALUES (new.id, new.title, new.content);
+    END
+    """,
+    f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')",
+]
+OLD_POSTGRESQL_DDL = [
+    """
+    CREATE INDEX IF NOT EXISTS ix_articles_search ON articles
+    USING GIN (to_tsvector('simple', coalesce(title, '') || ' ' || coalesce(content, '')))
+    """,
+]
+
+articles = sa.table(
+    "articles", sa.column("id"), sa.column("title"), sa.column("content"), sa.column("excerpt")
+)
+bodies = sa.table(
+    "article_bodies", sa.column("article_id"), sa.column("codec"), sa.column("dictionary_id"), sa.column("data")
+)
+dictionaries = sa.table("article_body_dictionaries", sa.column("id"), sa.column("data"))
+
+
+def _encode(content: str) -> dict:
+    data = content.encode()
+    compressed = zlib.compress(data, ZLIB_LEVEL)
+    if len(compressed) < len(data):
+        return {"codec": "zlib", "dictionary_id": None, "data": compressed}
+    return {"codec": "plain", "dictionary_id": None, "data": data}
+
+
+def _decoder(bind):
+    """Decodes every body codec the application may have written since this revision."""
+    zstd_dictionaries = {}
+    if zstandard is not None:
+        for dictionary in bind.execute(sa.select(dictionaries.c.id, dictionaries.c.data)):
+            zstd_dictionaries[dictionary.id] = zstandard.ZstdCompressionDict(dictionary.data)
+
+    def decode(codec: str, dictionary_id: int | None, data: bytes) -> str:
+        if codec == "plain":
+            return data.decode()
+        if codec == "zlib":
+            return zlib.decompress(data).decode()
+        if codec == "zstd":
+            if zstandard is None:
+                raise RuntimeError("zstd-compressed article bodies need the zstandard package")
+            dictionary = None if dictionary_id is None else zstd_dictionaries[dictionary_id]
+            return zstandard.ZstdDecompressor(dict_data=dictionary).decompress(data).decode()
+        raise ValueError(f"unknown article body codec {codec}")
+
+    return decode
+
+
+def _drop_search_index(bind) -> None:
+    if bind.dialect.name == "sqlite":
+        for trigger in OLD_SQLITE_TRIGGERS:
+            op.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+        op.execute(f"DROP TABLE IF EXISTS {FTS_TABLE}")
+    elif bind.dialect.name == "postgresql":
+        op.execute("DROP INDEX IF EXISTS ix_articles_search")
+        op.execute(f"DROP TABLE IF EXISTS {FTS_TABLE}")
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    _drop_search_index(bind)
+    if bind.dialect.name == "sqlite":
+        for statement in SQLITE_DDL:
+            op.execute(statement)
+    elif bind.dialect.name == "postgresql":
+        for statement in POSTGRESQL_DDL:
+            op.execute(statement)
+
+    op.create_table(
+        "article_body_dictionaries",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("data", sa.LargeBinary(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+    )
+    op.create_table(
+        "article_bodies",
+        sa.Column("article_id", sa.Integer(), primary_key=True),
+        sa.Column("codec", sa.String(16), nullable=False),
+        sa.Column("dictionary_id", sa.Integer(), nullable=True),
+        sa.Column("data", sa.LargeBinary(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["article_id"], ["articles.id"], name="fk_article_bodies_article_id_articles", ondelete="CASCADE"
+        ),
+        sa.ForeignKeyConstraint(
+            ["dictionary_id"], ["article_body_dictionaries.id"], name="fk_article_bodies_dictionary_id_dictionaries"
+        ),
+    )
+    op.add_column("articles", sa.Column("excerpt", sa.String(), nullable=True))
+
+    index = INDEX_SQL.get(bind.dialect.name)
+    set_excerpt = (
+        sa.update(articles).where(articles.c.id == sa.bindparam("b_id")).values(excerpt=sa.bindparam("b_excerpt"))
+    )
+    last_id = 0
+    while True:
+        rows = bind.execute(
+            sa.select(articles.c.id, articles.c.title, articles.c.content)
+            .where(articles.c.id > last_id)
+            .order_by(articles.c.id)
+            .limit(BATCH_SIZE)
+        ).all()
+        if not rows:
+            break
+        with_content = [row for row in rows if row.content is not None]
+        if with_content:
+            bind.execute(
+                sa.insert(bodies), [{"article_id": row.id, **_encode(row.content)} for row in with_content]
+            )
+            bind.execute(
+                set_excerpt, [{"b_id": row.id, "b_excerpt": row.content[:EXCERPT_LENGTH]} for row in with_content]
+            )
+        if index is not None:
+            # NULLs are indexed as empty strings, as the application does.
+            bind.execute(
+                sa.text(index),
+                [{"id": row.id, "title": row.title or "", "content": row.content or ""} for row in rows],
+            )
+        last_id = rows[-1].id
+
+    with op.batch_alter_table("articles") as batch:
+        batch.drop_column("content")
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    with op.batch_alter_table("articles") as batch:
+        batch.add_column(sa.Column("content", sa.String(), nullable=True))
+
+    decode = _decoder(bind)
+    set_content = (
+        sa.update(articles).where(articles.c.id == sa.bindparam("b_id")).values(content=sa.bindparam("b_content"))
+    )
+    last_id = 0
+    while True:
+        rows = bind.execute(
+            sa.select(bodies).where(bodies.c.article_id > last_id).order_by(bodies.c.article_id).limit(BATCH_SIZE)
+        ).all()
+        if not rows:
+            break
+        bind.execute(
+            set_content,
+            [{"b_id": row.article_id, "b_content": decode(row.codec, row.dictionary_id, row.data)} for row in rows],
+        )
+        last_id = rows[-1].article_id
+
+    _drop_search_index(bind)
+    op.drop_table("article_bodies")
+    op.drop_table("article_body_dictionaries")
+    with op.batch_alter_table("articles") as batch:
+        batch.drop_column("excerpt")
+
+    if bind.dialect.name == "sqlite":
+        for statement in OLD_SQLITE_DDL:
+            op.execute(statement)
+    elif bind.dialect.name == "postgresql":
+        for statement in OLD_POSTGRESQL_DDL:
+            op.execute(statement)
@@ -0,0 +1,114 @@
+"""Let SQLite remove search index entries by rowid.
+
+On SQLite 3.43 and later the contentless FTS5 index is rebuilt with
+contentless_delete=1, so deleting an article no longer has to read and
+decompress its body to repeat the indexed text. Older SQLite versions,
+and other dialects, are left unchanged. Rebuilding reindexes every
+article from its body, in batches of BATCH_SIZE.
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-18
+"""
+import zlib
+
+from alembic import op
+import sqlalchemy as sa
+
+try:
+    import zstandard
+except ImportError:  # only needed for bodies the app wrote with zstd
+    zstandard = None
+
+revision = "0006"
+down_revision = "0005"
+branch_labels = None
+depends_on = None
+
+BATCH_SIZE = 2000
+CONTENTLESS_DELETE = (3, 43, 0)
+
+FTS_TABLE = "articles_fts"
+SQLITE_DDL = f"""
+    CREATE VIRTUAL TABLE {FTS_TABLE} USING fts5(
+        title, content, content='',{{options}}
+        tokenize='unicode61 remove_diacritics 2'
+    )
+"""
+INDEX_SQL = f"INSERT INTO {FTS_TABLE}(rowid, title, content) VALUES (:id, :title, :content)"
+
+articles = sa.table("articles", sa.column("id"), sa.column("title"))
+bodies = sa.table(
+    "article_bodies", sa.column("article_id"), sa.column("codec"), sa.column("dictionary_id"), sa.column("data")
+)
+dictionaries = sa.table("article_body_dictionaries", sa.column("id"), sa.column("data"))
+
+
+def _decoder(bind):
+    zstd_dictionaries = {}
+    if zstandard is not None:
+        for dictionary in bind.execute(sa.select(dictionaries.c.id, dictionaries.c.data)):
+            zstd_dictionaries[dictionary.id] = zstandard.ZstdCompressionDict(dictionary.data)
+
+    def decode(codec: str | None, dictionary_id: int | None, data: bytes | None) -> str:
+        if codec is None:
+            return ""
+        if codec == "plain":
+            return data.decode()
+        if codec == "zlib":
+            return zlib.decompress(data).decode()
+        if codec == "zstd":
+            if zstandard is None:
+                raise RuntimeError("zstd-compressed article bodies need the zstandard package")
+            dictionary = None if dictionary_id is None else zstd_dictionaries[dictionary_id]
+            return zstandard.ZstdDecompressor(dict_data=dictionary).decompress(data).decode()
+        raise ValueError(f"unknown article body codec {codec}")
+
+    return decode
+
+
+def _has_contentless_delete(bind) -> bool:
+    ddl = bind.execute(
+        sa.text("SELECT sql FROM sqlite_master WHERE type = 'table' AND name = :name"), {"name": FTS_TABLE}
+    ).scalar()
+    return "contentless_delete" in (ddl or "")
+
+
+def _rebuild(bind, contentless_delete: bool) -> None:
+    op.execute(f"DROP TABLE IF EXISTS {FTS_TABLE}")
+    op.execute(SQLITE_DDL.format(options=" contentless_delete=1," if contentless_delete else ""))
+    decode = _decoder(bind)
+    last_id = 0
+    while True:
+        rows = bind.execute(
+            sa.select(articles.c.id, articles.c.title, bodies.c.codec, bodies.c.dictionary_id, bodies.c.data)
+            .select_from(articles.outerjoin(bodies, bodies.c.article_id == articles.c.id))
+            .where(articles.c.id > last_id)
+            .order_by(articles.c.id)
+            .limit(BATCH_SIZE)
+        ).all()
+        if not rows:
+            break
+        # NULLs are indexed as empty strings, as the application does.
+        bind.execute(
+            sa.text(INDEX_SQL),
+            [
+                {"id": row.id, "title": row.title or "", "content": decode(row.codec, row.dictionary_id, row.data)}
+                for row in rows
+            ],
+        )
+        last_id = rows[-1].id
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name != "sqlite" or (bind.dialect.server_version_info or ()) < CONTENTLESS_DELETE:
+        return
+    if not _has_contentless_delete(bind):
+        _rebuild(bind, contentless_delete=True)
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name == "sqlite" and _has_contentless_delete(bind):
+        _rebuild(bind, contentless_delete=False)
@@ -0,0 +1,46 @@
+"""Normalize backfilled article timestamps; compare titles bytewise.
+
+- 0002 backfilled articles.created_at with CURRENT_TIMESTAMP, which on
+  SQLite is stored without the fractional seconds the application writes,
+  so (created_at, id) keyset comparisons between the two formats are
+  wrong; those values get explicit zero microseconds. The column's server
+  default, unused by the application, goes.
+- On PostgreSQL articles.title takes the "C" collation: title-prefix
+  listings are ranges, which match exactly the titles with the prefix only
+  under a bytewise collation. ix_articles_title_id is rebuilt with it.
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0007"
+down_revision = "0006"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name == "sqlite":
+        # 'YYYY-MM-DD HH:MM:SS' as written by CURRENT_TIMESTAMP.
+        op.execute("UPDATE articles SET created_at = created_at || '.000000' WHERE length(created_at) = 19")
+    with op.batch_alter_table("articles") as batch:
+        batch.alter_column("created_at", existing_type=sa.DateTime(), existing_nullable=False, server_default=None)
+    if bind.dialect.name == "postgresql":
+        op.alter_column("articles", "title", type_=sa.String(collation="C"), existing_type=sa.String())
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name == "postgresql":
+        op.alter_column("articles", "title", type_=sa.String(), existing_type=sa.String(collation="C"))
+    with op.batch_alter_table("articles") as batch:
+        batch.alter_column(
+            "created_at",
+            existing_type=sa.DateTime(),
+            existing_nullable=False,
+            server_default=sa.func.current_timestamp(),
+        )
@@ -0,0 +1,50 @@
+"""Used refresh tokens get a table of their own.
+
+revoked_tokens held both used refresh tokens (by jti) and revoked token
+families (by fam), and every worker loaded all of them into its revocation
+filter although only families are ever looked up there. Used tokens now go
+to used_refresh_tokens, whose unique constraint detects reuse. Existing
+rows are copied over, so tokens used before the upgrade are still caught
+when replayed; they stay in revoked_tokens until pruned.
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0008"
+down_revision = "0007"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "used_refresh_tokens",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("token_id", sa.String(), nullable=False),
+        sa.Column("user_id", sa.Integer(), nullable=True),
+        sa.Column("expires_at", sa.DateTime(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["user_id"], ["users.id"], name="fk_used_refresh_tokens_user_id_users", ondelete="CASCADE"
+        ),
+        sa.UniqueConstraint("token_id", name="uq_used_refresh_tokens_token_id"),
+    )
+    op.create_index("ix_used_refresh_tokens_expires_at", "used_refresh_tokens", ["expires_at"])
+    op.execute(
+        "INSERT INTO used_refresh_tokens (token_id, user_id, expires_at, created_at) "
+        "SELECT token_id, user_id, expires_at, created_at FROM revoked_tokens"
+    )
+
+
+def downgrade() -> None:
+    op.execute(
+        "INSERT INTO revoked_tokens (token_id, user_id, expires_at, created_at) "
+        "SELECT token_id, user_id, expires_at, created_at FROM used_refresh_tokens "
+        "WHERE token_id NOT IN (SELECT token_id FROM revoked_tokens)"
+    )
+    op.drop_index("ix_used_refresh_tokens_expires_at", table_name="used_refresh_tokens")
+    op.drop_table("used_refresh_tokens")
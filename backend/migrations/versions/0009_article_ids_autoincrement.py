@@ -0,0 +1,36 @@
+"""Never reuse article ids on SQLite.
+
+SQLite hands out max(rowid) + 1, so deleting the newest article and
+creating another gave the new one the same id, and at version 1 the same
+ETag: a client holding the deleted article's ETag got 304 for the new one.
+articles is recreated with AUTOINCREMENT, whose counter starts at the
+highest id copied over. PostgreSQL sequences never go back; nothing
+changes there.
+
+Revision ID: 0009
+Revises: 0008
+Create Date: 2026-10-18
+"""
+from alembic import op
+
+revision = "0009"
+down_revision = "0008"
+branch_labels = None
+depends_on = None
+
+
+def _recreate_articles(autoincrement: bool) -> None:
+    if op.get_bind().dialect.name != "sqlite":
+        return
+    with op.batch_alter_table(
+        "articles", recreate="always", table_kwargs={"sqlite_autoincrement": autoincrement}
+    ):
+        pass
+
+
+def upgrade() -> None:
+    _recreate_articles(True)
+
+
+def downgrade() -> None:
+    _recreate_articles(False)
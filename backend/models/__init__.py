@@ -1,2 +1,7 @@
 from backend.models.article import Article
+from backend.models.article_body import ArticleBody, ArticleBodyDictionary
+from backend.models.article_search import ensure_article_search_index
+from backend.models.collection_version import CollectionVersion
+from backend.models.revoked_token import RevokedToken
+from backend.models.used_refresh_token import UsedRefreshToken
 from backend.models.user import User
@@ -1,10 +1,53 @@
-from sqlalchemy import Column, Integer, String, Boolean
+from datetime import datetime
+
+from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Index, Integer, String
+from sqlalchemy.orm import relationship
+
 from backend.core.database import Base
+from backend.models.article_body import ArticleBody
+
+# Characters of the content kept in `articles.excerpt`, the longest excerpt a listing can show.
+EXCERPT_LENGTH = 500
 
 
 class Article(Base):
     __tablename__ = "articles"
-    id = Column(Integer, primary_key=True, index=True)
-    title = Column(String, index=True)
-    content = Column(String)
+    id = Column(Integer, primary_key=True)
+    # Bytewise ("C") collation on PostgreSQL, as SQLite compares by default,
+    # so title-prefix ranges and title order use ix_articles_title_id.
+    title = Column(String().with_variant(String(collation="C"), "postgresql"))
+    # The start of the content, inline for listings; the full content is in `body`.
+    excerpt = Column(String)
     published = Column(Boolean, default=True)
+    author_id = Column(Integer, ForeignKey("users.id", name="fk_articles_author_id_users", ondelete="SET NULL"))
+    version = Column(Integer, nullable=False, default=1, server_default="1")
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    # Listing indexes; each ends in `id` so keyset pages on (key, id) are read from the index.
+    # AUTOINCREMENT keeps SQLite from reusing the id of a deleted article,
+    # which would bring back its ETag (id and version) for a new one.
+    __table_args__ = (
+        Index("ix_articles_published_created_at", "published", "created_at", "id"),
+        Index("ix_articles_author_id_created_at", "author_id", "created_at", "id"),
+        Index("ix_articles_title_id", "title", "id"),
+        {"sqlite_autoincrement": True},
+    )
+
+    # ORM updates bump `version`, which feeds the article's ETag.
+    __mapper_args__ = {"version_id_col": version}
+
+    body = relationship(ArticleBody, back_populates="article", uselist=False, cascade="all, delete-orphan")
+
+    @property
+    def content(self) -> str | None:
+        """The full content, loaded (and decompressed) on first access."""
+        return None if self.body is None else self.body.text
+
+    @content.setter
+    def content(self, text: str | None) -> None:
+        # Touch the current body first so a replaced one is in the history
+        # that the search index listeners read.
+        self.body
+        self.body = None if text is None else ArticleBody.from_text(text)
+        self.excerpt = None if text is None else text[:EXCERPT_LENGTH]
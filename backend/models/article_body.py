@@ -0,0 +1,58 @@
+from datetime import datetime
+
+from sqlalchemy import Column, DateTime, ForeignKey, Integer, LargeBinary, String
+from sqlalchemy.orm import relationship
+
+from backend.core.body_codec import get_body_codec
+from backend.core.database import Base
+
+
+class ArticleBody(Base):
+    """
+    An article's content, compressed, kept out of the `articles` rows so
+    listings and existence checks never read it. `codec` and `dictionary_id`
+    record how `data` was compressed (see core/body_codec.py).
+    """
+
+    __tablename__ = "article_bodies"
+
+    article_id = Column(
+        Integer,
+        ForeignKey("articles.id", name="fk_article_bodies_article_id_articles", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    codec = Column(String(16), nullable=False)
+    dictionary_id = Column(
+        Integer, ForeignKey("article_body_dictionaries.id", name="fk_article_bodies_dictionary_id_dictionaries")
+    )
+    data = Column(LargeBinary, nullable=False)
+
+    article = relationship("Article", back_populates="body")
+    dictionary = relationship("ArticleBodyDictionary")
+
+    @classmethod
+    def from_text(cls, text: str) -> "ArticleBody":
+        codec, dictionary_id, data = get_body_codec().encode(text)
+        body = cls(codec=codec, dictionary_id=dictionary_id, data=data)
+        body._text = text
+        return body
+
+    @property
+    def text(self) -> str:
+        text = getattr(self, "_text", None)
+        if text is None:
+            codec = get_body_codec()
+            if codec.missing_dictionaries([self.dictionary_id]):
+                codec.add_dictionary(self.dictionary_id, self.dictionary.data)
+            text = self._text = codec.decode(self.codec, self.dictionary_id, self.data)
+        return text
+
+
+class ArticleBodyDictionary(Base):
+    """A zstd dictionary trained on article bodies; the newest one compresses new bodies."""
+
+    __tablename__ = "article_body_dictionaries"
+
+    id = Column(Integer, primary_key=True)
+    data = Column(LargeBinary, nullable=False)
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
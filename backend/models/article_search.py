@@ -0,0 +1,159 @@
+import weakref
+from typing import NamedTuple
+
+from sqlalchemy import event, inspect, text
+from sqlalchemy.sql.elements import TextClause
+
+from backend.models.article import Article
+
+FTS_TABLE = "articles_fts"
+
+# Article bodies are stored compressed (see ArticleBody), which the database
+# cannot read, so the search index keeps no copy of the text and cannot be
+# filled from `articles` by triggers. It is maintained explicitly instead:
+# ArticleRepository indexes and unindexes on every Core write, and the ORM
+# listeners below cover articles written through a Session.
+# Contentless: only the index is stored. Removing a row needs the values it
+# was indexed with, unless the table is declared with contentless_delete=1,
+# which SQLite supports from 3.43 on and which deletes by rowid instead.
+SQLITE_DDL = f"""
+    CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5(
+        title, content, content='',{{options}}
+        tokenize='unicode61 remove_diacritics 2'
+    )
+"""
+SQLITE_CONTENTLESS_DELETE = (3, 43, 0)
+
+POSTGRESQL_DDL = [
+    f"""
+    CREATE TABLE IF NOT EXISTS {FTS_TABLE} (
+        article_id INTEGER PRIMARY KEY REFERENCES articles (id) ON DELETE CASCADE,
+        document TSVECTOR NOT NULL
+    )
+    """,
+    f"CREATE INDEX IF NOT EXISTS ix_{FTS_TABLE}_document ON {FTS_TABLE} USING GIN (document)",
+]
+
+_INDEX = {
+    "sqlite": f"INSERT INTO {FTS_TABLE}(rowid, title, content) VALUES (:id, :title, :content)",
+    "postgresql": f"""
+        INSERT INTO {FTS_TABLE} (article_id, document)
+        VALUES (:id, setweight(to_tsvector('simple', :title), 'A') || to_tsvector('simple', :content))
+    """,
+}
+
+_SQLITE_UNINDEX_BY_VALUES = (
+    f"INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, title, content) VALUES ('delete', :id, :title, :content)"
+)
+_SQLITE_UNINDEX_BY_ROWID = f"DELETE FROM {FTS_TABLE} WHERE rowid = :id"
+_POSTGRESQL_UNINDEX = f"DELETE FROM {FTS_TABLE} WHERE article_id = :id"
+
+
+class Unindex(NamedTuple):
+    """How articles are removed from the search index of one database."""
+
+    # None on dialects without an index.
+    statement: TextClause | None
+    # Whether the statement's parameters must repeat the indexed title and
+    # content (see `index_params`); otherwise only the id is used, and the
+    # body need not be read.
+    needs_content: bool
+
+
+# Whether each engine's SQLite index deletes by rowid, read once from its DDL.
+_deletes_by_rowid: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
+
+def sqlite_supports_contentless_delete(connection) -> bool:
+    return (connection.dialect.server_version_info or ()) >= SQLITE_CONTENTLESS_DELETE
+
+
+def sqlite_search_ddl(contentless_delete: bool) -> str:
+    return SQLITE_DDL.format(options=" contentless_delete=1," if contentless_delete else "")
+
+
+def ensure_article_search_index(connection) -> None:
+    """Create the dialect's search index if missing. It starts empty; see `index_statement`."""
+    dialect = connection.dialect.name
+    if dialect == "sqlite":
+        if inspect(connection).has_table(FTS_TABLE):
+            return
+        contentless_delete = sqlite_supports_contentless_delete(connection)
+        connection.execute(text(sqlite_search_ddl(contentless_delete)))
+        _deletes_by_rowid[connection.engine] = contentless_delete
+    elif dialect == "postgresql":
+        for statement in POSTGRESQL_DDL:
+            connection.execute(text(statement))
+
+
+def index_statement(dialect: str):
+    """
+    Statement adding articles to the search index, executed with one or
+    more {"id", "title", "content"} parameter sets (see `index_params`).
+    None on dialects without an index.
+    """
+    statement = _INDEX.get(dialect)
+    return None if statement is None else text(statement)
+
+
+def get_unindex(connection) -> Unindex:
+    """How `connection`'s database removes articles from its search index."""
+    dialect = connection.dialect.name
+    if dialect == "postgresql":
+        return Unindex(text(_POSTGRESQL_UNINDEX), False)
+    if dialect != "sqlite":
+        return Unindex(None, False)
+    by_rowid = _deletes_by_rowid.get(connection.engine)
+    if by_rowid is None:
+        ddl = connection.execute(
+            text("SELECT sql FROM sqlite_master WHERE type = 'table' AND name = :name"), {"name": FTS_TABLE}
+        ).scalar()
+        by_rowid = _deletes_by_rowid[connection.engine] = "contentless_delete" in (ddl or "")
+    if by_rowid:
+        return Unindex(text(_SQLITE_UNINDEX_BY_ROWID), False)
+    return Unindex(text(_SQLITE_UNINDEX_BY_VALUES), True)
+
+
+def index_params(article_id: int, title: str | None, content: str | None) -> dict:
+    # Removing from a contentless index must repeat the indexed values
+    # exactly, so NULLs are always indexed as empty strings.
+    return {"id": article_id, "title": title or "", "content": content or ""}
+
+
+def _execute(connection, statement, params: dict) -> None:
+    if statement is not None:
+        connection.execute(statement, params)
+
+
+@event.listens_for(Article.__table__, "after_create")
+def _create_search_index(target, connection, **kw):
+    ensure_article_search_index(connection)
+
+
+@event.listens_for(Article, "after_insert")
+def _index_inserted(mapper, connection, target):
+    _execute(connection, index_statement(connection.dialect.name), index_params(target.id, target.title, target.content))
+
+
+@event.listens_for(Article, "before_update")
+def _reindex_updated(mapper, connection, target):
+    state = inspect(target)
+    title, body = state.attrs.title.history, state.attrs.body.history
+    if not (title.has_changes() or body.has_changes()):
+        return
+    unindex = get_unindex(connection)
+    if unindex.needs_content:
+        old_title = title.deleted[0] if title.deleted else target.title
+        old_body = body.deleted[0] if body.deleted else target.body
+        params = index_params(target.id, old_title, None if old_body is None else old_body.text)
+    else:
+        params = index_params(target.id, None, None)
+    _execute(connection, unindex.statement, params)
+    _execute(connection, index_statement(connection.dialect.name), index_params(target.id, target.title, target.content))
+
+
+@event.listens_for(Article, "before_delete")
+def _unindex_deleted(mapper, connection, target):
+    unindex = get_unindex(connection)
+    content = target.content if unindex.needs_content else None
+    _execute(connection, unindex.statement, index_params(target.id, target.title, content))
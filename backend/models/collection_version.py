@@ -0,0 +1,12 @@
+from sqlalchemy import Column, Integer, String
+
+from backend.core.database import Base
+
+
+class CollectionVersion(Base):
+    """Monotonic counter per collection, bumped by every write that changes its listing."""
+
+    __tablename__ = "collection_versions"
+
+    name = Column(String, primary_key=True)
+    version = Column(Integer, nullable=False, default=0)
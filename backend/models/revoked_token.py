@@ -0,0 +1,30 @@
+from datetime import datetime
+
+from sqlalchemy import Column, DateTime, ForeignKey, Integer, String, UniqueConstraint
+
+from backend.core.database import Base
+
+
+class RevokedToken(Base):
+    """
+    A token family (by `fam`) that has been revoked. Rows can be pruned
+    once `expires_at`, the end of the longest-lived token they cover, has
+    passed. `id` only grows, so workers catch up by reading the rows after
+    the last one they saw. Used refresh tokens are kept apart, in
+    UsedRefreshToken.
+    """
+
+    __tablename__ = "revoked_tokens"
+
+    id = Column(Integer, primary_key=True)
+    token_id = Column(String, nullable=False)
+    user_id = Column(Integer, ForeignKey("users.id", name="fk_revoked_tokens_user_id_users", ondelete="CASCADE"))
+    expires_at = Column(DateTime, nullable=False, index=True)
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+
+    # Revoking is an insert: the constraint makes a second revocation fail
+    # atomically. AUTOINCREMENT keeps SQLite from reusing pruned ids.
+    __table_args__ = (
+        UniqueConstraint("token_id", name="uq_revoked_tokens_token_id"),
+        {"sqlite_autoincrement": True},
+    )
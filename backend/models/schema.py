@@ -0,0 +1,39 @@
+import os
+
+from sqlalchemy import inspect, text
+
+ALEMBIC_INI = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "alembic.ini")
+
+# Newest migration in backend/migrations/versions; test_schema checks that
+# it matches the scripts. Lets an up-to-date database skip loading Alembic.
+HEAD_REVISION = "0009"
+
+
+def alembic_config(connection=None):
+    """Alembic configuration for backend/migrations, optionally bound to an open connection."""
+    from alembic.config import Config as AlembicConfig
+
+    config = AlembicConfig(ALEMBIC_INI)
+    config.attributes["connection"] = connection
+    return config
+
+
+def schema_is_current(connection) -> bool:
+    if not inspect(connection).has_table("alembic_version"):
+        return False
+    revisions = connection.execute(text("SELECT version_num FROM alembic_version")).scalars().all()
+    return revisions == [HEAD_REVISION]
+
+
+def create_schema(bind) -> None:
+    """
+    Upgrade the database to the latest migration. Databases created before
+    migrations existed are adopted by the initial migration.
+    """
+    with bind.begin() as connection:
+        if schema_is_current(connection):
+            return
+        # Alembic takes ~0.1 s to import; only pay that when there is work to do.
+        from alembic import command
+
+        command.upgrade(alembic_config(connection), "head")
@@ -0,0 +1,24 @@
+from datetime import datetime
+
+from sqlalchemy import Column, DateTime, ForeignKey, Integer, String, UniqueConstraint
+
+from backend.core.database import Base
+
+
+class UsedRefreshToken(Base):
+    """
+    A refresh token (by `jti`) that has been exchanged. Using one is an
+    insert, so the unique constraint makes a second use fail atomically;
+    that is all reuse detection needs, so these ids stay out of the
+    revocation filter. Rows can be pruned once `expires_at` has passed.
+    """
+
+    __tablename__ = "used_refresh_tokens"
+
+    id = Column(Integer, primary_key=True)
+    token_id = Column(String, nullable=False)
+    user_id = Column(Integer, ForeignKey("users.id", name="fk_used_refresh_tokens_user_id_users", ondelete="CASCADE"))
+    expires_at = Column(DateTime, nullable=False, index=True)
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+
+    __table_args__ = (UniqueConstraint("token_id", name="uq_used_refresh_tokens_token_id"),)
@@ -1,38 +1,499 @@
-from sqlalchemy import or_
+import re
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Iterable, List, NamedTuple
+
+from sqlalchemy import delete, false, func, insert, literal, or_, select, text, true, tuple_, update
 from sqlalchemy.orm import Session
-from backend.models.article import Article
+from backend.core.body_codec import BodyCodec, get_body_codec
+from backend.models.article import EXCERPT_LENGTH, Article
+from backend.models.article_body import ArticleBody, ArticleBodyDictionary
+from backend.models.article_search import FTS_TABLE, get_unindex, index_params, index_statement
+from backend.models.collection_version import CollectionVersion
+
+ARTICLES_COLLECTION = "articles"
+
+SNIPPET_START = "<mark>"
+SNIPPET_END = "</mark>"
+SNIPPET_ELLIPSIS = "…"
+
+_SEARCH_TOKEN = re.compile(r"\w+", re.UNICODE)
+
+# Sorts after every other code point, so [prefix, prefix + TITLE_PREFIX_END) covers the prefix.
+TITLE_PREFIX_END = "\U0010ffff"
+
+
+class StoredArticle(NamedTuple):
+    """An article with its content decompressed."""
+
+    id: int
+    title: str
+    content: str | None
+    published: bool
+    version: int
+
+
+class SearchHit(NamedTuple):
+    id: int
+    title: str
+    content: str | None
+    score: float
+
+
+# Statement builders are shared with AsyncArticleRepository so both stacks
+# issue identical SQL.
+
+
+def insert_article_statement(title: str, content: str, author_id: int | None = None):
+    # RETURNING hands back the generated id and version, so no refresh SELECT follows the insert.
+    return (
+        insert(Article)
+        .values(title=title, excerpt=content[:EXCERPT_LENGTH], author_id=author_id)
+        .returning(Article.id, Article.title, Article.published, Article.version)
+    )
+
+
+def insert_articles_statement():
+    """Executed with many parameter sets (see `article_params`); returns their ids in order."""
+    return insert(Article).returning(Article.id, sort_by_parameter_order=True)
+
+
+def article_params(row: dict) -> dict:
+    """Columns of an `articles` row for a {title, content, ...} dict."""
+    params = {key: value for key, value in row.items() if key != "content"}
+    params["excerpt"] = row["content"][:EXCERPT_LENGTH]
+    return params
+
+
+def insert_bodies_statement():
+    return insert(ArticleBody)
+
+
+def body_params(article_id: int, content: str, codec: BodyCodec | None = None) -> dict:
+    encoded, dictionary_id, data = (codec or get_body_codec()).encode(content)
+    return {"article_id": article_id, "codec": encoded, "dictionary_id": dictionary_id, "data": data}
+
+
+def delete_article_statement(article_id: int):
+    # One round trip: RETURNING yields the title the search index needs, and
+    # no row means there was no such article, so nothing is selected first.
+    return delete(Article).where(Article.id == article_id).returning(Article.title)
+
+
+def delete_body_statement(article_id: int, returning: bool = False):
+    statement = delete(ArticleBody).where(ArticleBody.article_id == article_id)
+    if returning:
+        # For search indexes that unindex by value (see article_search.Unindex).
+        return statement.returning(ArticleBody.codec, ArticleBody.dictionary_id, ArticleBody.data)
+    return statement
+
+
+def articles_statement():
+    """Articles with their compressed bodies; see `stored_article`."""
+    return select(
+        Article.id,
+        Article.title,
+        Article.published,
+        Article.version,
+        ArticleBody.codec,
+        ArticleBody.dictionary_id,
+        ArticleBody.data,
+    ).outerjoin(ArticleBody, ArticleBody.article_id == Article.id)
+
+
+def dictionaries_statement(dictionary_ids=None):
+    statement = select(ArticleBodyDictionary.id, ArticleBodyDictionary.data)
+    if dictionary_ids is not None:
+        return statement.where(ArticleBodyDictionary.id.in_(dictionary_ids))
+    # Newest first: the first row is the active dictionary.
+    return statement.order_by(ArticleBodyDictionary.id.desc())
+
+
+def decode_content(codec: BodyCodec, row) -> str | None:
+    """Content of a row carrying `codec`, `dictionary_id` and `data` columns (None without a body)."""
+    return None if row.codec is None else codec.decode(row.codec, row.dictionary_id, row.data)
+
+
+def stored_article(codec: BodyCodec, row) -> StoredArticle:
+    return StoredArticle(row.id, row.title, decode_content(codec, row), row.published, row.version)
+
+
+def search_hit(codec: BodyCodec, row) -> SearchHit:
+    return SearchHit(row.id, row.title, decode_content(codec, row), row.score)
+
+
+def bump_collection_version_statement():
+    return (
+        update(CollectionVersion)
+        .where(CollectionVersion.name == ARTICLES_COLLECTION)
+        .values(version=CollectionVersion.version + 1)
+    )
+
+
+def collection_version_statement():
+    return select(CollectionVersion.version).where(CollectionVersion.name == ARTICLES_COLLECTION)
+
+
+def article_version_statement(article_id: int):
+    return select(Article.version).where(Article.id == article_id)
+
+
+@dataclass(frozen=True)
+class ArticleQuery:
+    """
+    Filters and sort order of an article listing. `created_after` is
+    inclusive and `created_before` exclusive; `title_prefix` is matched
+    case-sensitively. A `sort` of None picks the default for the filters.
+    """
+
+    published: bool | None = None
+    author_id: int | None = None
+    created_after: datetime | None = None
+    created_before: datetime | None = None
+    title_prefix: str | None = None
+    sort: str | None = None
+
+    def filter_names(self) -> frozenset:
+        names = set()
+        if self.published is not None:
+            names.add("published")
+        if self.author_id is not None:
+            names.add("author_id")
+        if self.created_after is not None or self.created_before is not None:
+            names.add("created")
+        if self.title_prefix:
+            names.add("title_prefix")
+        return frozenset(names)
+
+
+# Sort name -> (leading key column, descending). Every sort ends with `id`
+# as a tiebreaker, so (key, id) is unique and can be used as a keyset cursor.
+ARTICLE_SORTS = {
+    "id": (None, False),
+    "created_at": (Article.created_at, False),
+    "-created_at": (Article.created_at, True),
+    "title": (Article.title, False),
+}
+
+# Filter combinations a listing may use, with the sorts an index can return
+# in order (the first is the default). ix_articles_published_created_at,
+# ix_articles_author_id_created_at and ix_articles_title_id back these;
+# any other combination would scan or sort the whole table, so it is refused.
+LISTING_COMBINATIONS = {
+    frozenset(): ("id",),
+    frozenset({"published"}): ("-created_at", "created_at"),
+    frozenset({"published", "created"}): ("-created_at", "created_at"),
+    frozenset({"author_id"}): ("-created_at", "created_at"),
+    frozenset({"author_id", "created"}): ("-created_at", "created_at"),
+    frozenset({"title_prefix"}): ("title",),
+}
+
+
+def listing_sort(query: ArticleQuery) -> str | None:
+    """The effective sort of `query`, or None when the combination is not allowed."""
+    sorts = LISTING_COMBINATIONS.get(query.filter_names())
+    if sorts is None:
+        return None
+    sort = query.sort or sorts[0]
+    return sort if sort in sorts else None
+
+
+def listing_key_columns(sort: str):
+    column, _ = ARTICLE_SORTS[sort]
+    return (Article.id,) if column is None else (column, Article.id)
+
+
+def articles_page_statement(limit: int, after=None, excerpt_length: int = 200, query: ArticleQuery | None = None):
+    """
+    One keyset page of article summaries for `query`. `after` is the sort key
+    (see `listing_key_columns`) of the last row already returned; one extra
+    row is fetched so callers can tell whether another page exists.
+    """
+    query = query or ArticleQuery()
+    sort = listing_sort(query)
+    if sort is None:
+        raise ValueError(f"unsupported article listing: {sorted(query.filter_names())} by {query.sort}")
+    excerpt = func.substr(Article.excerpt, 1, excerpt_length).label("excerpt")
+    statement = select(Article.id, Article.title, Article.created_at, excerpt)
+
+    if query.published is not None:
+        statement = statement.where(Article.published == (true() if query.published else false()))
+    if query.author_id is not None:
+        statement = statement.where(Article.author_id == query.author_id)
+    if query.created_after is not None:
+        statement = statement.where(Article.created_at >= query.created_after)
+    if query.created_before is not None:
+        statement = statement.where(Article.created_at < query.created_before)
+    if query.title_prefix:
+        # A range instead of LIKE so a plain index applies. It matches exactly
+        # the titles with this prefix under a bytewise collation only: SQLite's
+        # default, and the "C" collation of articles.title on PostgreSQL.
+        statement = statement.where(
+            Article.title >= query.title_prefix, Article.title < query.title_prefix + TITLE_PREFIX_END
+        )
+
+    columns = listing_key_columns(sort)
+    descending = ARTICLE_SORTS[sort][1]
+    if after is not None:
+        key, bound = (columns[0], after[0]) if len(columns) == 1 else (tuple_(*columns), tuple_(*after))
+        statement = statement.where(key < bound if descending else key > bound)
+    order = [column.desc() if descending else column.asc() for column in columns]
+    return statement.order_by(*order).limit(limit + 1)
+
+
+def article_summaries_statement(article_ids, excerpt_length: int):
+    excerpt = func.substr(Article.excerpt, 1, excerpt_length).label("excerpt")
+    return select(Article.id, Article.title, excerpt).where(Article.id.in_(article_ids))
+
+
+def search_statement(dialect: str, query: str, limit: int, offset: int):
+    """
+    Ranked full-text search over title and content for the given dialect.
+    Each query term is matched as a prefix and all terms must be present.
+    Rows expose `id`, `title`, `score` (higher is better) and the compressed
+    body of the hit (see `search_hit`); bodies are only read for the
+    requested page. Returns None when the query has no searchable terms.
+
+    Dialects other than SQLite and PostgreSQL have no index and fall back to
+    `_search_like`, which cannot look inside compressed bodies: it only
+    matches titles and the first EXCERPT_LENGTH characters of the content.
+    The in-process index (SEARCH_INDEX_ENABLED) covers full bodies there.
+    """
+    terms = _SEARCH_TOKEN.findall(query)
+    if not terms:
+        return None
+    if dialect == "sqlite":
+        return _search_sqlite(terms, limit, offset)
+    if dialect == "postgresql":
+        return _search_postgresql(terms, limit, offset)
+    return _search_like(terms, limit, offset)
+
+
+# Joins the bodies of one page of hits, in rank order.
+_WITH_BODIES = """
+    SELECT hit.id AS id, hit.title AS title, hit.score AS score,
+           b.codec AS codec, b.dictionary_id AS dictionary_id, b.data AS data
+    FROM ({hits}) AS hit
+    LEFT JOIN article_bodies AS b ON b.article_id = hit.id
+    ORDER BY hit.score DESC, hit.id
+"""
+
+
+def _search_sqlite(terms, limit: int, offset: int):
+    match = " ".join(f'"{term}"*' for term in terms)
+    hits = f"""
+        SELECT a.id AS id, a.title AS title, -bm25({FTS_TABLE}, 10.0, 1.0) AS score
+        FROM {FTS_TABLE}
+        JOIN articles AS a ON a.id = {FTS_TABLE}.rowid
+        WHERE {FTS_TABLE} MATCH :match
+        ORDER BY bm25({FTS_TABLE}, 10.0, 1.0), a.id
+        LIMIT :limit OFFSET :offset
+    """
+    return text(_WITH_BODIES.format(hits=hits)).bindparams(match=match, limit=limit, offset=offset)
+
+
+def _search_postgresql(terms, limit: int, offset: int):
+    # Title terms carry weight A in the document, so ts_rank_cd ranks them 10x body terms.
+    hits = f"""
+        SELECT a.id AS id, a.title AS title, ts_rank_cd(f.document, q.query) AS score
+        FROM {FTS_TABLE} AS f
+        JOIN articles AS a ON a.id = f.article_id,
+             to_tsquery('simple', :tsquery) AS q(query)
+        WHERE f.document @@ q.query
+        ORDER BY score DESC, a.id
+        LIMIT :limit OFFSET :offset
+    """
+    return text(_WITH_BODIES.format(hits=hits)).bindparams(
+        tsquery=" & ".join(f"{term}:*" for term in terms), limit=limit, offset=offset
+    )
+
+
+def _search_like(terms, limit: int, offset: int):
+    # Bodies are compressed, so only titles and the inline excerpts can be
+    # matched: words further into an article are not found.
+    statement = select(
+        Article.id,
+        Article.title,
+        literal(0.0).label("score"),
+        ArticleBody.codec,
+        ArticleBody.dictionary_id,
+        ArticleBody.data,
+    ).outerjoin(ArticleBody, ArticleBody.article_id == Article.id)
+    for term in terms:
+        pattern = f"%{term}%"
+        statement = statement.where(or_(Article.title.ilike(pattern), Article.excerpt.ilike(pattern)))
+    return statement.order_by(Article.id).limit(limit).offset(offset)
 
 
 class ArticleRepository:
     def __init__(self, db: Session):
         self.db = db
 
-    def create_article(self, title: str, content: str):
-        db_article = Article(title=title, content=content)
-        self.db.add(db_article)
+    def create_article(self, title: str, content: str, author_id: int | None = None) -> StoredArticle:
+        """Insert an article with its compressed body and search index entry."""
+        article = self.db.execute(insert_article_statement(title, content, author_id)).one()
+        self.db.execute(insert_bodies_statement(), body_params(article.id, content))
+        self._index([index_params(article.id, title, content)])
+        self._bump_collection_version()
         self.db.commit()
-        self.db.refresh(db_article)
-        return db_article
+        return StoredArticle(article.id, article.title, content, article.published, article.version)
+
+    def bulk_create_articles(self, rows) -> int:
+        """
+        Insert many {title, content} dicts (other `articles` columns may be
+        included) with three executemany statements, committed together.
+        """
+        if not rows:
+            return 0
+        ids = self.db.execute(insert_articles_statement(), [article_params(row) for row in rows]).scalars().all()
+        codec = get_body_codec()
+        self.db.execute(
+            insert_bodies_statement(), [body_params(article_id, row["content"], codec) for article_id, row in zip(ids, rows)]
+        )
+        self._index([index_params(article_id, row["title"], row["content"]) for article_id, row in zip(ids, rows)])
+        self._bump_collection_version()
+        self.db.commit()
+        return len(rows)
+
+    def get_articles(self) -> List[StoredArticle]:
+        rows = self.db.execute(articles_statement().order_by(Article.id)).all()
+        codec = self._codec_for(rows)
+        return [stored_article(codec, row) for row in rows]
+
+    def get_articles_page(self, limit: int, after=None, excerpt_length: int = 200, query: ArticleQuery | None = None):
+        """
+        Keyset page of article summaries matching `query`, in its sort order;
+        see `articles_page_statement`. Only the inline excerpt is read, never
+        the body.
+        """
+        return self.db.execute(articles_page_statement(limit, after, excerpt_length, query)).all()
+
+    def get_article_summaries(self, article_ids, excerpt_length: int = 200):
+        """Summary rows (id, title, excerpt) for the given ids, in no particular order."""
+        if not article_ids:
+            return []
+        return self.db.execute(article_summaries_statement(article_ids, excerpt_length)).all()
 
-    def get_articles(self):
-        return self.db.query(Article).all()
+    def iter_articles(self, batch_size: int = 1000):
+        """Stream StoredArticles in id order without materializing the table."""
+        statement = articles_statement().order_by(Article.id).execution_options(yield_per=batch_size)
+        for rows in self.db.execute(statement).partitions():
+            codec = self._codec_for(rows)
+            for row in rows:
+                yield stored_article(codec, row)
 
-    def get_article_by_id(self, article_id: int):
-        return self.db.query(Article).filter(Article.id == article_id).first()
+    def get_article_by_id(self, article_id: int) -> StoredArticle | None:
+        row = self.db.execute(articles_statement().where(Article.id == article_id)).first()
+        return None if row is None else stored_article(self._codec_for([row]), row)
+
+    def get_articles_by_ids(self, article_ids) -> List[StoredArticle]:
+        """Articles with the given ids, in no particular order, read with one query."""
+        if not article_ids:
+            return []
+        rows = self.db.execute(articles_statement().where(Article.id.in_(article_ids))).all()
+        codec = self._codec_for(rows)
+        return [stored_article(codec, row) for row in rows]
 
     def delete_article(self, article_id: int) -> bool:
-        article = self.get_article_by_id(article_id)
-        if not article:
+        """
+        Delete an article with its body and search index entry. The body is
+        only read back when the index must be given the indexed text, i.e.
+        on SQLite older than 3.43 (see article_search.Unindex).
+        """
+        unindex = get_unindex(self.db.connection())
+        # The body goes first: were foreign keys enforced, deleting the
+        # article would cascade to it before its text could be unindexed.
+        deleted = self.db.execute(delete_body_statement(article_id, returning=unindex.needs_content))
+        body = deleted.first() if unindex.needs_content else None
+        article = self.db.execute(delete_article_statement(article_id)).first()
+        if article is None:
+            self.db.rollback()
             return False
-        self.db.delete(article)
+        if unindex.statement is not None:
+            content = None if body is None else decode_content(self._codec_for([body]), body)
+            self.db.execute(unindex.statement, index_params(article_id, article.title, content))
+        self._bump_collection_version()
         self.db.commit()
         return True
 
-    def search_articles(self, query: str):
-        """Return articles whose title or content matches the query."""
-        pattern = f"%{query}%"
-        return (
-            self.db.query(Article)
-            .filter(or_(Article.title.ilike(pattern), Article.content.ilike(pattern)))
-            .all()
-        )
+    def get_article_version(self, article_id: int) -> int | None:
+        """The article's version without loading its content."""
+        return self.db.execute(article_version_statement(article_id)).scalar()
+
+    def get_collection_version(self) -> int:
+        return self.db.execute(collection_version_statement()).scalar() or 0
+
+    def activate_latest_dictionary(self) -> int | None:
+        """Compress new bodies with the newest stored dictionary, if there is one; returns its id."""
+        row = self.db.execute(dictionaries_statement().limit(1)).first()
+        if row is None:
+            return None
+        get_body_codec().add_dictionary(row.id, row.data, activate=True)
+        return row.id
+
+    def add_body_dictionary(self, data: bytes) -> int:
+        """Store a trained dictionary and compress new bodies with it; returns its id."""
+        dictionary_id = self.db.execute(
+            insert(ArticleBodyDictionary).values(data=data).returning(ArticleBodyDictionary.id)
+        ).scalar_one()
+        self.db.commit()
+        get_body_codec().add_dictionary(dictionary_id, data, activate=True)
+        return dictionary_id
+
+    def recompress_bodies(self, batch_size: int = 1000) -> int:
+        """
+        Re-encode stored bodies with the current codec and active dictionary,
+        one committed batch at a time; returns how many were rewritten. The
+        content is unchanged, so neither versions nor caches are touched.
+        """
+        rewritten = 0
+        last_id = 0
+        while True:
+            rows = self.db.execute(
+                select(ArticleBody.article_id, ArticleBody.codec, ArticleBody.dictionary_id, ArticleBody.data)
+                .where(ArticleBody.article_id > last_id)
+                .order_by(ArticleBody.article_id)
+                .limit(batch_size)
+            ).all()
+            if not rows:
+                return rewritten
+            codec = self._codec_for(rows)
+            params = []
+            for row in rows:
+                encoded = codec.encode(decode_content(codec, row))
+                if encoded != (row.codec, row.dictionary_id, row.data):
+                    name, dictionary_id, data = encoded
+                    params.append({"article_id": row.article_id, "codec": name, "dictionary_id": dictionary_id, "data": data})
+            if params:
+                # Bulk UPDATE by primary key: one executemany per batch.
+                self.db.execute(update(ArticleBody), params)
+                self.db.commit()
+                rewritten += len(params)
+            last_id = rows[-1].article_id
+
+    def _bump_collection_version(self) -> None:
+        if self.db.execute(bump_collection_version_statement()).rowcount == 0:
+            self.db.add(CollectionVersion(name=ARTICLES_COLLECTION, version=1))
+
+    def _codec_for(self, rows: Iterable) -> BodyCodec:
+        """The body codec, with every dictionary `rows` were compressed with loaded."""
+        codec = get_body_codec()
+        missing = codec.missing_dictionaries(row.dictionary_id for row in rows)
+        if missing:
+            for dictionary in self.db.execute(dictionaries_statement(missing)):
+                codec.add_dictionary(dictionary.id, dictionary.data)
+        return codec
+
+    def _index(self, params: List[dict]) -> None:
+        statement = index_statement(self.db.get_bind().dialect.name)
+        if statement is not None and params:
+            self.db.execute(statement, params)
+
+    def search_articles(self, query: str, limit: int = 20, offset: int = 0) -> List[SearchHit]:
+        """Ranked full-text search with the content of each hit; see `search_statement`."""
+        statement = search_statement(self.db.get_bind().dialect.name, query, limit, offset)
+        if statement is None:
+            return []
+        rows = self.db.execute(statement).all()
+        codec = self._codec_for(rows)
+        return [search_hit(codec, row) for row in rows]
@@ -0,0 +1,123 @@
+from typing import Iterable, List
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.core.body_codec import BodyCodec, get_body_codec
+from backend.models.article import Article
+from backend.models.article_search import get_unindex, index_params, index_statement
+from backend.models.collection_version import CollectionVersion
+from backend.repositories.article_repository import (
+    ARTICLES_COLLECTION,
+    ArticleQuery,
+    SearchHit,
+    StoredArticle,
+    article_summaries_statement,
+    article_version_statement,
+    articles_page_statement,
+    articles_statement,
+    body_params,
+    bump_collection_version_statement,
+    collection_version_statement,
+    decode_content,
+    delete_article_statement,
+    delete_body_statement,
+    dictionaries_statement,
+    insert_article_statement,
+    insert_bodies_statement,
+    search_hit,
+    search_statement,
+    stored_article,
+)
+
+
+class AsyncArticleRepository:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def create_article(self, title: str, content: str, author_id: int | None = None) -> StoredArticle:
+        article = (await self.db.execute(insert_article_statement(title, content, author_id))).one()
+        await self.db.execute(insert_bodies_statement(), body_params(article.id, content))
+        await self._index([index_params(article.id, title, content)])
+        await self._bump_collection_version()
+        await self.db.commit()
+        return StoredArticle(article.id, article.title, content, article.published, article.version)
+
+    async def get_articles(self) -> List[StoredArticle]:
+        rows = (await self.db.execute(articles_statement().order_by(Article.id))).all()
+        codec = await self._codec_for(rows)
+        return [stored_article(codec, row) for row in rows]
+
+    async def get_articles_page(
+        self, limit: int, after=None, excerpt_length: int = 200, query: ArticleQuery | None = None
+    ):
+        return (await self.db.execute(articles_page_statement(limit, after, excerpt_length, query))).all()
+
+    async def get_article_summaries(self, article_ids, excerpt_length: int = 200):
+        if not article_ids:
+            return []
+        return (await self.db.execute(article_summaries_statement(article_ids, excerpt_length))).all()
+
+    async def iter_articles(self, batch_size: int = 1000):
+        statement = articles_statement().order_by(Article.id).execution_options(yield_per=batch_size)
+        result = await self.db.stream(statement)
+        async for rows in result.partitions():
+            codec = await self._codec_for(rows)
+            for row in rows:
+                yield stored_article(codec, row)
+
+    async def get_article_by_id(self, article_id: int) -> StoredArticle | None:
+        row = (await self.db.execute(articles_statement().where(Article.id == article_id))).first()
+        return None if row is None else stored_article(await self._codec_for([row]), row)
+
+    async def get_articles_by_ids(self, article_ids) -> List[StoredArticle]:
+        if not article_ids:
+            return []
+        rows = (await self.db.execute(articles_statement().where(Article.id.in_(article_ids)))).all()
+        codec = await self._codec_for(rows)
+        return [stored_article(codec, row) for row in rows]
+
+    async def delete_article(self, article_id: int) -> bool:
+        unindex = await self.db.run_sync(lambda session: get_unindex(session.connection()))
+        deleted = await self.db.execute(delete_body_statement(article_id, returning=unindex.needs_content))
+        body = deleted.first() if unindex.needs_content else None
+        article = (await self.db.execute(delete_article_statement(article_id))).first()
+        if article is None:
+            await self.db.rollback()
+            return False
+        if unindex.statement is not None:
+            content = None if body is None else decode_content(await self._codec_for([body]), body)
+            await self.db.execute(unindex.statement, index_params(article_id, article.title, content))
+        await self._bump_collection_version()
+        await self.db.commit()
+        return True
+
+    async def get_article_version(self, article_id: int) -> int | None:
+        return (await self.db.execute(article_version_statement(article_id))).scalar()
+
+    async def get_collection_version(self) -> int:
+        return (await self.db.execute(collection_version_statement())).scalar() or 0
+
+    async def _bump_collection_version(self) -> None:
+        if (await self.db.execute(bump_collection_version_statement())).rowcount == 0:
+            self.db.add(CollectionVersion(name=ARTICLES_COLLECTION, version=1))
+
+    async def _codec_for(self, rows: Iterable) -> BodyCodec:
+        codec = get_body_codec()
+        missing = codec.missing_dictionaries(row.dictionary_id for row in rows)
+        if missing:
+            for dictionary in await self.db.execute(dictionaries_statement(missing)):
+                codec.add_dictionary(dictionary.id, dictionary.data)
+        return codec
+
+    async def _index(self, params: List[dict]) -> None:
+        statement = index_statement(self.db.get_bind().dialect.name)
+        if statement is not None and params:
+            await self.db.execute(statement, params)
+
+    async def search_articles(self, query: str, limit: int = 20, offset: int = 0) -> List[SearchHit]:
+        statement = search_statement(self.db.get_bind().dialect.name, query, limit, offset)
+        if statement is None:
+            return []
+        rows = (await self.db.execute(statement)).all()
+        codec = await self._codec_for(rows)
+        return [search_hit(codec, row) for row in rows]
@@ -0,0 +1,56 @@
+from datetime import datetime
+
+from sqlalchemy import select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.models.user import User
+from backend.repositories.auth_repository import (
+    insert_user_statement,
+    is_revoked_statement,
+    revocations_since_statement,
+    revoke_token_statement,
+    use_refresh_token_statement,
+)
+
+
+class AsyncAuthRepository:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def get_by_email(self, email: str) -> User | None:
+        return (await self.db.execute(select(User).where(User.email == email))).scalars().first()
+
+    async def get_by_id(self, user_id: int) -> User | None:
+        return (await self.db.execute(select(User).where(User.id == user_id))).scalars().first()
+
+    async def create_user(self, email: str, full_name: str | None, hashed_password: str):
+        user = (await self.db.execute(insert_user_statement(email, full_name, hashed_password))).one()
+        await self.db.commit()
+        return user
+
+    async def set_active(self, user_id: int, is_active: bool) -> bool:
+        result = await self.db.execute(update(User).where(User.id == user_id).values(is_active=is_active))
+        await self.db.commit()
+        return result.rowcount > 0
+
+    async def revoke_token(self, token_id: str, user_id: int | None, expires_at: datetime) -> bool:
+        return await self._insert_once(revoke_token_statement(token_id, user_id, expires_at))
+
+    async def use_refresh_token(self, token_id: str, user_id: int | None, expires_at: datetime) -> bool:
+        return await self._insert_once(use_refresh_token_statement(token_id, user_id, expires_at))
+
+    async def _insert_once(self, statement) -> bool:
+        try:
+            await self.db.execute(statement)
+            await self.db.commit()
+        except IntegrityError:
+            await self.db.rollback()
+            return False
+        return True
+
+    async def is_revoked(self, token_id: str) -> bool:
+        return (await self.db.execute(is_revoked_statement(token_id))).first() is not None
+
+    async def revocations_since(self, last_id: int):
+        return (await self.db.execute(revocations_since_statement(last_id, datetime.utcnow()))).all()
@@ -1,8 +1,50 @@
+from datetime import datetime
+
+from sqlalchemy import delete, insert, select
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
+from backend.models.revoked_token import RevokedToken
+from backend.models.used_refresh_token import UsedRefreshToken
 from backend.models.user import User
 
 
+def insert_user_statement(email: str, full_name: str | None, hashed_password: str):
+    return (
+        insert(User)
+        .values(email=email, full_name=full_name, hashed_password=hashed_password)
+        .returning(*User.__table__.columns)
+    )
+
+
+def revoke_token_statement(token_id: str, user_id: int | None, expires_at: datetime):
+    return insert(RevokedToken).values(token_id=token_id, user_id=user_id, expires_at=expires_at)
+
+
+def use_refresh_token_statement(token_id: str, user_id: int | None, expires_at: datetime):
+    return insert(UsedRefreshToken).values(token_id=token_id, user_id=user_id, expires_at=expires_at)
+
+
+def is_revoked_statement(token_id: str):
+    return select(RevokedToken.id).where(RevokedToken.token_id == token_id)
+
+
+def revocations_since_statement(last_id: int, now: datetime):
+    """(id, token_id) of unexpired revocations after `last_id`, in id order."""
+    return (
+        select(RevokedToken.id, RevokedToken.token_id)
+        .where(RevokedToken.id > last_id, RevokedToken.expires_at > now)
+        .order_by(RevokedToken.id)
+    )
+
+
+def prune_revocations_statements(now: datetime):
+    return (
+        delete(RevokedToken).where(RevokedToken.expires_at <= now),
+        delete(UsedRefreshToken).where(UsedRefreshToken.expires_at <= now),
+    )
+
+
 class AuthRepository:
     def __init__(self, db: Session):
         self.db = db
@@ -13,9 +55,43 @@ class AuthRepository:
     def get_by_id(self, user_id: int) -> User | None:
         return self.db.query(User).filter(User.id == user_id).first()
 
-    def create_user(self, email: str, full_name: str | None, hashed_password: str) -> User:
-        user = User(email=email, full_name=full_name, hashed_password=hashed_password)
-        self.db.add(user)
+    def create_user(self, email: str, full_name: str | None, hashed_password: str):
+        """Insert a user and return the stored row, read back through RETURNING."""
+        user = self.db.execute(insert_user_statement(email, full_name, hashed_password)).one()
         self.db.commit()
-        self.db.refresh(user)
         return user
+
+    def set_active(self, user_id: int, is_active: bool) -> bool:
+        updated = self.db.query(User).filter(User.id == user_id).update({User.is_active: is_active})
+        self.db.commit()
+        return updated > 0
+
+    def revoke_token(self, token_id: str, user_id: int | None, expires_at: datetime) -> bool:
+        """Record `token_id` as revoked; False when it already was."""
+        return self._insert_once(revoke_token_statement(token_id, user_id, expires_at))
+
+    def use_refresh_token(self, token_id: str, user_id: int | None, expires_at: datetime) -> bool:
+        """Record refresh token `token_id` as used; False when it already was."""
+        return self._insert_once(use_refresh_token_statement(token_id, user_id, expires_at))
+
+    def _insert_once(self, statement) -> bool:
+        try:
+            self.db.execute(statement)
+            self.db.commit()
+        except IntegrityError:
+            self.db.rollback()
+            return False
+        return True
+
+    def is_revoked(self, token_id: str) -> bool:
+        return self.db.execute(is_revoked_statement(token_id)).first() is not None
+
+    def revocations_since(self, last_id: int):
+        return self.db.execute(revocations_since_statement(last_id, datetime.utcnow())).all()
+
+    def prune_revocations(self) -> int:
+        """Delete revocations and used refresh tokens that have expired; returns how many."""
+        now = datetime.utcnow()
+        deleted = sum(self.db.execute(statement).rowcount for statement in prune_revocations_statements(now))
+        self.db.commit()
+        return deleted
@@ -1,3 +1,6 @@
+from datetime import datetime
+from typing import List
+
 from pydantic import BaseModel, ConfigDict
 
 
@@ -14,3 +17,42 @@ class ArticleResponse(BaseModel):
     content: str
 
     model_config = ConfigDict(from_attributes=True)
+
+
+class ArticleBatch(BaseModel):
+    items: List[ArticleResponse]
+    missing: List[int]
+
+
+class ArticleSummary(BaseModel):
+    id: int
+    title: str
+    excerpt: str
+    created_at: datetime | None = None
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class ArticlePage(BaseModel):
+    items: List[ArticleSummary]
+    limit: int
+    next_cursor: str | None = None
+
+
+class ArticleSearchResult(BaseModel):
+    id: int
+    title: str
+    snippet: str
+    score: float
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class ArticleImportResult(BaseModel):
+    imported: int
+    failed: int
+    batches: int
+    elapsed_seconds: float
+    rows_per_second: float
+    # Where the rejected lines can be downloaded, when there were any
+    error_url: str | None = None
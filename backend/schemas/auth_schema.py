@@ -43,3 +43,7 @@ class TokenPayload(BaseModel):
     exp: int
     type: str
     csrf: str
+    # Session (token family) shared by every token rotated from one login,
+    # and the id of a refresh token. Absent from tokens issued before rotation.
+    fam: str | None = None
+    jti: str | None = None
@@ -1,5 +1,9 @@
-from backend.core.database import Base, SessionLocal, engine
+from sqlalchemy import exists, select
+from sqlalchemy.orm import Session
+
+from backend.core.database import engine
 from backend.models.article import Article
+from backend.models.schema import create_schema
 
 SEED_ARTICLES = [
     {
@@ -35,18 +39,21 @@ SEED_ARTICLES = [
 ]
 
 
-def seed():
-    """Create tables and seed default articles if the table is empty."""
-    Base.metadata.create_all(bind=engine)
-    db = SessionLocal()
-    try:
-        if db.query(Article).count() > 0:
-            return
+def seed_articles(db_engine) -> bool:
+    """Seed default articles if the table is empty; returns whether it did."""
+    with Session(db_engine) as db:
+        if db.execute(select(exists().select_from(Article))).scalar():
+            return False
         for item in SEED_ARTICLES:
             db.add(Article(id=item["id"], title=item["title"], content=item["content"]))
         db.commit()
-    finally:
-        db.close()
+        return True
+
+
+def seed():
+    """Create tables and seed default articles if the table is empty."""
+    create_schema(engine)
+    seed_articles(engine)
 
 
 if __name__ == "__main__":
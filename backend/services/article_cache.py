@@ -0,0 +1,328 @@
+import asyncio
+import random
+import threading
+import weakref
+from abc import ABC, abstractmethod
+from functools import lru_cache
+from typing import Awaitable, Callable, Dict, Iterable, List, Tuple
+
+from backend.core.cache import TTLCache
+from backend.core.compression import available_encodings, compress
+from backend.core.config import Config
+from backend.core.serialization import dumps
+from backend.core.shared_state import SharedCounters, get_shared_counters
+from backend.schemas.article import ArticleResponse
+
+CachedArticle = Tuple[ArticleResponse, str]
+# Serialized ArticleResponse JSON, its ETag and its Content-Encoding (None
+# for plain JSON), ready to send as-is.
+RawArticle = Tuple[bytes, str, str | None]
+IDENTITY = "identity"
+
+
+class CacheBackend(ABC):
+    """Byte store behind ArticleCache. Implementations must be safe to share between threads."""
+
+    @abstractmethod
+    def get(self, key: str) -> bytes | None: ...
+
+    @abstractmethod
+    def set(self, key: str, value: bytes, ttl: float) -> None: ...
+
+    @abstractmethod
+    def delete(self, key: str) -> None: ...
+
+    def get_many(self, keys: List[str]) -> List[bytes | None]:
+        """Values of `keys`, in order. Backends with a multi-key read override this."""
+        return [self.get(key) for key in keys]
+
+
+class InProcessCacheBackend(CacheBackend):
+    def __init__(self, max_size: int, ttl: float):
+        self._cache = TTLCache(max_size=max_size, ttl=ttl)
+
+    def get(self, key: str) -> bytes | None:
+        return self._cache.get(key)
+
+    def set(self, key: str, value: bytes, ttl: float) -> None:
+        self._cache.set(key, value, ttl=ttl)
+
+    def delete(self, key: str) -> None:
+        self._cache.delete(key)
+
+
+class RedisCacheBackend(CacheBackend):
+    """Shared backend for several processes or hosts. Needs the optional `redis` package."""
+
+    def __init__(self, url: str, prefix: str = "blogs:"):
+        try:
+            import redis
+        except ImportError as exc:
+            raise RuntimeError("ARTICLE_CACHE_BACKEND=redis requires the 'redis' package") from exc
+        self._client = redis.Redis.from_url(url)
+        self._prefix = prefix
+
+    def get(self, key: str) -> bytes | None:
+        return self._client.get(self._prefix + key)
+
+    def get_many(self, keys: List[str]) -> List[bytes | None]:
+        return self._client.mget([self._prefix + key for key in keys]) if keys else []
+
+    def set(self, key: str, value: bytes, ttl: float) -> None:
+        self._client.set(self._prefix + key, value, px=int(ttl * 1000))
+
+    def delete(self, key: str) -> None:
+        self._client.delete(self._prefix + key)
+
+
+class ArticleCache:
+    """
+    Read-through cache of serialized articles. Entries are the article's
+    ETag and its ArticleResponse JSON, so a hit can answer both a full read
+    (sending the stored bytes unchanged) and a conditional one. Entries
+    stored by `put`, when an article is written, also hold the JSON
+    compressed with each of `encodings` at high levels, so compressed reads
+    of them never compress again. Entries loaded on a miss hold the JSON
+    only: compressing at those levels costs milliseconds per entry, which a
+    read must not wait for (under the load lock, or for a whole batch), so
+    responses from them are compressed on the way out instead. Concurrent
+    misses for the same article are collapsed into a single load per process,
+    and TTLs are jittered so hot keys written together do not expire together.
+
+    With `epochs`, keys carry the article's shared counter, which
+    `invalidate` bumps: a write in one worker moves every worker's
+    in-process copy out of reach. A load that races a write stores under the
+    key it started with, which is already stale, so it is never served.
+    """
+
+    def __init__(
+        self,
+        backend: CacheBackend,
+        ttl: float,
+        jitter: float = 0.1,
+        epochs: SharedCounters | None = None,
+        encodings: Iterable[str] = (),
+    ):
+        self.backend = backend
+        self.ttl = ttl
+        self.jitter = jitter
+        self.epochs = epochs
+        self.encodings = available_encodings(encodings)
+        self.hits = 0
+        self.misses = 0
+        self.loads = 0
+        self._locks: "weakref.WeakValueDictionary[str, threading.Lock]" = weakref.WeakValueDictionary()
+        self._async_locks: "weakref.WeakValueDictionary[str, asyncio.Lock]" = weakref.WeakValueDictionary()
+        self._locks_guard = threading.Lock()
+
+    @staticmethod
+    def key(article_id: int) -> str:
+        return f"article:{article_id}"
+
+    @staticmethod
+    def encode(article: ArticleResponse, etag: str, encodings: Iterable[str] = ()) -> bytes:
+        """
+        `etag`, an index line such as `identity:812 br:301`, then the
+        sections it lists back to back: the JSON and its compressed copies.
+        """
+        body = dumps(article)
+        sections = [(IDENTITY, body)]
+        for encoding in encodings:
+            compressed = compress(body, encoding, stored=True)
+            # Short articles can grow when compressed; those are served as JSON.
+            if len(compressed) < len(body):
+                sections.append((encoding, compressed))
+        index = " ".join(f"{name}:{len(data)}" for name, data in sections)
+        return b"".join([etag.encode(), b"\n", index.encode(), b"\n", *(data for _, data in sections)])
+
+    @staticmethod
+    def split(value: bytes, encoding: str | None = None) -> RawArticle:
+        """The section for `encoding` when the entry has one, else the plain JSON."""
+        etag, _, rest = value.partition(b"\n")
+        if not rest.startswith(b"identity:"):  # stored before entries had an index
+            return rest, etag.decode(), None
+        index, _, payload = rest.partition(b"\n")
+        offset = 0
+        for section in index.decode().split(" "):
+            name, _, length = section.partition(":")
+            end = offset + int(length)
+            if name == encoding:
+                return payload[offset:end], etag.decode(), encoding
+            if name == IDENTITY:
+                identity = payload[offset:end]
+            offset = end
+        return identity, etag.decode(), None
+
+    @staticmethod
+    def parse(raw: RawArticle | None) -> CachedArticle | None:
+        if raw is None:
+            return None
+        body, etag, _ = raw
+        return ArticleResponse.model_validate_json(body), etag
+
+    def _current_key(self, article_id: int) -> str:
+        if self.epochs is None:
+            return self.key(article_id)
+        return f"{self.key(article_id)}@{self.epochs.get(article_id)}"
+
+    def peek_raw(self, article_id: int, encoding: str | None = None) -> RawArticle | None:
+        return self._peek_key(self._current_key(article_id), encoding)
+
+    def _peek_key(self, key: str, encoding: str | None) -> RawArticle | None:
+        value = self.backend.get(key)
+        if value is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return self.split(value, encoding)
+
+    def peek(self, article_id: int) -> CachedArticle | None:
+        return self.parse(self.peek_raw(article_id))
+
+    def get_or_load_raw(
+        self, article_id: int, loader: Callable[[], CachedArticle | None], encoding: str | None = None
+    ) -> RawArticle | None:
+        """
+        Serialized body and ETag, loading and encoding the article on a miss.
+        The body is the copy compressed with `encoding` when the entry has one.
+        """
+        key = self._current_key(article_id)
+        cached = self._peek_key(key, encoding)
+        if cached is not None:
+            return cached
+        with self._lock_for(key, self._locks, threading.Lock):
+            value = self.backend.get(key)
+            if value is None:
+                value = self._store(key, loader())
+            return None if value is None else self.split(value, encoding)
+
+    def get_or_load(self, article_id: int, loader: Callable[[], CachedArticle | None]) -> CachedArticle | None:
+        return self.parse(self.get_or_load_raw(article_id, loader))
+
+    async def aget_or_load_raw(
+        self,
+        article_id: int,
+        loader: Callable[[], Awaitable[CachedArticle | None]],
+        encoding: str | None = None,
+    ) -> RawArticle | None:
+        key = self._current_key(article_id)
+        cached = self._peek_key(key, encoding)
+        if cached is not None:
+            return cached
+        async with self._lock_for(key, self._async_locks, asyncio.Lock):
+            value = self.backend.get(key)
+            if value is None:
+                value = self._store(key, await loader())
+            return None if value is None else self.split(value, encoding)
+
+    async def aget_or_load(
+        self, article_id: int, loader: Callable[[], Awaitable[CachedArticle | None]]
+    ) -> CachedArticle | None:
+        return self.parse(await self.aget_or_load_raw(article_id, loader))
+
+    def get_many_raw(
+        self, article_ids: List[int], loader: Callable[[List[int]], Dict[int, CachedArticle]]
+    ) -> Dict[int, RawArticle]:
+        """
+        Plain JSON entries of `article_ids`, keyed by id and without the ids
+        that do not exist. Hits are read with one backend call and the misses
+        loaded by one `loader` call. Misses are stored as plain JSON, so a
+        cold batch does no compression. Unlike single reads, concurrent
+        misses are not collapsed, so a batch never waits on a lock per article.
+        """
+        keys = {article_id: self._current_key(article_id) for article_id in article_ids}
+        found = self._peek_many(keys)
+        missing = [article_id for article_id in keys if article_id not in found]
+        if missing:
+            self._store_many(keys, loader(missing), missing, found)
+        return found
+
+    async def aget_many_raw(
+        self, article_ids: List[int], loader: Callable[[List[int]], Awaitable[Dict[int, CachedArticle]]]
+    ) -> Dict[int, RawArticle]:
+        keys = {article_id: self._current_key(article_id) for article_id in article_ids}
+        found = self._peek_many(keys)
+        missing = [article_id for article_id in keys if article_id not in found]
+        if missing:
+            self._store_many(keys, await loader(missing), missing, found)
+        return found
+
+    def _peek_many(self, keys: Dict[int, str]) -> Dict[int, RawArticle]:
+        found = {}
+        for article_id, value in zip(keys, self.backend.get_many(list(keys.values()))):
+            if value is not None:
+                found[article_id] = self.split(value)
+        self.hits += len(found)
+        self.misses += len(keys) - len(found)
+        return found
+
+    def _store_many(
+        self, keys: Dict[int, str], loaded: Dict[int, CachedArticle], missing: List[int], found: Dict[int, RawArticle]
+    ) -> None:
+        for article_id in missing:
+            value = self._store(keys[article_id], loaded.get(article_id))
+            if value is not None:
+                found[article_id] = self.split(value)
+
+    def put(self, article_id: int, article: ArticleResponse, etag: str) -> None:
+        """
+        Replace the article's entry, e.g. right after a write, so the first
+        read is already a hit with its compressed copies in place. This
+        compresses at high levels: from an event loop, run it in a thread.
+        """
+        self.invalidate(article_id)
+        self._store(self._current_key(article_id), (article, etag), count_load=False, precompress=True)
+
+    def invalidate(self, article_id: int) -> None:
+        self.backend.delete(self._current_key(article_id))
+        if self.epochs is not None:
+            self.epochs.bump(article_id)
+
+    def stats(self) -> Dict[str, float]:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "loads": self.loads,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+        }
+
+    def _store(
+        self, key: str, loaded: CachedArticle | None, count_load: bool = True, precompress: bool = False
+    ) -> bytes | None:
+        if count_load:
+            self.loads += 1
+        if loaded is None:
+            return None
+        value = self.encode(*loaded, encodings=self.encodings if precompress else ())
+        ttl = self.ttl * (1 + random.uniform(-self.jitter, self.jitter))
+        self.backend.set(key, value, ttl)
+        return value
+
+    def _lock_for(self, key: str, locks: weakref.WeakValueDictionary, factory):
+        with self._locks_guard:
+            lock = locks.get(key)
+            if lock is None:
+                lock = locks[key] = factory()
+            return lock
+
+
+@lru_cache(maxsize=None)
+def get_article_cache() -> ArticleCache | None:
+    if Config.ARTICLE_CACHE_BACKEND == "memory":
+        # Each worker holds its own copy, so writes must reach the others.
+        backend = InProcessCacheBackend(max_size=Config.ARTICLE_CACHE_SIZE, ttl=Config.ARTICLE_CACHE_TTL_SECONDS)
+        return ArticleCache(
+            backend,
+            ttl=Config.ARTICLE_CACHE_TTL_SECONDS,
+            epochs=get_shared_counters("articles"),
+            encodings=Config.ARTICLE_PRECOMPRESS,
+        )
+    if Config.ARTICLE_CACHE_BACKEND == "redis":
+        # Already shared: deleting the key is seen by every worker and host.
+        return ArticleCache(
+            RedisCacheBackend(Config.ARTICLE_CACHE_REDIS_URL),
+            ttl=Config.ARTICLE_CACHE_TTL_SECONDS,
+            encodings=Config.ARTICLE_PRECOMPRESS,
+        )
+    return None
@@ -0,0 +1,95 @@
+import csv
+import io
+import json
+import zlib
+from typing import AsyncIterable, AsyncIterator, Iterable, Iterator
+
+EXPORT_MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+EXPORT_COLUMNS = ("id", "title", "content", "published")
+CHUNK_SIZE = 64 * 1024
+
+
+class _ChunkEncoder:
+    """
+    Encodes rows one at a time as NDJSON or CSV and groups the bytes into
+    chunks (see export_chunks); shared by the sync and async row streams.
+    """
+
+    def __init__(self, fmt: str, gzip: bool, chunk_size: int):
+        self.fmt = fmt
+        self.chunk_size = chunk_size
+        self.compressor = zlib.compressobj(wbits=31) if gzip else None
+        self.pending: list[bytes] = []
+        self.pending_size = 0
+        self.first = True
+        self.buffer = io.StringIO()
+        self.writer = csv.writer(self.buffer)
+        if fmt == "csv":
+            # Goes out with the first row, or on its own from finish().
+            self.writer.writerow(EXPORT_COLUMNS)
+
+    def _line(self, row) -> str:
+        if self.fmt == "ndjson":
+            return json.dumps(
+                {"id": row.id, "title": row.title, "content": row.content, "published": row.published},
+                ensure_ascii=False,
+            ) + "\n"
+        self.writer.writerow((row.id, row.title, row.content, row.published))
+        line = self.buffer.getvalue()
+        self.buffer.seek(0)
+        self.buffer.truncate()
+        return line
+
+    def add(self, row) -> bytes:
+        """The next chunk once enough rows are pending, else b""."""
+        data = self._line(row).encode()
+        self.pending.append(data)
+        self.pending_size += len(data)
+        if not (self.first or self.pending_size >= self.chunk_size):
+            return b""
+        chunk = b"".join(self.pending)
+        if self.compressor is not None:
+            flush = zlib.Z_SYNC_FLUSH if self.first else zlib.Z_NO_FLUSH
+            chunk = self.compressor.compress(chunk) + self.compressor.flush(flush)
+        self.pending, self.pending_size, self.first = [], 0, False
+        return chunk
+
+    def finish(self) -> bytes:
+        chunk = b"".join(self.pending) + self.buffer.getvalue().encode()
+        if self.compressor is not None:
+            chunk = self.compressor.compress(chunk) + self.compressor.flush()
+        return chunk
+
+
+def export_chunks(rows: Iterable, fmt: str, gzip: bool = False, chunk_size: int = CHUNK_SIZE) -> Iterator[bytes]:
+    """
+    Encode a row stream as NDJSON or CSV bytes, optionally gzipped. The first
+    record is emitted on its own so consumers get a byte immediately; after
+    that output is grouped into roughly `chunk_size` pieces. Only one chunk
+    is held in memory at a time.
+    """
+    encoder = _ChunkEncoder(fmt, gzip, chunk_size)
+    for row in rows:
+        chunk = encoder.add(row)
+        if chunk:
+            yield chunk
+    chunk = encoder.finish()
+    if chunk:
+        yield chunk
+
+
+async def aexport_chunks(
+    rows: AsyncIterable, fmt: str, gzip: bool = False, chunk_size: int = CHUNK_SIZE
+) -> AsyncIterator[bytes]:
+    """export_chunks over an async row stream, such as AsyncArticleRepository.iter_articles()."""
+    encoder = _ChunkEncoder(fmt, gzip, chunk_size)
+    async for row in rows:
+        chunk = encoder.add(row)
+        if chunk:
+            yield chunk
+    chunk = encoder.finish()
+    if chunk:
+        yield chunk
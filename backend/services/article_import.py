@@ -0,0 +1,155 @@
+import json
+import logging
+import os
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Callable, Iterable, List, TextIO
+
+from pydantic import ValidationError
+from sqlalchemy.exc import SQLAlchemyError
+
+from backend.repositories.article_repository import ArticleRepository
+from backend.schemas.article import ArticleCreate
+from backend.services.search_index import ArticleSearchEngine
+
+logger = logging.getLogger(__name__)
+
+# How much of a rejected oversized line is kept in its error record.
+OVERSIZED_RAW_BYTES = 200
+
+
+@dataclass
+class ImportReport:
+    imported: int = 0
+    failed: int = 0
+    batches: int = 0
+    started_at: float = field(default_factory=time.perf_counter)
+
+    @property
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.started_at
+
+    @property
+    def rows_per_second(self) -> float:
+        elapsed = self.elapsed
+        return self.imported / elapsed if elapsed else 0.0
+
+    def to_dict(self) -> dict:
+        data = asdict(self)
+        del data["started_at"]
+        data["elapsed_seconds"] = round(self.elapsed, 3)
+        data["rows_per_second"] = round(self.rows_per_second, 1)
+        return data
+
+
+class OversizedLine:
+    """
+    Stands in for an input line over the reader's length limit, which is
+    skipped rather than buffered; `head` is its start, for the error record.
+    """
+
+    def __init__(self, head: bytes, limit: int):
+        self.head = head[:OVERSIZED_RAW_BYTES]
+        self.limit = limit
+
+
+class ErrorFile:
+    """Text sink that only creates its file once the first rejected row arrives."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file: TextIO | None = None
+
+    @property
+    def used(self) -> bool:
+        return self._file is not None
+
+    def write(self, data: str) -> None:
+        if self._file is None:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            self._file = open(self.path, "w", encoding="utf-8")
+        self._file.write(data)
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+
+
+class ArticleImporter:
+    """
+    Streams NDJSON article lines into the database in batches of
+    `batch_size`, each inserted with one executemany and committed as its own
+    transaction. Lines that fail validation are written to `error_sink` as
+    JSON records and skipped; if the database rejects a batch, its rows are
+    retried one by one so only the offending rows are rejected.
+    """
+
+    def __init__(
+        self,
+        article_repository: ArticleRepository,
+        batch_size: int,
+        error_sink: TextIO | None = None,
+        progress: Callable[[ImportReport], None] | None = None,
+        search_engine: ArticleSearchEngine | None = None,
+    ):
+        self.article_repository = article_repository
+        self.batch_size = batch_size
+        self.error_sink = error_sink
+        self.progress = progress
+        self.search_engine = search_engine
+        self.report = ImportReport()
+        self._line_number = 0
+        self._pending: List[dict] = []
+        self._pending_lines: List[int] = []
+
+    def feed(self, lines: Iterable[str | bytes | OversizedLine]) -> None:
+        for line in lines:
+            self._line_number += 1
+            if isinstance(line, OversizedLine):
+                self._reject(self._line_number, line.head, f"line longer than {line.limit} bytes")
+                continue
+            if not line.strip():
+                continue
+            try:
+                article = ArticleCreate.model_validate_json(line)
+            except ValidationError as exc:
+                self._reject(self._line_number, line, exc.errors(include_url=False)[0]["msg"])
+                continue
+            self._pending.append({"title": article.title, "content": article.content})
+            self._pending_lines.append(self._line_number)
+            if len(self._pending) >= self.batch_size:
+                self._flush()
+
+    def close(self) -> ImportReport:
+        self._flush()
+        if self.search_engine is not None and self.report.imported:
+            self.search_engine.reset()
+        return self.report
+
+    def _flush(self) -> None:
+        if not self._pending:
+            return
+        rows, line_numbers = self._pending, self._pending_lines
+        self._pending, self._pending_lines = [], []
+        try:
+            self.report.imported += self.article_repository.bulk_create_articles(rows)
+        except SQLAlchemyError:
+            self.article_repository.db.rollback()
+            for row, line_number in zip(rows, line_numbers):
+                try:
+                    self.report.imported += self.article_repository.bulk_create_articles([row])
+                except SQLAlchemyError as exc:
+                    self.article_repository.db.rollback()
+                    self._reject(line_number, json.dumps(row), str(exc.orig or exc))
+        self.report.batches += 1
+        logger.info("imported %d articles (%d failed)", self.report.imported, self.report.failed)
+        if self.progress is not None:
+            self.progress(self.report)
+
+    def _reject(self, line_number: int, line: str | bytes, error: str) -> None:
+        self.report.failed += 1
+        if self.error_sink is None:
+            return
+        raw = line.decode(errors="replace") if isinstance(line, bytes) else line
+        record = {"line": line_number, "error": error, "raw": raw.rstrip("\n")}
+        self.error_sink.write(json.dumps(record) + "\n")
@@ -1,19 +1,85 @@
-from typing import List
-from backend.repositories.article_repository import ArticleRepository
-from backend.schemas.article import ArticleCreate, ArticleResponse
+from dataclasses import replace
+from datetime import datetime, timezone
+from typing import Dict, List
+
+from fastapi import HTTPException, status
+
+from backend.core.config import Config
+from backend.core.serialization import dumps
+from backend.core.pagination import decode_cursor, encode_cursor, invalid_cursor_exception
+from backend.repositories.article_repository import (
+    LISTING_COMBINATIONS,
+    SNIPPET_ELLIPSIS,
+    SNIPPET_END,
+    SNIPPET_START,
+    ArticleQuery,
+    ArticleRepository,
+    listing_key_columns,
+    listing_sort,
+)
+from backend.schemas.article import (
+    ArticleCreate,
+    ArticlePage,
+    ArticleResponse,
+    ArticleSearchResult,
+    ArticleSummary,
+)
+from backend.services.article_cache import ArticleCache, RawArticle
+from backend.services.search_index import ArticleSearchEngine, highlight, snippet
+
+
+def _strict_int(value) -> int:
+    if not isinstance(value, int) or isinstance(value, bool):
+        raise TypeError("expected an integer")
+    return value
+
+
+def _strict_str(value) -> str:
+    if not isinstance(value, str):
+        raise TypeError("expected a string")
+    return value
+
+
+# How each listing key column travels inside an opaque cursor.
+_CURSOR_ENCODERS = {"id": int, "title": str, "created_at": datetime.isoformat}
+_CURSOR_DECODERS = {
+    "id": _strict_int,
+    "title": _strict_str,
+    "created_at": lambda value: datetime.fromisoformat(_strict_str(value)),
+}
+
+
+def _naive_utc(value: datetime | None) -> datetime | None:
+    # Timestamps are stored as naive UTC.
+    if value is None or value.tzinfo is None:
+        return value
+    return value.astimezone(timezone.utc).replace(tzinfo=None)
 
 
 class ArticleService:
-    def __init__(self, article_repository: ArticleRepository):
+    def __init__(
+        self,
+        article_repository: ArticleRepository,
+        search_engine: ArticleSearchEngine | None = None,
+        article_cache: ArticleCache | None = None,
+    ):
         self.article_repository = article_repository
+        self.search_engine = search_engine
+        self.article_cache = article_cache
 
-    def create_article(self, article_create: ArticleCreate) -> ArticleResponse:
+    def create_article(self, article_create: ArticleCreate, author_id: int | None = None) -> ArticleResponse:
         """
-        Creates a new article and returns the ArticleResponse.
+        Creates a new article, attributed to `author_id` when given, and returns the ArticleResponse.
         """
         article = self.article_repository.create_article(
-            article_create.title, article_create.content)
-        return ArticleResponse(id=article.id, title=article.title, content=article.content)
+            article_create.title, article_create.content, author_id=author_id)
+        if self.search_engine is not None:
+            self.search_engine.add(article.id, article.title, article.content)
+        response = ArticleResponse(id=article.id, title=article.title, content=article.content)
+        if self.article_cache is not None:
+            # Store the entry now, compressed copies included, rather than on the first read.
+            self.article_cache.put(article.id, response, self._article_etag(article.id, article.version))
+        return response
 
     def get_articles(self) -> List[ArticleResponse]:
         """
@@ -22,24 +88,220 @@ class ArticleService:
         articles = self.article_repository.get_articles()
         return [ArticleResponse(id=article.id, title=article.title, content=article.content) for article in articles]
 
+    def get_articles_page(
+        self, limit: int, after: str | None = None, query: ArticleQuery | None = None
+    ) -> ArticlePage:
+        """
+        Fetches one page of article summaries matching `query` after the given
+        cursor. Filter/sort combinations without a backing index are rejected.
+        """
+        query, sort = self._resolve_query(query)
+        rows = self.article_repository.get_articles_page(
+            limit, after=self._decode_after(after, sort), excerpt_length=Config.ARTICLE_EXCERPT_LENGTH, query=query)
+        return self._to_page(rows, limit, sort)
+
     def get_article_by_id(self, article_id: int) -> ArticleResponse:
         """
         Fetches a single article by its ID.
         """
+        found = self.get_article_with_etag(article_id)
+        return None if found is None else found[0]
+
+    def get_article_etag(self, article_id: int) -> str | None:
+        """
+        Strong ETag of a single article, read without loading its content.
+        """
+        if self.article_cache is not None:
+            cached = self.article_cache.peek(article_id)
+            if cached is not None:
+                return cached[1]
+        version = self.article_repository.get_article_version(article_id)
+        return None if version is None else self._article_etag(article_id, version)
+
+    def get_article_with_etag(self, article_id: int) -> tuple[ArticleResponse, str] | None:
+        """
+        Fetches a single article together with the ETag of the loaded version,
+        through the article cache when one is attached.
+        """
+        if self.article_cache is not None:
+            return self.article_cache.get_or_load(article_id, lambda: self._load_article(article_id))
+        return self._load_article(article_id)
+
+    def get_article_json(self, article_id: int, encoding: str | None = None) -> RawArticle | None:
+        """
+        Serialized ArticleResponse JSON, its ETag and its Content-Encoding.
+        Cache hits are returned as stored, without decoding or re-encoding
+        the article; when the entry holds a copy compressed with `encoding`
+        that copy is returned, otherwise the plain JSON (encoding None).
+        """
+        if self.article_cache is not None:
+            return self.article_cache.get_or_load_raw(
+                article_id, lambda: self._load_article(article_id), encoding=encoding)
+        found = self._load_article(article_id)
+        return None if found is None else (dumps(found[0]), found[1], None)
+
+    def get_articles_batch_json(self, article_ids: List[int]) -> bytes:
+        """
+        ArticleBatch JSON for `article_ids`: the articles found, in the order
+        first requested, and the ids that were not. Cache hits are read in one
+        backend call and everything else with one query.
+        """
+        article_ids = list(dict.fromkeys(article_ids))
+        if self.article_cache is not None:
+            found = self.article_cache.get_many_raw(article_ids, self._load_articles)
+            return self._batch_json(article_ids, {article_id: raw[0] for article_id, raw in found.items()})
+        loaded = self._load_articles(article_ids)
+        return self._batch_json(article_ids, {article_id: dumps(article) for article_id, (article, _) in loaded.items()})
+
+    def _load_article(self, article_id: int) -> tuple[ArticleResponse, str] | None:
         article = self.article_repository.get_article_by_id(article_id)
         if article is None:
             return None
-        return ArticleResponse(id=article.id, title=article.title, content=article.content)
+        response = ArticleResponse(id=article.id, title=article.title, content=article.content)
+        return response, self._article_etag(article.id, article.version)
+
+    def _load_articles(self, article_ids: List[int]) -> Dict[int, tuple[ArticleResponse, str]]:
+        return self._to_cached(self.article_repository.get_articles_by_ids(article_ids))
 
-    def search_articles(self, query: str) -> List[ArticleResponse]:
+    def get_articles_etag(self) -> str:
         """
-        Search articles by title or content containing the query string.
+        ETag covering every listing of the collection; changes on each create or delete.
         """
-        articles = self.article_repository.search_articles(query)
-        return [ArticleResponse(id=article.id, title=article.title, content=article.content) for article in articles]
+        return self._collection_etag(self.article_repository.get_collection_version())
+
+    def search_articles(self, query: str, limit: int = 20, offset: int = 0) -> List[ArticleSearchResult]:
+        """
+        Ranked full-text search over title and content, best matches first.
+        Served from the in-process index and query cache when one is attached.
+        """
+        if self.search_engine is not None:
+            return self._search_in_memory(query, limit, offset)
+        rows = self.article_repository.search_articles(query, limit=limit, offset=offset)
+        return self._to_search_results(query, rows)
 
     def delete_article(self, article_id: int) -> bool:
         """
         Delete an article by ID. Returns True if deleted, False if not found.
         """
-        return self.article_repository.delete_article(article_id)
+        deleted = self.article_repository.delete_article(article_id)
+        if deleted and self.search_engine is not None:
+            self.search_engine.remove(article_id)
+        if deleted and self.article_cache is not None:
+            self.article_cache.invalidate(article_id)
+        return deleted
+
+    def _search_in_memory(self, query: str, limit: int, offset: int) -> List[ArticleSearchResult]:
+        engine = self.search_engine
+        engine.sync()
+        key = engine.cache_key(query, limit, offset)
+        cached = engine.cache.get(key)
+        if cached is not None:
+            return cached
+        if not engine.built:
+            engine.build(self.article_repository.iter_articles())
+        ranked = engine.index.search(query, limit=limit, offset=offset)
+        rows = self.article_repository.get_article_summaries(
+            [article_id for article_id, _ in ranked], excerpt_length=Config.ARTICLE_EXCERPT_LENGTH)
+        results = self._to_ranked_results(query, ranked, rows)
+        engine.cache.set(key, results)
+        return results
+
+    @staticmethod
+    def _article_etag(article_id: int, version: int) -> str:
+        return f'"article-{article_id}-v{version or 1}"'
+
+    @classmethod
+    def _to_cached(cls, articles) -> Dict[int, tuple[ArticleResponse, str]]:
+        return {
+            article.id: (
+                ArticleResponse(id=article.id, title=article.title, content=article.content),
+                cls._article_etag(article.id, article.version),
+            )
+            for article in articles
+        }
+
+    @staticmethod
+    def _batch_json(article_ids: List[int], bodies: Dict[int, bytes]) -> bytes:
+        # Article JSON is spliced in as stored, so cache hits are never decoded.
+        items = b",".join(bodies[article_id] for article_id in article_ids if article_id in bodies)
+        missing = [article_id for article_id in article_ids if article_id not in bodies]
+        return b'{"items":[' + items + b'],"missing":' + dumps(missing) + b"}"
+
+    @staticmethod
+    def _collection_etag(version: int) -> str:
+        return f'"articles-v{version}"'
+
+    @staticmethod
+    def _resolve_query(query: ArticleQuery | None) -> tuple[ArticleQuery, str]:
+        query = query or ArticleQuery()
+        sort = listing_sort(query)
+        if sort is None:
+            allowed = "; ".join(
+                f"{' + '.join(sorted(names)) or 'no filters'}: {', '.join(sorts)}"
+                for names, sorts in LISTING_COMBINATIONS.items()
+            )
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Unsupported filter and sort combination. Allowed: {allowed}",
+            )
+        return replace(
+            query,
+            sort=sort,
+            created_after=_naive_utc(query.created_after),
+            created_before=_naive_utc(query.created_before),
+        ), sort
+
+    @staticmethod
+    def _decode_after(after: str | None, sort: str = "id") -> tuple | None:
+        if after is None:
+            return None
+        cursor = decode_cursor(after)
+        key = cursor.get("k")
+        if cursor.get("s") != sort or not isinstance(key, list):
+            raise invalid_cursor_exception()
+        columns = listing_key_columns(sort)
+        if len(key) != len(columns):
+            raise invalid_cursor_exception()
+        try:
+            return tuple(_CURSOR_DECODERS[column.key](value) for column, value in zip(columns, key))
+        except (TypeError, ValueError) as exc:
+            raise invalid_cursor_exception() from exc
+
+    @staticmethod
+    def _to_page(rows, limit: int, sort: str = "id") -> ArticlePage:
+        items = [
+            ArticleSummary(id=row.id, title=row.title, excerpt=row.excerpt or "", created_at=row.created_at)
+            for row in rows[:limit]
+        ]
+        next_cursor = None
+        if len(rows) > limit:
+            last = rows[limit - 1]
+            key = [_CURSOR_ENCODERS[column.key](getattr(last, column.key)) for column in listing_key_columns(sort)]
+            next_cursor = encode_cursor({"s": sort, "k": key})
+        return ArticlePage(items=items, limit=limit, next_cursor=next_cursor)
+
+    @staticmethod
+    def _to_search_results(query: str, rows) -> List[ArticleSearchResult]:
+        return [
+            ArticleSearchResult(
+                id=row.id,
+                title=row.title,
+                snippet=snippet(row.title, row.content, query, SNIPPET_START, SNIPPET_END, SNIPPET_ELLIPSIS),
+                score=row.score,
+            )
+            for row in rows
+        ]
+
+    @staticmethod
+    def _to_ranked_results(query: str, ranked, rows) -> List[ArticleSearchResult]:
+        by_id = {row.id: row for row in rows}
+        return [
+            ArticleSearchResult(
+                id=article_id,
+                title=by_id[article_id].title,
+                snippet=highlight(by_id[article_id].excerpt or "", query, SNIPPET_START, SNIPPET_END),
+                score=score,
+            )
+            for article_id, score in ranked
+            if article_id in by_id
+        ]
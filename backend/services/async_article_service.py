@@ -0,0 +1,129 @@
+from typing import Dict, List
+
+from starlette.concurrency import run_in_threadpool
+
+from backend.core.config import Config
+from backend.core.serialization import dumps
+from backend.repositories.article_repository import ArticleQuery
+from backend.repositories.async_article_repository import AsyncArticleRepository
+from backend.schemas.article import ArticleCreate, ArticlePage, ArticleResponse, ArticleSearchResult
+from backend.services.article_cache import ArticleCache, RawArticle
+from backend.services.article_service import ArticleService
+from backend.services.search_index import ArticleSearchEngine
+
+
+class AsyncArticleService(ArticleService):
+    """
+    ArticleService over an AsyncArticleRepository. Every method that touches
+    the database is a coroutine here; cursor handling and response shaping
+    are inherited unchanged.
+    """
+
+    def __init__(
+        self,
+        article_repository: AsyncArticleRepository,
+        search_engine: ArticleSearchEngine | None = None,
+        article_cache: ArticleCache | None = None,
+    ):
+        super().__init__(article_repository, search_engine=search_engine, article_cache=article_cache)
+
+    async def create_article(self, article_create: ArticleCreate, author_id: int | None = None) -> ArticleResponse:
+        article = await self.article_repository.create_article(
+            article_create.title, article_create.content, author_id=author_id)
+        if self.search_engine is not None:
+            self.search_engine.add(article.id, article.title, article.content)
+        response = ArticleResponse(id=article.id, title=article.title, content=article.content)
+        if self.article_cache is not None:
+            # Store the entry now, compressed copies included, rather than on
+            # the first read; compressing them would block the event loop.
+            await run_in_threadpool(
+                self.article_cache.put, article.id, response, self._article_etag(article.id, article.version)
+            )
+        return response
+
+    async def get_articles(self) -> List[ArticleResponse]:
+        articles = await self.article_repository.get_articles()
+        return [ArticleResponse(id=article.id, title=article.title, content=article.content) for article in articles]
+
+    async def get_articles_page(
+        self, limit: int, after: str | None = None, query: ArticleQuery | None = None
+    ) -> ArticlePage:
+        query, sort = self._resolve_query(query)
+        rows = await self.article_repository.get_articles_page(
+            limit, after=self._decode_after(after, sort), excerpt_length=Config.ARTICLE_EXCERPT_LENGTH, query=query)
+        return self._to_page(rows, limit, sort)
+
+    async def get_article_by_id(self, article_id: int) -> ArticleResponse | None:
+        found = await self.get_article_with_etag(article_id)
+        return None if found is None else found[0]
+
+    async def get_article_etag(self, article_id: int) -> str | None:
+        if self.article_cache is not None:
+            cached = self.article_cache.peek(article_id)
+            if cached is not None:
+                return cached[1]
+        version = await self.article_repository.get_article_version(article_id)
+        return None if version is None else self._article_etag(article_id, version)
+
+    async def get_article_with_etag(self, article_id: int) -> tuple[ArticleResponse, str] | None:
+        if self.article_cache is not None:
+            return await self.article_cache.aget_or_load(article_id, lambda: self._load_article(article_id))
+        return await self._load_article(article_id)
+
+    async def get_article_json(self, article_id: int, encoding: str | None = None) -> RawArticle | None:
+        if self.article_cache is not None:
+            return await self.article_cache.aget_or_load_raw(
+                article_id, lambda: self._load_article(article_id), encoding=encoding)
+        found = await self._load_article(article_id)
+        return None if found is None else (dumps(found[0]), found[1], None)
+
+    async def get_articles_batch_json(self, article_ids: List[int]) -> bytes:
+        article_ids = list(dict.fromkeys(article_ids))
+        if self.article_cache is not None:
+            found = await self.article_cache.aget_many_raw(article_ids, self._load_articles)
+            return self._batch_json(article_ids, {article_id: raw[0] for article_id, raw in found.items()})
+        loaded = await self._load_articles(article_ids)
+        return self._batch_json(article_ids, {article_id: dumps(article) for article_id, (article, _) in loaded.items()})
+
+    async def _load_article(self, article_id: int) -> tuple[ArticleResponse, str] | None:
+        article = await self.article_repository.get_article_by_id(article_id)
+        if article is None:
+            return None
+        response = ArticleResponse(id=article.id, title=article.title, content=article.content)
+        return response, self._article_etag(article.id, article.version)
+
+    async def _load_articles(self, article_ids: List[int]) -> Dict[int, tuple[ArticleResponse, str]]:
+        return self._to_cached(await self.article_repository.get_articles_by_ids(article_ids))
+
+    async def get_articles_etag(self) -> str:
+        return self._collection_etag(await self.article_repository.get_collection_version())
+
+    async def search_articles(self, query: str, limit: int = 20, offset: int = 0) -> List[ArticleSearchResult]:
+        if self.search_engine is not None:
+            return await self._search_in_memory(query, limit, offset)
+        rows = await self.article_repository.search_articles(query, limit=limit, offset=offset)
+        return self._to_search_results(query, rows)
+
+    async def delete_article(self, article_id: int) -> bool:
+        deleted = await self.article_repository.delete_article(article_id)
+        if deleted and self.search_engine is not None:
+            self.search_engine.remove(article_id)
+        if deleted and self.article_cache is not None:
+            self.article_cache.invalidate(article_id)
+        return deleted
+
+    async def _search_in_memory(self, query: str, limit: int, offset: int) -> List[ArticleSearchResult]:
+        engine = self.search_engine
+        engine.sync()
+        key = engine.cache_key(query, limit, offset)
+        cached = engine.cache.get(key)
+        if cached is not None:
+            return cached
+        if not engine.built:
+            await engine.abuild(self.article_repository.iter_articles())
+        ranked = engine.index.search(query, limit=limit, offset=offset)
+        rows = await self.article_repository.get_article_summaries(
+            [article_id for article_id, _ in ranked], excerpt_length=Config.ARTICLE_EXCERPT_LENGTH)
+        results = self._to_ranked_results(query, ranked, rows)
+        engine.cache.set(key, results)
+        return results
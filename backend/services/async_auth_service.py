@@ -0,0 +1,112 @@
+from datetime import datetime
+
+from fastapi import HTTPException, status
+
+from backend.core import security
+from backend.repositories.async_auth_repository import AsyncAuthRepository
+from backend.schemas.auth_schema import TokenPayload, TokenResponse, UserCreate, UserLogin, UserResponse
+from backend.services.auth_cache import AuthTokenCache
+from backend.services.auth_service import AuthService, family_expiry, token_expiry
+from backend.services.token_revocation import TokenRevocationList
+
+
+class AsyncAuthService(AuthService):
+    """
+    AuthService over an AsyncAuthRepository. Password work is awaited on the
+    password pool; token issuing and decoding are inherited unchanged.
+    """
+
+    def __init__(
+        self,
+        auth_repository: AsyncAuthRepository,
+        token_cache: AuthTokenCache | None = None,
+        revocations: TokenRevocationList | None = None,
+    ):
+        super().__init__(auth_repository, token_cache=token_cache, revocations=revocations)
+
+    async def register_user(self, user_create: UserCreate) -> UserResponse:
+        self._ensure_new_email(await self.auth_repository.get_by_email(user_create.email))
+        hashed_password = await security.ahash_password(user_create.password)
+        user = await self.auth_repository.create_user(
+            email=user_create.email, full_name=user_create.full_name, hashed_password=hashed_password
+        )
+        return self._to_response(user)
+
+    async def login(self, credentials: UserLogin) -> TokenResponse:
+        user = await self.auth_repository.get_by_email(credentials.email)
+        verified = user is not None and await security.averify_password(credentials.password, user.hashed_password)
+        return self._login_tokens(user, verified)
+
+    # The repository is async already; nothing needs the threadpool.
+    aregister_user = register_user
+    alogin = login
+
+    async def refresh_tokens(self, refresh_token: str) -> TokenResponse:
+        payload = self._decode_token(refresh_token, expected_type="refresh")
+        if await self._is_revoked(payload.fam):
+            raise security.credentials_exception()
+        user = await self._get_user_from_payload(payload)
+        if not user.is_active:
+            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Inactive account")
+        if payload.jti is not None and not await self.auth_repository.use_refresh_token(
+            payload.jti, user.id, token_expiry(payload.exp)
+        ):
+            await self._revoke(payload.fam, user.id, family_expiry())
+            raise security.credentials_exception()
+        return self._issue_tokens(str(user.id), family=payload.fam)
+
+    async def logout(self, refresh_token: str) -> None:
+        payload = self._decode_token(refresh_token, expected_type="refresh")
+        if payload.fam is not None:
+            await self._revoke(payload.fam, int(payload.sub), family_expiry())
+
+    async def get_current_user(self, token: str, csrf_header: str | None) -> UserResponse:
+        if self.token_cache is not None:
+            cached = self.token_cache.get(token)
+            if cached is not None:
+                payload, user = cached
+                security.ensure_csrf(csrf_header, payload.csrf)
+                if await self._is_revoked(payload.fam):
+                    raise security.credentials_exception()
+                return user
+        payload = self._decode_token(token, expected_type="access")
+        security.ensure_csrf(csrf_header, payload.csrf)
+        if await self._is_revoked(payload.fam):
+            raise security.credentials_exception()
+        user = await self._get_user_from_payload(payload)
+        if not user.is_active:
+            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Inactive account")
+        response = self._to_response(user)
+        if self.token_cache is not None:
+            self.token_cache.put(token, payload, response)
+        return response
+
+    async def deactivate_user(self, user_id: int) -> None:
+        if not await self.auth_repository.set_active(user_id, False):
+            raise security.credentials_exception()
+        if self.token_cache is not None:
+            self.token_cache.invalidate_user(user_id)
+
+    async def _is_revoked(self, token_id: str | None) -> bool:
+        if token_id is None:
+            return False
+        if self.revocations is None:
+            return await self.auth_repository.is_revoked(token_id)
+        pending = self.revocations.pending()
+        if pending is not None:
+            version, after = pending
+            self.revocations.load(version, after, await self.auth_repository.revocations_since(after))
+        return token_id in self.revocations and await self.auth_repository.is_revoked(token_id)
+
+    async def _revoke(self, token_id: str, user_id: int, expires_at: datetime) -> bool:
+        if not await self.auth_repository.revoke_token(token_id, user_id, expires_at):
+            return False
+        if self.revocations is not None:
+            self.revocations.add(token_id)
+        return True
+
+    async def _get_user_from_payload(self, payload: TokenPayload):
+        user = await self.auth_repository.get_by_id(int(payload.sub))
+        if not user:
+            raise security.credentials_exception()
+        return user
@@ -0,0 +1,61 @@
+import hashlib
+import time
+from functools import lru_cache
+from typing import Dict, Tuple
+
+from backend.core.cache import TTLCache
+from backend.core.config import Config
+from backend.core.shared_state import SharedCounters, get_shared_counters
+from backend.schemas.auth_schema import TokenPayload, UserResponse
+
+
+class AuthTokenCache:
+    """
+    Verified access tokens mapped to their claims and a snapshot of the user,
+    keyed by a hash of the token and kept until the token's `exp`. Each user
+    has a generation number; bumping it (on deactivation) orphans every
+    entry cached for that user without scanning the cache. Generations are
+    SharedCounters, so a deactivation handled by one worker reaches the
+    entries cached by every worker.
+    """
+
+    def __init__(self, max_size: int = 10000, generations: SharedCounters | None = None):
+        self._entries = TTLCache(max_size=max_size)
+        self._generations = generations or SharedCounters()
+
+    @staticmethod
+    def key(token: str) -> str:
+        return hashlib.sha256(token.encode()).hexdigest()
+
+    def get(self, token: str) -> Tuple[TokenPayload, UserResponse] | None:
+        entry = self._entries.get(self.key(token))
+        if entry is None:
+            return None
+        generation, payload, user = entry
+        if self._generations.get(user.id) != generation:
+            self._entries.delete(self.key(token))
+            return None
+        return payload, user
+
+    def put(self, token: str, payload: TokenPayload, user: UserResponse) -> None:
+        ttl = payload.exp - time.time()
+        if ttl <= 0:
+            return
+        generation = self._generations.get(user.id)
+        self._entries.set(self.key(token), (generation, payload, user), ttl=ttl)
+
+    def invalidate_user(self, user_id: int) -> None:
+        self._generations.bump(user_id)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> Dict[str, object]:
+        return self._entries.stats()
+
+
+@lru_cache(maxsize=None)
+def get_auth_token_cache() -> AuthTokenCache | None:
+    if Config.AUTH_TOKEN_CACHE_SIZE <= 0:
+        return None
+    return AuthTokenCache(max_size=Config.AUTH_TOKEN_CACHE_SIZE, generations=get_shared_counters("users"))
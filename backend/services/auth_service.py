@@ -1,5 +1,6 @@
-from datetime import timedelta
+from datetime import datetime, timedelta, timezone
 from fastapi import HTTPException, status
+from starlette.concurrency import run_in_threadpool
 
 from backend.core import security
 from backend.core.config import Config
@@ -11,16 +12,42 @@ from backend.schemas.auth_schema import (
     UserLogin,
     UserResponse,
 )
+from backend.services.auth_cache import AuthTokenCache
+from backend.services.token_revocation import TokenRevocationList
+
+
+def family_expiry() -> datetime:
+    # The latest any token of a family issued until now can expire.
+    return datetime.utcnow() + timedelta(minutes=Config.REFRESH_TOKEN_EXPIRE_MINUTES)
+
+
+def token_expiry(exp: int) -> datetime:
+    # Naive UTC, like the other timestamps the application stores.
+    return datetime.fromtimestamp(exp, timezone.utc).replace(tzinfo=None)
 
 
 class AuthService:
-    def __init__(self, auth_repository: AuthRepository):
+    """
+    Refresh tokens are single use: refreshing records the token (by `jti`)
+    as used and issues a new pair in the same family (`fam`, one per
+    login). Presenting a used refresh token means it was copied, so the
+    whole family is revoked, ending the session for whoever holds it. Only
+    families are checked for revocation; those checks go through
+    `revocations` when given, and straight to the database otherwise.
+    """
+
+    def __init__(
+        self,
+        auth_repository: AuthRepository,
+        token_cache: AuthTokenCache | None = None,
+        revocations: TokenRevocationList | None = None,
+    ):
         self.auth_repository = auth_repository
+        self.token_cache = token_cache
+        self.revocations = revocations
 
     def register_user(self, user_create: UserCreate) -> UserResponse:
-        existing = self.auth_repository.get_by_email(user_create.email)
-        if existing:
-            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Email already exists")
+        self._ensure_new_email(self.auth_repository.get_by_email(user_create.email))
         hashed_password = security.hash_password(user_create.password)
         user = self.auth_repository.create_user(
             email=user_create.email, full_name=user_create.full_name, hashed_password=hashed_password
@@ -29,29 +56,98 @@ class AuthService:
 
     def login(self, credentials: UserLogin) -> TokenResponse:
         user = self.auth_repository.get_by_email(credentials.email)
-        if not user or not security.verify_password(credentials.password, user.hashed_password):
-            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid credentials")
-        if not user.is_active:
-            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Inactive account")
+        verified = user is not None and security.verify_password(credentials.password, user.hashed_password)
+        return self._login_tokens(user, verified)
+
+    # For async routes over this (sync) service: queries run in the
+    # threadpool, while bcrypt is awaited on the password pool, so a job
+    # waiting for a pool slot holds no threadpool thread.
+    async def aregister_user(self, user_create: UserCreate) -> UserResponse:
+        self._ensure_new_email(await run_in_threadpool(self.auth_repository.get_by_email, user_create.email))
+        hashed_password = await security.ahash_password(user_create.password)
+        user = await run_in_threadpool(
+            self.auth_repository.create_user,
+            email=user_create.email,
+            full_name=user_create.full_name,
+            hashed_password=hashed_password,
+        )
+        return self._to_response(user)
+
+    async def alogin(self, credentials: UserLogin) -> TokenResponse:
+        user = await run_in_threadpool(self.auth_repository.get_by_email, credentials.email)
+        verified = user is not None and await security.averify_password(credentials.password, user.hashed_password)
+        return self._login_tokens(user, verified)
+
+    def issue_tokens(self, user: UserResponse) -> TokenResponse:
+        """Tokens for a user whose credentials were just established, e.g. on registration."""
         return self._issue_tokens(str(user.id))
 
     def refresh_tokens(self, refresh_token: str) -> TokenResponse:
         payload = self._decode_token(refresh_token, expected_type="refresh")
+        if self._is_revoked(payload.fam):
+            raise security.credentials_exception()
         user = self._get_user_from_payload(payload)
         if not user.is_active:
             raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Inactive account")
-        return self._issue_tokens(str(user.id))
+        if payload.jti is not None and not self.auth_repository.use_refresh_token(
+            payload.jti, user.id, token_expiry(payload.exp)
+        ):
+            self._revoke(payload.fam, user.id, family_expiry())
+            raise security.credentials_exception()
+        return self._issue_tokens(str(user.id), family=payload.fam)
+
+    def logout(self, refresh_token: str) -> None:
+        """Revoke the session (token family) of `refresh_token`."""
+        payload = self._decode_token(refresh_token, expected_type="refresh")
+        if payload.fam is not None:
+            self._revoke(payload.fam, int(payload.sub), family_expiry())
 
     def get_current_user(self, token: str, csrf_header: str | None) -> UserResponse:
+        if self.token_cache is not None:
+            cached = self.token_cache.get(token)
+            if cached is not None:
+                payload, user = cached
+                security.ensure_csrf(csrf_header, payload.csrf)
+                if self._is_revoked(payload.fam):
+                    raise security.credentials_exception()
+                return user
         payload = self._decode_token(token, expected_type="access")
         security.ensure_csrf(csrf_header, payload.csrf)
+        if self._is_revoked(payload.fam):
+            raise security.credentials_exception()
         user = self._get_user_from_payload(payload)
         if not user.is_active:
             raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Inactive account")
-        return self._to_response(user)
+        response = self._to_response(user)
+        if self.token_cache is not None:
+            self.token_cache.put(token, payload, response)
+        return response
 
-    def _issue_tokens(self, subject: str) -> TokenResponse:
+    def deactivate_user(self, user_id: int) -> None:
+        if not self.auth_repository.set_active(user_id, False):
+            raise security.credentials_exception()
+        if self.token_cache is not None:
+            self.token_cache.invalidate_user(user_id)
+
+    def _is_revoked(self, token_id: str | None) -> bool:
+        if token_id is None:
+            return False
+        if self.revocations is None:
+            return self.auth_repository.is_revoked(token_id)
+        self.revocations.sync(self.auth_repository)
+        return token_id in self.revocations and self.auth_repository.is_revoked(token_id)
+
+    def _revoke(self, token_id: str, user_id: int, expires_at: datetime) -> bool:
+        """Store a revocation; False when `token_id` was already revoked."""
+        if not self.auth_repository.revoke_token(token_id, user_id, expires_at):
+            return False
+        if self.revocations is not None:
+            self.revocations.add(token_id)
+        return True
+
+    def _issue_tokens(self, subject: str, family: str | None = None) -> TokenResponse:
         csrf_token = security.create_csrf_token()
+        family = family or security.create_token_id()
         access_expires = timedelta(minutes=Config.ACCESS_TOKEN_EXPIRE_MINUTES)
         refresh_expires = timedelta(minutes=Config.REFRESH_TOKEN_EXPIRE_MINUTES)
         access_token = security.create_token(
@@ -59,12 +155,14 @@ class AuthService:
             expires_delta=access_expires,
             token_type="access",
             csrf_token=csrf_token,
+            additional_claims={"fam": family},
         )
         refresh_token = security.create_token(
             subject=subject,
             expires_delta=refresh_expires,
             token_type="refresh",
             csrf_token=csrf_token,
+            additional_claims={"fam": family, "jti": security.create_token_id()},
         )
         return TokenResponse(
             access_token=access_token,
@@ -73,6 +171,18 @@ class AuthService:
             csrf_token=csrf_token,
         )
 
+    @staticmethod
+    def _ensure_new_email(existing) -> None:
+        if existing:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Email already exists")
+
+    def _login_tokens(self, user, verified: bool) -> TokenResponse:
+        if not verified:
+            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid credentials")
+        if not user.is_active:
+            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Inactive account")
+        return self._issue_tokens(str(user.id))
+
     def _decode_token(self, token: str, expected_type: str) -> TokenPayload:
         payload_dict = security.decode_token(token)
         if payload_dict.get("type") != expected_type:
@@ -0,0 +1,309 @@
+import math
+import re
+import threading
+import unicodedata
+from array import array
+from bisect import bisect_left, insort
+from functools import lru_cache
+from typing import AsyncIterable, Dict, Iterable, List, Tuple
+
+from backend.core.cache import TTLCache
+from backend.core.config import Config
+from backend.core.shared_state import SharedCounters, get_shared_counters
+
+_TOKEN = re.compile(r"\w+", re.UNICODE)
+
+TITLE_WEIGHT = 10
+SNIPPET_TOKENS = 24
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+
+def normalize(text: str) -> str:
+    decomposed = unicodedata.normalize("NFKD", text.lower())
+    return "".join(ch for ch in decomposed if not unicodedata.combining(ch))
+
+
+def tokenize(text: str) -> List[str]:
+    return _TOKEN.findall(normalize(text))
+
+
+class _Postings:
+    """Doc ids and term weights for one term, kept as sorted parallel arrays."""
+
+    __slots__ = ("ids", "weights")
+
+    def __init__(self):
+        self.ids = array("I")
+        self.weights = array("H")
+
+    def add(self, doc_id: int, weight: int) -> None:
+        weight = min(weight, 0xFFFF)
+        if not self.ids or self.ids[-1] < doc_id:
+            self.ids.append(doc_id)
+            self.weights.append(weight)
+            return
+        pos = bisect_left(self.ids, doc_id)
+        if pos < len(self.ids) and self.ids[pos] == doc_id:
+            self.weights[pos] = weight
+        else:
+            self.ids.insert(pos, doc_id)
+            self.weights.insert(pos, weight)
+
+
+class InvertedIndex:
+    """
+    In-memory tokenized index over article titles and bodies. Queries match
+    every term as a prefix (like the FTS5 query in ArticleRepository) and are
+    ranked with BM25, title terms weighted above body terms. Deletes leave
+    tombstones that are purged once they make up a fifth of the documents, or
+    immediately when a deleted id is indexed again.
+    """
+
+    def __init__(self):
+        self._postings: Dict[str, _Postings] = {}
+        self._terms: List[str] = []
+        self._doc_lengths: Dict[int, int] = {}
+        self._total_length = 0
+        self._tombstones: set[int] = set()
+        self._lock = threading.RLock()
+
+    def add(self, doc_id: int, title: str, content: str) -> None:
+        weights: Dict[str, int] = {}
+        for term in tokenize(title):
+            weights[term] = weights.get(term, 0) + TITLE_WEIGHT
+        for term in tokenize(content or ""):
+            weights[term] = weights.get(term, 0) + 1
+        length = sum(weights.values())
+        with self._lock:
+            if doc_id in self._doc_lengths:
+                self._remove_locked(doc_id)
+            if doc_id in self._tombstones:
+                self._compact_locked()
+            for term, weight in weights.items():
+                postings = self._postings.get(term)
+                if postings is None:
+                    postings = self._postings[term] = _Postings()
+                    insort(self._terms, term)
+                postings.add(doc_id, weight)
+            self._doc_lengths[doc_id] = length
+            self._total_length += length
+
+    def remove(self, doc_id: int) -> bool:
+        with self._lock:
+            if doc_id not in self._doc_lengths:
+                return False
+            self._remove_locked(doc_id)
+            if len(self._tombstones) * 4 > len(self._doc_lengths):
+                self._compact_locked()
+            return True
+
+    def search(self, query: str, limit: int = 20, offset: int = 0) -> List[Tuple[int, float]]:
+        terms = tokenize(query)
+        if not terms:
+            return []
+        with self._lock:
+            docs = len(self._doc_lengths)
+            if not docs:
+                return []
+            avg_length = self._total_length / docs
+            scores: Dict[int, float] | None = None
+            for term in dict.fromkeys(terms):
+                term_scores = self._score_prefix(term, docs, avg_length)
+                if scores is None:
+                    scores = term_scores
+                else:
+                    scores = {d: s + term_scores[d] for d, s in scores.items() if d in term_scores}
+                if not scores:
+                    return []
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))
+        return ranked[offset:offset + limit]
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            postings = sum(len(p.ids) for p in self._postings.values())
+            postings_bytes = sum(
+                p.ids.itemsize * len(p.ids) + p.weights.itemsize * len(p.weights)
+                for p in self._postings.values()
+            )
+            return {
+                "documents": len(self._doc_lengths),
+                "terms": len(self._postings),
+                "postings": postings,
+                "tombstones": len(self._tombstones),
+                "postings_bytes": postings_bytes,
+            }
+
+    def _score_prefix(self, prefix: str, docs: int, avg_length: float) -> Dict[int, float]:
+        scores: Dict[int, float] = {}
+        start = bisect_left(self._terms, prefix)
+        for term in self._terms[start:]:
+            if not term.startswith(prefix):
+                break
+            postings = self._postings[term]
+            live = [(d, w) for d, w in zip(postings.ids, postings.weights) if d in self._doc_lengths]
+            if not live:
+                continue
+            idf = math.log(1 + (docs - len(live) + 0.5) / (len(live) + 0.5))
+            for doc_id, weight in live:
+                norm = BM25_K1 * (1 - BM25_B + BM25_B * self._doc_lengths[doc_id] / avg_length)
+                scores[doc_id] = scores.get(doc_id, 0.0) + idf * weight * (BM25_K1 + 1) / (weight + norm)
+        return scores
+
+    def _remove_locked(self, doc_id: int) -> None:
+        self._total_length -= self._doc_lengths.pop(doc_id)
+        self._tombstones.add(doc_id)
+
+    def _compact_locked(self) -> None:
+        live = self._doc_lengths
+        for term in list(self._postings):
+            old = self._postings[term]
+            fresh = _Postings()
+            for doc_id, weight in zip(old.ids, old.weights):
+                if doc_id in live:
+                    fresh.ids.append(doc_id)
+                    fresh.weights.append(weight)
+            if fresh.ids:
+                self._postings[term] = fresh
+            else:
+                del self._postings[term]
+        self._terms = sorted(self._postings)
+        self._tombstones.clear()
+
+
+class ArticleSearchEngine:
+    """
+    Service-owned search accelerator: an InvertedIndex built once from the
+    repository plus an LRU/TTL cache of recent query results. Writes update
+    the index incrementally and drop cached results.
+
+    With `epochs`, every write also bumps a shared counter. A worker whose
+    index has missed a write made elsewhere sees the counter ahead of the
+    one it last synced to, and `sync` drops the index to rebuild it.
+    """
+
+    def __init__(self, cache_size: int = 1024, cache_ttl: float = 60.0, epochs: SharedCounters | None = None):
+        self.index = InvertedIndex()
+        self.cache = TTLCache(max_size=cache_size, ttl=cache_ttl)
+        self.epochs = epochs
+        self._epoch = 0
+        self._built = False
+        self._build_lock = threading.Lock()
+
+    @property
+    def built(self) -> bool:
+        return self._built
+
+    def build(self, rows: Iterable) -> None:
+        with self._build_lock:
+            if self._built:
+                return
+            self._epoch = self._shared_epoch()
+            for row in rows:
+                self.index.add(row.id, row.title, row.content)
+            self._built = True
+
+    def reset(self) -> None:
+        """Drop the index and cached results; the next search rebuilds from the repository."""
+        with self._build_lock:
+            self.index = InvertedIndex()
+            self._built = False
+        self.cache.clear()
+
+    async def abuild(self, rows: AsyncIterable) -> None:
+        """
+        Build from an async row stream into a fresh index and install it. The
+        build lock is only taken for the swap so the event loop never blocks.
+        """
+        index = InvertedIndex()
+        epoch = self._shared_epoch()
+        async for row in rows:
+            index.add(row.id, row.title, row.content)
+        with self._build_lock:
+            if not self._built:
+                self.index = index
+                self._epoch = epoch
+                self._built = True
+
+    def sync(self) -> None:
+        """Drop the index and cached results if another worker has written since the last sync."""
+        if self.epochs is not None and self._built and self._shared_epoch() != self._epoch:
+            self.reset()
+
+    def add(self, doc_id: int, title: str, content: str) -> None:
+        with self._build_lock:
+            if self._built:
+                self.index.add(doc_id, title, content)
+            self._advance_epoch()
+        self.cache.clear()
+
+    def remove(self, doc_id: int) -> None:
+        with self._build_lock:
+            if self._built:
+                self.index.remove(doc_id)
+            self._advance_epoch()
+        self.cache.clear()
+
+    def _shared_epoch(self) -> int:
+        return self.epochs.get(0) if self.epochs is not None else 0
+
+    def _advance_epoch(self) -> None:
+        # Our own write is already applied; only when nobody else wrote in
+        # between is the index still complete at the new epoch.
+        if self.epochs is None:
+            return
+        epoch = self.epochs.bump(0)
+        if epoch == self._epoch + 1:
+            self._epoch = epoch
+
+    @staticmethod
+    def cache_key(query: str, limit: int, offset: int) -> Tuple[str, int, int]:
+        return " ".join(tokenize(query)), limit, offset
+
+    def stats(self) -> Dict[str, object]:
+        return {"built": self._built, "index": self.index.stats(), "cache": self.cache.stats()}
+
+
+def highlight(text: str, query: str, start: str, end: str) -> str:
+    prefixes = tuple(tokenize(query))
+    if not prefixes:
+        return text
+    return _TOKEN.sub(
+        lambda m: f"{start}{m.group(0)}{end}" if normalize(m.group(0)).startswith(prefixes) else m.group(0),
+        text,
+    )
+
+
+def snippet(
+    title: str, content: str | None, query: str, start: str, end: str, ellipsis: str, size: int = SNIPPET_TOKENS
+) -> str:
+    """
+    About `size` tokens of `content` around its first match of `query`,
+    highlighted, with `ellipsis` where the text was cut (like FTS5's
+    snippet()). The highlighted title stands in when only the title matches.
+    """
+    prefixes = tuple(tokenize(query))
+    content = content or ""
+    tokens = list(_TOKEN.finditer(content))
+    first = next((i for i, token in enumerate(tokens) if normalize(token.group(0)).startswith(prefixes)), None)
+    if first is None:
+        if any(normalize(term).startswith(prefixes) for term in _TOKEN.findall(title or "")):
+            return highlight(title, query, start, end)
+        first = 0
+    begin = max(0, min(first - size // 4, len(tokens) - size))
+    stop = min(len(tokens), begin + size)
+    text_start = tokens[begin].start() if begin else 0
+    text_end = tokens[stop - 1].end() if stop < len(tokens) else len(content)
+    fragment = highlight(content[text_start:text_end], query, start, end)
+    return f"{ellipsis if begin else ''}{fragment}{ellipsis if stop < len(tokens) else ''}"
+
+
+@lru_cache(maxsize=None)
+def get_article_search_engine() -> ArticleSearchEngine | None:
+    if not Config.SEARCH_INDEX_ENABLED:
+        return None
+    return ArticleSearchEngine(
+        cache_size=Config.SEARCH_CACHE_SIZE,
+        cache_ttl=Config.SEARCH_CACHE_TTL_SECONDS,
+        epochs=get_shared_counters("search", slots=1),
+    )
@@ -0,0 +1,90 @@
+import threading
+from functools import lru_cache
+from typing import Iterable, Tuple
+
+from backend.core.bloom import BloomFilter
+from backend.core.config import Config
+from backend.core.shared_state import SharedCounters, get_shared_counters
+
+# Slot of the shared counter bumped on every revocation.
+_VERSION = 0
+
+# Ids re-read below the last one loaded: on PostgreSQL, concurrent inserts
+# can commit out of id order, so a row may appear after a higher id was read.
+SYNC_OVERLAP = 64
+
+
+class TokenRevocationList:
+    """
+    In-process Bloom filter over the revoked token families in
+    `revoked_tokens`, so the common answer, "not revoked", needs no query. A hit may be a false positive and
+    is confirmed by an exact lookup (see AuthService._is_revoked).
+
+    Every revocation bumps a SharedCounter; a worker that sees it move reads
+    the rows added since (shortly before) the last id it loaded. Loading
+    from id 0 builds a fresh filter, sized for what it holds: that is how the
+    list is built at startup, and rebuilt once it outgrows its capacity
+    (dropping ids whose tokens have expired).
+    """
+
+    def __init__(self, capacity: int = 100000, error_rate: float = 0.001, counters: SharedCounters | None = None):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self._counters = counters or SharedCounters(slots=1)
+        self._filter = BloomFilter(capacity, error_rate)
+        self._last_id = 0
+        self._version = None
+        self._lock = threading.Lock()
+
+    def pending(self) -> Tuple[int, int] | None:
+        """(version, id) to load revocations after, or None when up to date. After 0 is a full rebuild."""
+        version = self._counters.get(_VERSION)
+        if self._version is None or self._filter.full:
+            return version, 0
+        if version == self._version:
+            return None
+        return version, max(0, self._last_id - SYNC_OVERLAP)
+
+    def load(self, version: int, after: int, rows: Iterable) -> None:
+        """Add the (id, token_id) rows recorded after id `after`, as returned by `pending`."""
+        rows = list(rows)
+        with self._lock:
+            if after == 0:
+                bloom = BloomFilter(max(self.capacity, 2 * len(rows)), self.error_rate)
+                last_id = 0
+            else:
+                bloom, last_id = self._filter, self._last_id
+            for row in rows:
+                # Re-read rows are skipped so they do not count towards the capacity.
+                if after == 0 or row.token_id not in bloom:
+                    bloom.add(row.token_id)
+            if rows:
+                last_id = max(last_id, rows[-1].id)
+            self._filter, self._last_id, self._version = bloom, last_id, version
+
+    def sync(self, repository) -> None:
+        """Catch up with revocations recorded by any worker, through an AuthRepository."""
+        pending = self.pending()
+        if pending is not None:
+            version, after = pending
+            self.load(version, after, repository.revocations_since(after))
+
+    def add(self, token_id: str) -> None:
+        """Note a revocation this process just stored, and tell the other workers."""
+        with self._lock:
+            self._filter.add(token_id)
+        self._counters.bump(_VERSION)
+
+    def __contains__(self, token_id: str) -> bool:
+        return token_id in self._filter
+
+
+@lru_cache(maxsize=None)
+def get_token_revocations() -> TokenRevocationList | None:
+    if Config.TOKEN_REVOCATION_FILTER_CAPACITY <= 0:
+        return None
+    return TokenRevocationList(
+        capacity=Config.TOKEN_REVOCATION_FILTER_CAPACITY,
+        error_rate=Config.TOKEN_REVOCATION_FILTER_ERROR_RATE,
+        counters=get_shared_counters("revocations", slots=1),
+    )
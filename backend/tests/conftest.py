@@ -1,7 +1,112 @@
 import os
+import sqlite3
 import sys
 
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+try:
+    import pysqlite3.dbapi2 as pysqlite3
+except ImportError:  # optional: a newer SQLite than the interpreter's
+    pysqlite3 = None
+
 # Ensure project root is on sys.path for `import backend`
 ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
 if ROOT_DIR not in sys.path:
     sys.path.insert(0, ROOT_DIR)
+
+from backend.api import articles, auth  # noqa: E402
+from backend.core.config import Config  # noqa: E402
+from backend.core.database import Base, get_db, get_read_db  # noqa: E402
+from backend.services.article_cache import get_article_cache  # noqa: E402
+import backend.models  # noqa: E402,F401 - ensure models are imported for metadata
+
+
+@pytest.fixture
+def db_session():
+    """Session on a fresh in-memory database with every table."""
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(bind=engine)
+    session = sessionmaker(autocommit=False, autoflush=False, bind=engine)()
+    try:
+        yield session
+    finally:
+        session.close()
+        engine.dispose()
+
+
+@pytest.fixture
+def app_engine():
+    """In-memory database that every connection shares, for apps served by `client`."""
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(bind=engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def configure_app():
+    """Adds middleware or routers to the `client` app; test modules override it."""
+    return lambda app: None
+
+
+@pytest.fixture
+def client(app_engine, configure_app, tmp_path, monkeypatch):
+    """TestClient for the sync auth and article routes over `app_engine`."""
+    monkeypatch.setattr(Config, "IMPORT_ERROR_DIR", str(tmp_path))
+    # Process-wide caches must not leak articles between test databases.
+    get_article_cache.cache_clear()
+    TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=app_engine)
+
+    def override_get_db():
+        db = TestingSessionLocal()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app = FastAPI()
+    configure_app(app)
+    app.include_router(auth.router, prefix="/api")
+    app.include_router(articles.router, prefix="/api")
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+@pytest.fixture
+def headers(client):
+    """Auth and CSRF headers of a freshly registered user."""
+    tokens = client.post(
+        "/api/auth/register", json={"email": "user@example.com", "password": "supersecret"}
+    ).json()
+    return {"Authorization": f"Bearer {tokens['access_token']}", "X-CSRF-Token": tokens["csrf_token"]}
+
+
+@pytest.fixture
+def modern_sqlite_engine():
+    """
+    Builds engines on SQLite 3.43+, whose FTS5 deletes from contentless
+    tables by rowid: the interpreter's sqlite3 when recent enough, else the
+    optional pysqlite3 package. Skips the test when neither is.
+    """
+    if sqlite3.sqlite_version_info >= (3, 43, 0):
+        module = sqlite3
+    elif pysqlite3 is not None:
+        module = pysqlite3
+    else:
+        pytest.skip("needs SQLite 3.43 or later")
+    engines = []
+
+    def build(url: str = "sqlite://"):
+        engines.append(create_engine(url, module=module))
+        return engines[-1]
+
+    yield build
+    for engine in engines:
+        engine.dispose()
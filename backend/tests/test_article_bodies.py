@@ -0,0 +1,145 @@
+import pytest
+from sqlalchemy import create_engine, event, select, text
+from sqlalchemy.orm import sessionmaker
+
+from backend.core.body_codec import PLAIN, ZLIB, ZSTD, BodyCodec, get_body_codec, train_dictionary, zstandard
+from backend.core.database import Base
+from backend.models.article import EXCERPT_LENGTH, Article
+from backend.models.article_body import ArticleBody
+from backend.repositories.article_repository import ArticleRepository
+import backend.models  # noqa: F401 - ensure models are imported for metadata
+
+BODY = "The quick brown fox jumps over the lazy dog while the cat watches from the window. " * 20
+
+needs_zstd = pytest.mark.skipif(zstandard is None, reason="zstandard is not installed")
+
+
+@pytest.fixture(autouse=True)
+def fresh_codec():
+    # The codec is process-wide, and tests here activate dictionaries on it.
+    get_body_codec.cache_clear()
+    yield
+    get_body_codec.cache_clear()
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(bind=engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def repository(engine):
+    session = sessionmaker(autocommit=False, autoflush=False, bind=engine)()
+    try:
+        yield ArticleRepository(session)
+    finally:
+        session.close()
+
+
+@pytest.mark.parametrize("name", [PLAIN, ZLIB, pytest.param(ZSTD, marks=needs_zstd)])
+def test_codecs_round_trip(name):
+    codec = BodyCodec(name)
+    encoded = codec.encode(BODY)
+    assert encoded[0] == name
+    if name != PLAIN:
+        assert len(encoded[2]) < len(BODY)
+    assert codec.decode(*encoded) == BODY
+
+
+def test_incompressible_bodies_are_stored_plain():
+    assert BodyCodec(ZLIB).encode("x") == (PLAIN, None, b"x")
+
+
+def test_bodies_are_stored_compressed_and_read_back(repository):
+    created = repository.create_article("Fox", BODY)
+
+    body = repository.db.get(ArticleBody, created.id)
+    assert body.codec != PLAIN
+    assert len(body.data) < len(BODY)
+    assert repository.get_article_by_id(created.id).content == BODY
+    article = repository.db.get(Article, created.id)
+    assert article.excerpt == BODY[:EXCERPT_LENGTH]
+    assert article.content == BODY
+
+
+def test_listings_never_read_bodies(repository, engine):
+    repository.bulk_create_articles([{"title": f"t{i}", "content": BODY} for i in range(5)])
+    statements = []
+    event.listen(engine, "before_cursor_execute", lambda conn, cursor, statement, *args: statements.append(statement))
+
+    page = repository.get_articles_page(3, excerpt_length=10)
+
+    assert [row.excerpt for row in page] == [BODY[:10]] * 4
+    assert not any("article_bodies" in statement for statement in statements)
+
+
+def test_delete_removes_body_and_search_entry(repository):
+    created = repository.create_article("Fox", BODY)
+    assert [hit.id for hit in repository.search_articles("lazy")] == [created.id]
+
+    assert repository.delete_article(created.id)
+
+    assert repository.db.execute(select(ArticleBody)).first() is None
+    assert repository.search_articles("lazy") == []
+
+
+def test_delete_does_not_read_the_body_when_the_index_deletes_by_rowid(modern_sqlite_engine):
+    engine = modern_sqlite_engine()
+    Base.metadata.create_all(bind=engine)
+    with sessionmaker(bind=engine)() as session:
+        repository = ArticleRepository(session)
+        created = repository.create_article("Fox", BODY)
+        statements = []
+        event.listen(engine, "before_cursor_execute", lambda conn, cursor, statement, *args: statements.append(statement))
+
+        assert repository.delete_article(created.id)
+
+        assert not any("RETURNING" in statement and "article_bodies" in statement for statement in statements)
+        assert repository.search_articles("lazy") == []
+        assert repository.db.execute(select(ArticleBody)).first() is None
+
+        article = Article(title="Fox", content=BODY)
+        session.add(article)
+        session.commit()
+        article.content = "An entirely different tale about herons"
+        session.commit()
+        assert repository.search_articles("lazy") == []
+        assert [hit.id for hit in repository.search_articles("herons")] == [article.id]
+
+
+def test_orm_updates_reindex_the_body(repository):
+    article = Article(title="Fox", content=BODY)
+    repository.db.add(article)
+    repository.db.commit()
+
+    article.content = "An entirely different tale about herons"
+    repository.db.commit()
+
+    assert repository.search_articles("lazy") == []
+    assert [hit.id for hit in repository.search_articles("herons")] == [article.id]
+
+
+@needs_zstd
+def test_dictionary_recompresses_and_decodes(repository, engine):
+    words = "lorem ipsum dolor sit amet consectetur adipiscing elit sed do eiusmod tempor".split()
+    rows = [{"title": f"t{i}", "content": " ".join(words[i % 7:] + words[:i % 7]) * 3} for i in range(300)]
+    repository.bulk_create_articles(rows)
+    before = repository.db.execute(text("SELECT sum(length(data)) FROM article_bodies")).scalar()
+
+    samples = [row["content"].encode() for row in rows]
+    dictionary_id = repository.add_body_dictionary(train_dictionary(samples, 4096))
+    assert repository.recompress_bodies(batch_size=50) > 0
+
+    after = repository.db.execute(text("SELECT sum(length(data)) FROM article_bodies")).scalar()
+    assert after < before
+    assert repository.db.execute(
+        text("SELECT count(*) FROM article_bodies WHERE dictionary_id = :id"), {"id": dictionary_id}
+    ).scalar() > 0
+    # A process that has not loaded the dictionary yet fetches it on demand.
+    get_body_codec.cache_clear()
+    assert [article.content for article in repository.get_articles()] == [row["content"] for row in rows]
+    assert repository.activate_latest_dictionary() == dictionary_id
+    assert repository.recompress_bodies() == 0
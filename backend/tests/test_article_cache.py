@@ -0,0 +1,109 @@
+import threading
+import time
+
+from backend.repositories.article_repository import ArticleRepository
+from backend.schemas.article import ArticleCreate, ArticleResponse
+from backend.services.article_cache import ArticleCache, CacheBackend, InProcessCacheBackend
+from backend.services.article_service import ArticleService
+
+
+class LocalSharedBackend(CacheBackend):
+    """Stand-in for a shared cache server: a plain dict that ignores TTLs."""
+
+    def __init__(self):
+        self.data = {}
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def set(self, key, value, ttl):
+        self.data[key] = value
+
+    def delete(self, key):
+        self.data.pop(key, None)
+
+
+def test_read_through_and_invalidation_with_shared_backend(db_session):
+    backend = LocalSharedBackend()
+    cache = ArticleCache(backend, ttl=60)
+    service = ArticleService(ArticleRepository(db_session), article_cache=cache)
+    created = service.create_article(ArticleCreate(title="Popular", content="post"))
+
+    # Creating the article stores its entry, so every read is a hit.
+    assert backend.data[ArticleCache.key(created.id)].startswith(b'"article-')
+    assert service.get_article_by_id(created.id).title == "Popular"
+    assert service.get_article_by_id(created.id).title == "Popular"
+    assert service.get_article_etag(created.id) == f'"article-{created.id}-v1"'
+    assert cache.stats()["hits"] == 3
+    assert cache.stats()["loads"] == 0
+
+    assert service.delete_article(created.id) is True
+    assert ArticleCache.key(created.id) not in backend.data
+    assert service.get_article_by_id(created.id) is None
+
+
+def test_concurrent_misses_load_once():
+    cache = ArticleCache(InProcessCacheBackend(max_size=10, ttl=60), ttl=60)
+    calls = []
+
+    def loader():
+        calls.append(1)
+        time.sleep(0.05)
+        return ArticleResponse(id=1, title="Hot", content="key"), '"article-1-v1"'
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(cache.get_or_load(1, loader))) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert all(result[0].title == "Hot" for result in results)
+    assert cache.stats()["loads"] == 1
+
+
+def test_raw_reads_serve_stored_bytes(db_session):
+    cache = ArticleCache(LocalSharedBackend(), ttl=60)
+    service = ArticleService(ArticleRepository(db_session), article_cache=cache)
+    created = service.create_article(ArticleCreate(title="Bytes", content="as stored"))
+
+    cache.invalidate(created.id)
+
+    body, etag, encoding = service.get_article_json(created.id)
+    again, _, _ = service.get_article_json(created.id)
+
+    assert again == body
+    assert encoding is None
+    assert etag == f'"article-{created.id}-v1"'
+    assert ArticleResponse.model_validate_json(body) == created
+    assert ArticleService(ArticleRepository(db_session)).get_article_json(created.id) == (body, etag, None)
+    assert cache.stats()["loads"] == 1
+
+
+def test_batch_reads_hits_and_loads_misses_together(db_session):
+    backend = LocalSharedBackend()
+    cache = ArticleCache(backend, ttl=60, encodings=("gzip",))
+    service = ArticleService(ArticleRepository(db_session), article_cache=cache)
+    first, second, third = (
+        service.create_article(ArticleCreate(title=title, content="body " * 100)) for title in ("One", "Two", "Three")
+    )
+    cache.invalidate(first.id)
+    cache.invalidate(third.id)
+    loads = []
+
+    def loader(article_ids):
+        loads.append(article_ids)
+        return service._load_articles(article_ids)
+
+    found = cache.get_many_raw([third.id, 99, second.id, first.id], loader)
+
+    assert loads == [[third.id, 99, first.id]]
+    assert set(found) == {first.id, second.id, third.id}
+    assert ArticleResponse.model_validate_json(found[third.id][0]) == third
+    assert cache.stats() == {"hits": 1, "misses": 3, "loads": 3, "hit_ratio": 0.25}
+    # Loaded entries hold the JSON only; the written one kept its compressed copy.
+    assert cache.peek_raw(first.id, "gzip")[2] is None
+    assert cache.peek_raw(second.id, "gzip")[2] == "gzip"
+    assert cache.get_many_raw([first.id, third.id], loader).keys() == {first.id, third.id}
+    assert len(loads) == 1
@@ -0,0 +1,38 @@
+import io
+import json
+
+from backend.models.article import Article
+from backend.repositories.article_repository import ArticleRepository
+from backend.services.article_import import ArticleImporter
+
+
+def test_import_batches_rows_and_reports_failures(db_session):
+    lines = [json.dumps({"title": f"T{i}", "content": "body"}) for i in range(5)]
+    lines.insert(2, '{"title": "missing content"}')
+    lines.insert(4, "not json")
+    lines.append("")
+    errors = io.StringIO()
+    progress = []
+
+    importer = ArticleImporter(
+        ArticleRepository(db_session),
+        batch_size=2,
+        error_sink=errors,
+        progress=lambda report: progress.append(report.imported),
+    )
+    importer.feed(line.encode() for line in lines)
+    report = importer.close()
+
+    assert (report.imported, report.failed, report.batches) == (5, 2, 3)
+    assert progress == [2, 4, 5]
+    assert db_session.query(Article).count() == 5
+    rejected = [json.loads(line) for line in errors.getvalue().splitlines()]
+    assert [r["line"] for r in rejected] == [3, 5]
+    assert rejected[1]["raw"] == "not json"
+
+
+def test_imported_rows_are_searchable(db_session):
+    importer = ArticleImporter(ArticleRepository(db_session), batch_size=10)
+    importer.feed([json.dumps({"title": "Bulk loaded", "content": "archive"})])
+    importer.close()
+    assert [r.title for r in ArticleRepository(db_session).search_articles("archive")] == ["Bulk loaded"]
@@ -1,25 +1,12 @@
+from datetime import datetime, timedelta, timezone
+
 import pytest
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from fastapi import HTTPException
 
-from backend.core.database import Base
 from backend.models.article import Article
-from backend.repositories.article_repository import ArticleRepository
+from backend.repositories.article_repository import ArticleQuery, ArticleRepository
 from backend.schemas.article import ArticleCreate
 from backend.services.article_service import ArticleService
-import backend.models  # noqa: F401 - ensure models are imported for metadata
-
-
-@pytest.fixture
-def db_session():
-    engine = create_engine("sqlite:///:memory:")
-    TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-    Base.metadata.create_all(bind=engine)
-    session = TestingSessionLocal()
-    try:
-        yield session
-    finally:
-        session.close()
 
 
 @pytest.fixture
@@ -76,3 +63,102 @@ def test_search_articles(article_service, db_session):
     results = article_service.search_articles("React")
     assert len(results) == 1
     assert results[0].title == "React Tips"
+
+
+def test_get_articles_page_walks_cursor(article_service, db_session):
+    db_session.add_all([Article(title=f"T{i}", content="x" * 500) for i in range(5)])
+    db_session.commit()
+
+    first = article_service.get_articles_page(limit=2)
+    assert [a.title for a in first.items] == ["T0", "T1"]
+    assert len(first.items[0].excerpt) <= 200
+    assert first.next_cursor is not None
+
+    second = article_service.get_articles_page(limit=2, after=first.next_cursor)
+    third = article_service.get_articles_page(limit=2, after=second.next_cursor)
+    assert [a.title for a in second.items] == ["T2", "T3"]
+    assert [a.title for a in third.items] == ["T4"]
+    assert third.next_cursor is None
+
+
+def test_get_articles_page_rejects_bad_cursor(article_service):
+    with pytest.raises(HTTPException) as exc:
+        article_service.get_articles_page(limit=2, after="not-a-cursor")
+    assert exc.value.status_code == 400
+
+
+def test_filtered_pages_walk_a_composite_cursor(article_service, db_session):
+    start = datetime(2026, 1, 1)
+    # Two articles share each timestamp, so the cursor must break ties on id.
+    db_session.add_all(
+        [
+            Article(title=f"T{i}", content="x", published=i != 4, created_at=start + timedelta(hours=i // 2))
+            for i in range(7)
+        ]
+    )
+    db_session.commit()
+
+    query = ArticleQuery(published=True)
+    titles, after = [], None
+    while True:
+        page = article_service.get_articles_page(limit=2, after=after, query=query)
+        titles += [item.title for item in page.items]
+        if page.next_cursor is None:
+            break
+        after = page.next_cursor
+    assert titles == ["T6", "T5", "T3", "T2", "T1", "T0"]
+
+    ranged = article_service.get_articles_page(
+        limit=10,
+        query=ArticleQuery(
+            published=True,
+            created_after=datetime(2026, 1, 1, 1, tzinfo=timezone.utc),
+            created_before=start + timedelta(hours=3),
+            sort="created_at",
+        ),
+    )
+    assert [item.title for item in ranged.items] == ["T2", "T3", "T5"]
+
+    prefixed = article_service.get_articles_page(limit=10, query=ArticleQuery(title_prefix="T1"))
+    assert [item.title for item in prefixed.items] == ["T1"]
+
+
+def test_unsupported_filter_combination_is_rejected(article_service, db_session):
+    db_session.add_all([Article(title=f"T{i}", content="x") for i in range(2)])
+    db_session.commit()
+    with pytest.raises(HTTPException) as exc:
+        article_service.get_articles_page(limit=2, query=ArticleQuery(published=True, title_prefix="T"))
+    assert exc.value.status_code == 400
+    assert "Allowed" in exc.value.detail
+
+    first = article_service.get_articles_page(limit=1)
+    with pytest.raises(HTTPException):
+        # A cursor is only valid for the sort it was issued for.
+        article_service.get_articles_page(
+            limit=1, after=first.next_cursor, query=ArticleQuery(published=True)
+        )
+
+
+def test_search_ranks_title_matches_and_highlights(article_service, db_session):
+    db_session.add_all(
+        [
+            Article(title="Cooking notes", content="A short python aside"),
+            Article(title="Python packaging", content="wheels and sdists"),
+        ]
+    )
+    db_session.commit()
+
+    results = article_service.search_articles("pyth")
+    assert [r.title for r in results] == ["Python packaging", "Cooking notes"]
+    assert "<mark>" in results[0].snippet
+
+    assert len(article_service.search_articles("pyth", limit=1, offset=1)) == 1
+    assert article_service.search_articles("!!!") == []
+
+
+def test_search_index_follows_create_and_delete(article_service):
+    created = article_service.create_article(ArticleCreate(title="Zebra facts", content="stripes"))
+    assert [r.id for r in article_service.search_articles("zebra")] == [created.id]
+
+    article_service.delete_article(created.id)
+    assert article_service.search_articles("zebra") == []
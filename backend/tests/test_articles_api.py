@@ -0,0 +1,169 @@
+import json
+
+from backend.core.config import Config
+from backend.core.database import QueryCounter
+from backend.services.article_cache import get_article_cache
+
+
+def test_bulk_import_streams_ndjson(client, headers):
+    def body():
+        yield b'{"title": "One", "content": "a"}\n{"title": "Tw'
+        yield b'o", "content": "b"}\nbroken\n{"title": "Three", "content": "c"}'
+
+    response = client.post("/api/articles/bulk", params={"batch_size": 2}, content=body(), headers=headers)
+    assert response.status_code == 200
+    result = response.json()
+    assert (result["imported"], result["failed"]) == (3, 1)
+    errors = client.get(result["error_url"], headers=headers)
+    assert errors.headers["content-type"] == "application/x-ndjson"
+    assert '"raw": "broken"' in errors.text
+
+    page = client.get("/api/articles/", headers=headers).json()
+    assert [item["title"] for item in page["items"]] == ["One", "Two", "Three"]
+
+    # The error records hold the importer's data, so only the importer gets them.
+    tokens = client.post("/api/auth/register", json={"email": "other@example.com", "password": "supersecret"}).json()
+    other = {"Authorization": f"Bearer {tokens['access_token']}", "X-CSRF-Token": tokens["csrf_token"]}
+    assert client.get(result["error_url"], headers=other).status_code == 404
+    assert client.get("/api/articles/bulk/not-an-import/errors", headers=headers).status_code == 422
+
+
+def test_bulk_import_rejects_oversized_lines_without_buffering_them(client, headers, monkeypatch):
+    monkeypatch.setattr(Config, "IMPORT_MAX_LINE_BYTES", 64)
+
+    def body():
+        yield b'{"title": "One", "content": "a"}\n{"title": "Long", "content": "'
+        yield b"x" * 100
+        yield b"x" * 100 + b'"}\n{"title": "Two", "content": "'
+        yield b"y" * 100 + b'"}\n{"title": "Three", "content": "c"}'
+
+    result = client.post("/api/articles/bulk", content=body(), headers=headers).json()
+
+    assert (result["imported"], result["failed"]) == (2, 2)
+    records = [json.loads(line) for line in client.get(result["error_url"], headers=headers).text.splitlines()]
+    assert [record["line"] for record in records] == [2, 3]
+    assert records[0]["error"] == "line longer than 64 bytes"
+    assert records[0]["raw"].startswith('{"title": "Long"')
+    page = client.get("/api/articles/", headers=headers).json()
+    assert [item["title"] for item in page["items"]] == ["One", "Three"]
+
+
+def test_export_streams_all_articles(client, headers):
+    for title in ("One", "Two"):
+        client.post("/api/articles/", json={"title": title, "content": "body"}, headers=headers)
+
+    response = client.get("/api/articles/export", params={"format": "csv"}, headers=headers)
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/csv")
+    assert response.text.splitlines()[1:] == ["1,One,body,True", "2,Two,body,True"]
+
+
+def test_article_etag_and_conditional_get(client, headers):
+    article_id = client.post("/api/articles/", json={"title": "Cached", "content": "body"}, headers=headers).json()["id"]
+
+    first = client.get(f"/api/articles/{article_id}", headers=headers)
+    etag = first.headers["etag"]
+    assert etag == f'"article-{article_id}-v1"'
+    assert first.headers["cache-control"] == Config.ARTICLE_CACHE_CONTROL
+
+    revalidated = client.get(f"/api/articles/{article_id}", headers={**headers, "If-None-Match": etag})
+    assert revalidated.status_code == 304
+    assert revalidated.content == b""
+    stale = client.get(f"/api/articles/{article_id}", headers={**headers, "If-None-Match": '"article-0-v0"'})
+    assert stale.status_code == 200
+
+
+def test_recreated_article_does_not_match_a_deleted_ones_etag(client, headers):
+    deleted_id = client.post("/api/articles/", json={"title": "Old", "content": "a"}, headers=headers).json()["id"]
+    etag = client.get(f"/api/articles/{deleted_id}", headers=headers).headers["etag"]
+    assert client.delete(f"/api/articles/{deleted_id}", headers=headers).status_code == 204
+
+    created_id = client.post("/api/articles/", json={"title": "New", "content": "b"}, headers=headers).json()["id"]
+    assert created_id != deleted_id
+    response = client.get(f"/api/articles/{created_id}", headers={**headers, "If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.json()["title"] == "New"
+
+
+def test_collection_etag_changes_on_write(client, headers):
+    client.post("/api/articles/", json={"title": "One", "content": "a"}, headers=headers)
+    etag = client.get("/api/articles/", headers=headers).headers["etag"]
+    assert client.get("/api/articles/", headers={**headers, "If-None-Match": etag}).status_code == 304
+
+    client.post("/api/articles/", json={"title": "Two", "content": "b"}, headers=headers)
+    refreshed = client.get("/api/articles/", headers={**headers, "If-None-Match": etag})
+    assert refreshed.status_code == 200
+    assert refreshed.headers["etag"] != etag
+
+
+def test_list_filters_by_author_and_title_prefix(client, headers):
+    for title in ("Alpha", "Beta", "Alpine"):
+        client.post("/api/articles/", json={"title": title, "content": "c"}, headers=headers)
+    me = client.get("/api/auth/me", headers=headers).json()
+
+    mine = client.get("/api/articles/", params={"author_id": me["id"], "sort": "created_at"}, headers=headers).json()
+    assert [item["title"] for item in mine["items"]] == ["Alpha", "Beta", "Alpine"]
+    assert all(item["created_at"] for item in mine["items"])
+
+    prefixed = client.get("/api/articles/", params={"title_prefix": "Alp"}, headers=headers).json()
+    assert [item["title"] for item in prefixed["items"]] == ["Alpha", "Alpine"]
+
+    refused = client.get("/api/articles/", params={"title_prefix": "Alp", "sort": "-created_at"}, headers=headers)
+    assert refused.status_code == 400
+    assert client.get("/api/articles/", params={"sort": "content"}, headers=headers).status_code == 422
+
+
+def test_queries_per_request(client, headers, app_engine):
+    # Warm the token cache so only the endpoint's own queries are counted.
+    client.get("/api/auth/me", headers=headers)
+
+    with QueryCounter(app_engine) as queries:
+        article_id = client.post("/api/articles/", json={"title": "Q", "content": "body"}, headers=headers).json()["id"]
+    # INSERT ... RETURNING, the body, the search index entry, then the
+    # collection version (bumped, created on first write).
+    assert queries.count == 5
+    with QueryCounter(app_engine) as queries:
+        client.post("/api/articles/", json={"title": "R", "content": "body"}, headers=headers)
+    assert queries.count == 4
+
+    with QueryCounter(app_engine) as queries:
+        client.get("/api/articles/", headers=headers)
+    assert queries.count == 2
+    # Creating the article already stored its cache entry.
+    with QueryCounter(app_engine) as queries:
+        client.get(f"/api/articles/{article_id}", headers=headers)
+    assert queries.count == 0
+
+    with QueryCounter(app_engine) as queries:
+        assert client.delete(f"/api/articles/{article_id}", headers=headers).status_code == 204
+    # DELETE ... RETURNING of the body and the article, the index entry, the collection version.
+    assert queries.count == 4
+    assert not any(statement.lstrip().upper().startswith("SELECT") for statement in queries.statements)
+    with QueryCounter(app_engine) as queries:
+        assert client.delete(f"/api/articles/{article_id}", headers=headers).status_code == 404
+    assert queries.count == 2
+
+
+def test_batch_read_preserves_order_and_reports_missing(client, headers, app_engine):
+    ids = [
+        client.post("/api/articles/", json={"title": title, "content": "body"}, headers=headers).json()["id"]
+        for title in ("One", "Two", "Three")
+    ]
+    get_article_cache().invalidate(ids[0])
+    get_article_cache().invalidate(ids[2])
+    client.get("/api/auth/me", headers=headers)
+
+    requested = [ids[2], 404, ids[0], ids[1], ids[2]]
+    with QueryCounter(app_engine) as queries:
+        response = client.get(
+            "/api/articles/batch", params={"ids": ",".join(map(str, requested))}, headers=headers
+        )
+    # Both cache misses come from one query.
+    assert queries.count == 1
+    batch = response.json()
+    assert [item["title"] for item in batch["items"]] == ["Three", "One", "Two"]
+    assert batch["missing"] == [404]
+
+    assert client.get("/api/articles/batch", params={"ids": "1,x"}, headers=headers).status_code == 422
+    too_many = ",".join(["1"] * (Config.ARTICLES_BATCH_MAX_IDS + 1))
+    assert client.get("/api/articles/batch", params={"ids": too_many}, headers=headers).status_code == 422
@@ -0,0 +1,120 @@
+import asyncio
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+from backend.api import async_articles, async_auth
+from backend.core.async_database import (
+    get_async_db,
+    get_async_read_db,
+    get_async_read_sessionmaker,
+    to_async_url,
+)
+from backend.core.config import Config
+from backend.core.database import Base
+from backend.services.article_cache import get_article_cache
+import backend.models  # noqa: F401 - ensure models are imported for metadata
+
+
+@pytest.fixture
+def client(monkeypatch, tmp_path):
+    monkeypatch.setattr(Config, "IMPORT_ERROR_DIR", str(tmp_path))
+    # Process-wide caches must not leak articles between test databases.
+    get_article_cache.cache_clear()
+    engine = create_async_engine(
+        "sqlite+aiosqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+
+    async def create_schema():
+        async with engine.begin() as connection:
+            await connection.run_sync(Base.metadata.create_all)
+
+    asyncio.run(create_schema())
+    TestingSessionLocal = async_sessionmaker(engine, autoflush=False, expire_on_commit=False)
+
+    async def override_get_async_db():
+        async with TestingSessionLocal() as db:
+            yield db
+
+    app = FastAPI()
+    app.include_router(async_auth.router, prefix="/api")
+    app.include_router(async_articles.router, prefix="/api")
+    app.dependency_overrides[get_async_db] = override_get_async_db
+    app.dependency_overrides[get_async_read_db] = override_get_async_db
+    with TestClient(app) as test_client:
+        yield test_client
+    asyncio.run(engine.dispose())
+
+
+def test_to_async_url_picks_async_driver():
+    assert to_async_url("sqlite:///./test.db") == "sqlite+aiosqlite:///./test.db"
+    assert to_async_url("postgresql+psycopg2://u@h/db") == "postgresql+asyncpg://u@h/db"
+
+
+def test_async_reads_use_the_replica_when_configured(monkeypatch, tmp_path):
+    monkeypatch.setattr(Config, "DATABASE_REPLICA_URL", f"sqlite:///{tmp_path / 'replica.db'}")
+    get_async_read_sessionmaker.cache_clear()
+    try:
+        engine = get_async_read_sessionmaker().kw["bind"]
+        assert str(engine.url) == f"sqlite+aiosqlite:///{tmp_path / 'replica.db'}"
+        asyncio.run(engine.dispose())
+    finally:
+        get_async_read_sessionmaker.cache_clear()
+
+
+def test_async_routes_register_create_page_search_delete(client):
+    tokens = client.post(
+        "/api/auth/register", json={"email": "user@example.com", "password": "supersecret"}
+    ).json()
+    headers = {"Authorization": f"Bearer {tokens['access_token']}", "X-CSRF-Token": tokens["csrf_token"]}
+
+    assert client.get("/api/auth/me", headers=headers).json()["email"] == "user@example.com"
+    created = client.post("/api/articles/", json={"title": "Async hello", "content": "aiosqlite"}, headers=headers)
+    article_id = created.json()["id"]
+
+    page = client.get("/api/articles/", headers=headers).json()
+    assert [item["id"] for item in page["items"]] == [article_id]
+    fetched = client.get(f"/api/articles/{article_id}", headers=headers)
+    etag = fetched.headers["etag"]
+    assert client.get(f"/api/articles/{article_id}", headers={**headers, "If-None-Match": etag}).status_code == 304
+    batch = client.get("/api/articles/batch", params={"ids": f"{article_id},999"}, headers=headers).json()
+    assert ([item["title"] for item in batch["items"]], batch["missing"]) == (["Async hello"], [999])
+    hits = client.get("/api/articles/search", params={"q": "async"}, headers=headers).json()
+    assert [hit["id"] for hit in hits] == [article_id]
+
+    assert client.delete(f"/api/articles/{article_id}", headers=headers).status_code == 204
+    assert client.get(f"/api/articles/{article_id}", headers=headers).status_code == 404
+
+
+def _register(client, email="user@example.com"):
+    tokens = client.post("/api/auth/register", json={"email": email, "password": "supersecret"}).json()
+    return {"Authorization": f"Bearer {tokens['access_token']}", "X-CSRF-Token": tokens["csrf_token"]}
+
+
+def test_async_bulk_import_and_its_errors(client):
+    headers = _register(client)
+    body = b'{"title": "One", "content": "a"}\nbroken\n{"title": "Two", "content": "b"}\n'
+    result = client.post("/api/articles/bulk", params={"batch_size": 1}, content=body, headers=headers).json()
+    assert (result["imported"], result["failed"]) == (2, 1)
+
+    errors = client.get(result["error_url"], headers=headers)
+    assert errors.headers["content-type"] == "application/x-ndjson"
+    assert '"raw": "broken"' in errors.text
+    assert client.get(result["error_url"], headers=_register(client, "other@example.com")).status_code == 404
+
+    page = client.get("/api/articles/", headers=headers).json()
+    assert [item["title"] for item in page["items"]] == ["One", "Two"]
+
+
+def test_async_export_is_not_taken_for_an_article_id(client):
+    headers = _register(client)
+    for title in ("One", "Two"):
+        client.post("/api/articles/", json={"title": title, "content": "body"}, headers=headers)
+
+    response = client.get("/api/articles/export", params={"format": "csv"}, headers=headers)
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/csv")
+    assert response.text.splitlines()[1:] == ["1,One,body,True", "2,Two,body,True"]
@@ -1,29 +1,20 @@
+import asyncio
+from unittest.mock import patch
+
 import pytest
 from fastapi import HTTPException
-from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 
 from backend.core import security
-from backend.core.database import Base
 from backend.repositories.auth_repository import AuthRepository
 from backend.schemas.auth_schema import TokenRefreshRequest, UserCreate, UserLogin
+from backend.services.auth_cache import AuthTokenCache
 from backend.services.auth_service import AuthService
+from backend.services.token_revocation import TokenRevocationList
 from backend.models.user import User
 import backend.models  # noqa: F401 - ensure models are imported for metadata
 
 
-@pytest.fixture
-def db_session():
-    engine = create_engine("sqlite:///:memory:")
-    TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-    Base.metadata.create_all(bind=engine)
-    session = TestingSessionLocal()
-    try:
-        yield session
-    finally:
-        session.close()
-
-
 @pytest.fixture
 def auth_service(db_session):
     return AuthService(AuthRepository(db_session))
@@ -88,3 +79,106 @@ def test_current_user_requires_csrf(auth_service):
 
     user = auth_service.get_current_user(tokens.access_token, csrf_header=tokens.csrf_token)
     assert user.email == "user@example.com"
+
+
+def test_current_user_served_from_token_cache(db_session):
+    token_cache = AuthTokenCache(max_size=16)
+    service = AuthService(AuthRepository(db_session), token_cache=token_cache)
+    service.register_user(UserCreate(email="user@example.com", password="supersecret"))
+    tokens = service.login(UserLogin(email="user@example.com", password="supersecret"))
+
+    first = service.get_current_user(tokens.access_token, csrf_header=tokens.csrf_token)
+    with patch.object(service.auth_repository, "get_by_id", side_effect=AssertionError("db hit")):
+        assert service.get_current_user(tokens.access_token, csrf_header=tokens.csrf_token) == first
+        with pytest.raises(HTTPException) as exc:
+            service.get_current_user(tokens.access_token, csrf_header="wrong")
+        assert exc.value.status_code == 403
+
+
+def test_deactivation_invalidates_cached_token(db_session):
+    token_cache = AuthTokenCache(max_size=16)
+    service = AuthService(AuthRepository(db_session), token_cache=token_cache)
+    user = service.register_user(UserCreate(email="user@example.com", password="supersecret"))
+    tokens = service.login(UserLogin(email="user@example.com", password="supersecret"))
+    service.get_current_user(tokens.access_token, csrf_header=tokens.csrf_token)
+
+    service.deactivate_user(user.id)
+    with pytest.raises(HTTPException) as exc:
+        service.get_current_user(tokens.access_token, csrf_header=tokens.csrf_token)
+    assert exc.value.status_code == 403
+
+
+def test_async_register_and_login_await_the_password_pool(app_engine):
+    # Queries run in threadpool threads, which must all see one in-memory database.
+    credentials = UserLogin(email="user@example.com", password="supersecret")
+    with sessionmaker(bind=app_engine)() as session:
+        service = AuthService(AuthRepository(session))
+        # A blocking wait on the pool would hold the calling thread.
+        with patch.object(security.get_password_pool(), "run", side_effect=AssertionError("blocking wait")):
+            user = asyncio.run(service.aregister_user(UserCreate(email=credentials.email, password=credentials.password)))
+            tokens = asyncio.run(service.alogin(credentials))
+            with pytest.raises(HTTPException) as exc:
+                asyncio.run(service.alogin(UserLogin(email=credentials.email, password="wrong-password")))
+    assert security.decode_token(tokens.access_token)["sub"] == str(user.id)
+    assert exc.value.status_code == 401
+
+
+def test_refresh_rotates_and_detects_reuse(auth_service):
+    auth_service.register_user(UserCreate(email="user@example.com", password="supersecret"))
+    tokens = auth_service.login(UserLogin(email="user@example.com", password="supersecret"))
+
+    rotated = auth_service.refresh_tokens(tokens.refresh_token)
+    assert security.decode_token(rotated.refresh_token)["fam"] == security.decode_token(tokens.refresh_token)["fam"]
+
+    # Replaying the used token revokes the whole family, including the rotated tokens.
+    with pytest.raises(HTTPException) as exc:
+        auth_service.refresh_tokens(tokens.refresh_token)
+    assert exc.value.status_code == 401
+    with pytest.raises(HTTPException):
+        auth_service.refresh_tokens(rotated.refresh_token)
+    with pytest.raises(HTTPException):
+        auth_service.get_current_user(rotated.access_token, csrf_header=rotated.csrf_token)
+
+
+def test_logout_revokes_only_its_session(db_session):
+    revocations = TokenRevocationList(capacity=100)
+    service = AuthService(AuthRepository(db_session), token_cache=AuthTokenCache(max_size=16), revocations=revocations)
+    service.register_user(UserCreate(email="user@example.com", password="supersecret"))
+    first = service.login(UserLogin(email="user@example.com", password="supersecret"))
+    second = service.login(UserLogin(email="user@example.com", password="supersecret"))
+    service.get_current_user(first.access_token, csrf_header=first.csrf_token)
+
+    service.logout(first.refresh_token)
+
+    with pytest.raises(HTTPException) as exc:
+        service.get_current_user(first.access_token, csrf_header=first.csrf_token)
+    assert exc.value.status_code == 401
+    assert service.get_current_user(second.access_token, csrf_header=second.csrf_token).email == "user@example.com"
+
+
+def test_refresh_leaves_the_revocation_filter_alone(db_session):
+    revocations = TokenRevocationList(capacity=100)
+    service = AuthService(AuthRepository(db_session), revocations=revocations)
+    service.register_user(UserCreate(email="user@example.com", password="supersecret"))
+    tokens = service.login(UserLogin(email="user@example.com", password="supersecret"))
+
+    service.refresh_tokens(service.refresh_tokens(tokens.refresh_token).refresh_token)
+
+    # Used token ids are neither added to the filter nor announced to other workers.
+    assert revocations.pending() is None
+    assert security.decode_token(tokens.refresh_token)["jti"] not in revocations
+    with pytest.raises(HTTPException):
+        service.refresh_tokens(tokens.refresh_token)
+    assert revocations.pending() is not None
+
+
+def test_revocation_filter_skips_the_database(db_session):
+    revocations = TokenRevocationList(capacity=100)
+    service = AuthService(AuthRepository(db_session), token_cache=AuthTokenCache(max_size=16), revocations=revocations)
+    service.register_user(UserCreate(email="user@example.com", password="supersecret"))
+    tokens = service.login(UserLogin(email="user@example.com", password="supersecret"))
+    service.get_current_user(tokens.access_token, csrf_header=tokens.csrf_token)
+
+    with patch.object(service.auth_repository, "is_revoked", side_effect=AssertionError("db hit")), \
+            patch.object(service.auth_repository, "revocations_since", side_effect=AssertionError("db hit")):
+        service.get_current_user(tokens.access_token, csrf_header=tokens.csrf_token)
@@ -0,0 +1,31 @@
+from sqlalchemy import create_engine, select
+
+from backend.benchmarks.datagen import article_rows, generate
+from backend.benchmarks.results import compare, percentile, summarize
+from backend.models.article import Article
+
+
+def test_summary_and_regression_check():
+    assert percentile([1, 2, 3, 4], 50) == 2
+    assert percentile([float(n) for n in range(1, 101)], 99) == 99.0
+    assert summarize([0.001, 0.003])["p99_ms"] == 3.0
+
+    before = {"results": {"get": {"p50_ms": 10.0, "p99_ms": 20.0, "rps": 100.0}}}
+    slower = {"results": {"get": {"p50_ms": 10.5, "p99_ms": 30.0, "rps": 80.0}}}
+    assert compare(before, before, 0.1) == []
+    assert [line.split(":")[0] for line in compare(before, slower, 0.1)] == ["get p99_ms", "get rps"]
+
+
+def test_generated_articles_are_deterministic_and_topped_up(tmp_path):
+    url = f"sqlite:///{tmp_path / 'bench.db'}"
+    assert list(article_rows(5, 2)) == list(article_rows(5, 2))
+
+    assert generate(url, 30, batch_size=8) == 30
+    assert generate(url, 45, batch_size=8) == 15
+
+    engine = create_engine(url)
+    with engine.connect() as connection:
+        titles = connection.execute(select(Article.title).order_by(Article.id)).scalars().all()
+    engine.dispose()
+    assert len(titles) == 45
+    assert titles[40] == next(article_rows(41, 1))["title"]
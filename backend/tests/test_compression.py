@@ -0,0 +1,97 @@
+import gzip
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from backend.core.compression import CODECS, CompressionMiddleware, negotiate
+from backend.core.serialization import JSONBytesResponse
+from backend.schemas.article import ArticleResponse
+from backend.services.article_cache import ArticleCache, InProcessCacheBackend, get_article_cache
+
+LARGE = {"items": [{"id": i, "title": f"Article {i}"} for i in range(200)]}
+
+
+@pytest.fixture
+def plain_client():
+    app = FastAPI()
+    app.add_middleware(CompressionMiddleware, minimum_size=500)
+
+    @app.get("/large")
+    def large():
+        return JSONBytesResponse(LARGE)
+
+    @app.get("/small")
+    def small():
+        return JSONBytesResponse({"ok": True})
+
+    with TestClient(app) as client:
+        yield client
+
+
+@pytest.fixture
+def configure_app():
+    return lambda app: app.add_middleware(CompressionMiddleware, minimum_size=500)
+
+
+def test_negotiate_follows_weights_then_server_preference():
+    encodings = ("zstd", "br", "gzip")
+    assert negotiate("gzip, br", encodings) == "br"
+    assert negotiate("gzip;q=1.0, br;q=0.5", encodings) == "gzip"
+    assert negotiate("br;q=0, gzip", encodings) == "gzip"
+    assert negotiate("*", encodings) == "zstd"
+    assert negotiate("identity", encodings) is None
+    assert negotiate(None, encodings) is None
+
+
+def test_middleware_compresses_large_bodies_only(plain_client):
+    response = plain_client.get("/large", headers={"Accept-Encoding": "gzip"})
+    assert response.headers["content-encoding"] == "gzip"
+    assert "Accept-Encoding" in response.headers["vary"]
+    assert response.json() == LARGE
+
+    small = plain_client.get("/small", headers={"Accept-Encoding": "gzip"})
+    assert "content-encoding" not in small.headers
+    assert "Accept-Encoding" in small.headers["vary"]
+
+    identity = plain_client.get("/large", headers={"Accept-Encoding": "identity"})
+    assert "content-encoding" not in identity.headers
+
+
+def test_article_reads_use_precompressed_copies(client, headers):
+    content = "A paragraph that repeats itself. " * 200
+    article_id = client.post("/api/articles/", json={"title": "Long", "content": content}, headers=headers).json()["id"]
+
+    response = client.get(f"/api/articles/{article_id}", headers={**headers, "Accept-Encoding": "gzip"})
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["etag"] == f'W/"article-{article_id}-v1"'
+    assert response.json()["content"] == content
+
+    cached = get_article_cache().peek_raw(article_id, "gzip")
+    assert cached[2] == "gzip"
+    assert gzip.decompress(cached[0]) == response.content
+
+    revalidated = client.get(
+        f"/api/articles/{article_id}",
+        headers={**headers, "Accept-Encoding": "gzip", "If-None-Match": response.headers["etag"]},
+    )
+    assert revalidated.status_code == 304
+
+    # Entries loaded on a miss skip the slow stored levels; the response is compressed on the way out.
+    get_article_cache().invalidate(article_id)
+    reloaded = client.get(f"/api/articles/{article_id}", headers={**headers, "Accept-Encoding": "gzip"})
+    assert reloaded.headers["content-encoding"] == "gzip"
+    assert reloaded.json()["content"] == content
+    assert get_article_cache().peek_raw(article_id, "gzip")[2] is None
+
+
+def test_cache_entries_skip_copies_that_do_not_shrink():
+    cache = ArticleCache(InProcessCacheBackend(max_size=10, ttl=60), ttl=60, encodings=tuple(CODECS))
+    cache.put(1, ArticleResponse(id=1, title="Hi", content="x"), '"article-1-v1"')
+    cache.put(2, ArticleResponse(id=2, title="Long", content="words " * 500), '"article-2-v1"')
+
+    assert cache.peek_raw(1, "gzip")[2] is None
+    for encoding in CODECS:
+        assert cache.peek_raw(2, encoding)[2] == encoding
+    # Entries written before the index line existed still read as plain JSON.
+    assert ArticleCache.split(b'"article-3-v1"\n{"id":3}', "gzip") == (b'{"id":3}', '"article-3-v1"', None)
@@ -0,0 +1,62 @@
+from sqlalchemy import text
+from sqlalchemy.pool import StaticPool
+
+from backend.core.database import create_engine_from_config, engine_options
+from backend.models.schema import create_schema
+
+
+def _pragma(engine, name):
+    with engine.connect() as connection:
+        return connection.execute(text(f"PRAGMA {name}")).scalar()
+
+
+def test_file_sqlite_engine_applies_pragmas(tmp_path):
+    engine = create_engine_from_config(f"sqlite:///{tmp_path / 'blog.db'}")
+    try:
+        assert _pragma(engine, "journal_mode") == "wal"
+        assert _pragma(engine, "synchronous") == 1  # NORMAL
+        assert _pragma(engine, "busy_timeout") == 5000
+        assert engine.pool.size() == 20
+    finally:
+        engine.dispose()
+
+
+def test_read_only_engine_rejects_writes(tmp_path):
+    url = f"sqlite:///{tmp_path / 'blog.db'}"
+    primary = create_engine_from_config(url)
+    replica = create_engine_from_config(url, read_only=True)
+    try:
+        with primary.begin() as connection:
+            connection.execute(text("CREATE TABLE t (x INTEGER)"))
+        assert _pragma(replica, "query_only") == 1
+        with replica.connect() as connection:
+            assert connection.execute(text("SELECT count(*) FROM t")).scalar() == 0
+    finally:
+        primary.dispose()
+        replica.dispose()
+
+
+def test_engine_options_per_dialect():
+    assert engine_options("sqlite://")["poolclass"] is StaticPool
+    server = engine_options("postgresql://user@db/blogs")
+    assert "connect_args" not in server
+    assert server["pool_pre_ping"] is True
+    assert server["pool_recycle"] == 1800
+
+
+def test_legacy_articles_table_gains_version_columns(tmp_path):
+    engine = create_engine_from_config(f"sqlite:///{tmp_path / 'legacy.db'}")
+    try:
+        with engine.begin() as connection:
+            connection.execute(
+                text("CREATE TABLE articles (id INTEGER PRIMARY KEY, title VARCHAR, content VARCHAR, published BOOLEAN)")
+            )
+            connection.execute(text("INSERT INTO articles (title, content, published) VALUES ('Old', 'row', 1)"))
+        create_schema(engine)
+        with engine.connect() as connection:
+            assert connection.execute(text("SELECT version FROM articles")).scalar() == 1
+            assert connection.execute(text("SELECT created_at FROM articles")).scalar() is not None
+            hits = connection.execute(text("SELECT rowid FROM articles_fts WHERE articles_fts MATCH 'old'")).all()
+            assert len(hits) == 1
+    finally:
+        engine.dispose()
@@ -0,0 +1,117 @@
+import asyncio
+import random
+
+import httpx
+from fastapi import FastAPI
+from fastapi.middleware.cors import CORSMiddleware
+
+from backend.core.config import Config
+from backend.core.load_shedding import (
+    AUTH,
+    READ,
+    WRITE,
+    AdaptiveLimit,
+    ConcurrencyLimiter,
+    LoadSheddingMiddleware,
+    build_concurrency_limiter,
+    route_class,
+)
+
+
+def test_route_classes():
+    assert route_class("POST", "/api/auth/login") == AUTH
+    assert route_class("POST", "/api/auth/register") == AUTH
+    assert route_class("POST", "/api/articles/") == WRITE
+    assert route_class("DELETE", "/api/articles/1") == WRITE
+    assert route_class("GET", "/api/articles/1") == READ
+    assert route_class("OPTIONS", "/api/articles/") is None
+
+
+def test_limit_backs_off_on_slow_samples_and_recovers():
+    limit = AdaptiveLimit(initial=10, minimum=2, maximum=20, window=10)
+    for _ in range(10):
+        limit.on_sample(0.01, inflight=10)
+    assert limit.limit > 10
+
+    for _ in range(30):
+        limit.on_sample(0.1, inflight=10)
+    assert limit.limit == 2
+
+    # Once load has passed, fast samples raise the limit again.
+    for _ in range(30):
+        limit.on_sample(0.01, inflight=1)
+    assert limit.limit > 2
+
+
+def test_light_load_keeps_the_limit_at_the_maximum():
+    rng = random.Random(7)
+    limit = AdaptiveLimit(initial=24, maximum=24)
+    for _ in range(5000):
+        # A normal spread of latencies with one to three requests in flight.
+        limit.on_sample(rng.lognormvariate(-4, 0.5), inflight=rng.randint(1, 3))
+    assert limit.limit == 24
+
+    # Nor do failures without queueing shed anything.
+    limit.on_sample(0.5, inflight=1, failed=True)
+    assert limit.limit == 24
+
+
+def test_baselines_are_kept_per_kind():
+    limit = AdaptiveLimit(initial=10, maximum=10)
+    limit.on_sample(0.001, inflight=10, kind="get")
+    limit.on_sample(0.05, inflight=10, kind="search")
+    limit.on_sample(0.05, inflight=10, kind="search")
+    assert limit.limit == 10
+
+    limit.on_sample(0.5, inflight=10, failed=True, kind="search")
+    assert limit.limit == 9
+
+
+def test_limits_start_at_the_maximum(monkeypatch):
+    monkeypatch.setattr(Config, "LOAD_SHEDDING_READ_MAX", 24)
+    # Nothing is shed below the cap before any latency has been measured.
+    assert build_concurrency_limiter().limits[READ].limit == 24
+
+
+def test_excess_requests_are_rejected_with_retry_after():
+    release = asyncio.Event()
+    app = FastAPI()
+
+    @app.get("/slow")
+    async def slow():
+        await release.wait()
+        return {"ok": True}
+
+    @app.post("/api/auth/login")
+    async def login():
+        return {"ok": True}
+
+    limiter = ConcurrencyLimiter(
+        {name: AdaptiveLimit(initial=1, maximum=1) for name in (AUTH, WRITE, READ)}
+    )
+    app.add_middleware(LoadSheddingMiddleware, limiter=limiter)
+    # Outermost, as in main.py, so the frontend can read a rejection.
+    app.add_middleware(CORSMiddleware, allow_origins=["http://localhost:5173"])
+
+    async def scenario():
+        transport = httpx.ASGITransport(app=app)
+        headers = {"Origin": "http://localhost:5173"}
+        async with httpx.AsyncClient(transport=transport, base_url="http://test", headers=headers) as client:
+            admitted = asyncio.create_task(client.get("/slow"))
+            while limiter.inflight[READ] == 0:
+                await asyncio.sleep(0.001)
+            rejected = await client.get("/slow")
+            # Other classes have budgets of their own.
+            login = await client.post("/api/auth/login")
+            release.set()
+            return (await admitted), rejected, login
+
+    admitted, rejected, login = asyncio.run(scenario())
+    assert admitted.status_code == 200
+    assert rejected.status_code == 503
+    assert rejected.headers["retry-after"] == "1"
+    assert rejected.headers["access-control-allow-origin"] == "http://localhost:5173"
+    assert login.status_code == 200
+    assert limiter.rejected == {AUTH: 0, WRITE: 0, READ: 1}
+    assert limiter.inflight[READ] == 0
+    assert 'requests_shed_total{class="read"} 1' in limiter.render()
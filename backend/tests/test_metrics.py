@@ -0,0 +1,45 @@
+import logging
+
+import pytest
+
+from backend.api import metrics as metrics_api
+from backend.core.metrics import Metrics, MetricsMiddleware, install_query_metrics, timer
+
+
+@pytest.fixture
+def metrics():
+    return Metrics(slow_request_ms=0)
+
+
+@pytest.fixture
+def configure_app(metrics, monkeypatch, app_engine):
+    monkeypatch.setattr(metrics_api, "get_metrics", lambda: metrics)
+    install_query_metrics(app_engine)
+
+    def configure(app):
+        app.add_middleware(MetricsMiddleware, metrics=metrics)
+        app.include_router(metrics_api.router)
+
+    return configure
+
+
+def test_metrics_are_recorded_per_route_template(client, headers, caplog):
+    with caplog.at_level(logging.WARNING, logger="backend.metrics"):
+        article_id = client.post("/api/articles/", json={"title": "M", "content": "body"}, headers=headers).json()["id"]
+    client.get(f"/api/articles/{article_id}", headers=headers)
+
+    body = client.get("/metrics").text
+
+    assert 'http_request_duration_seconds_count{method="GET",route="/api/articles/{article_id}",status="200"} 1' in body
+    assert 'operation_duration_seconds_count{operation="bcrypt_hash",route="/api/auth/register"} 1' in body
+    assert 'operation_duration_seconds_count{operation="jwt_decode",route="/api/articles/"} 1' in body
+    # User lookup for the uncached token, INSERT ... RETURNING, body insert, search index insert,
+    # collection version update + insert.
+    assert 'db_queries_per_request_sum{route="/api/articles/"} 6' in body
+    assert any("INSERT INTO articles" in record.getMessage() for record in caplog.records)
+
+
+def test_timer_is_a_noop_outside_requests():
+    with timer("jwt_decode") as timed:
+        pass
+    assert timed is None
@@ -0,0 +1,39 @@
+import threading
+
+import pytest
+from fastapi import HTTPException
+
+from backend.core.password_pool import PasswordWorkerPool
+
+
+def test_pool_runs_jobs_and_returns_results():
+    pool = PasswordWorkerPool(max_workers=2, queue_size=2)
+    try:
+        assert pool.run(pow, 2, 10) == 1024
+    finally:
+        pool.shutdown()
+
+
+def test_pool_rejects_when_queue_is_full():
+    pool = PasswordWorkerPool(max_workers=1, queue_size=0)
+    started, release = threading.Event(), threading.Event()
+
+    def blocking():
+        started.set()
+        release.wait(5)
+        return "done"
+
+    results = []
+    worker = threading.Thread(target=lambda: results.append(pool.run(blocking)))
+    worker.start()
+    try:
+        assert started.wait(5)
+        with pytest.raises(HTTPException) as exc:
+            pool.run(pow, 2, 2)
+        assert exc.value.status_code == 429
+        assert exc.value.headers["Retry-After"] == "1"
+    finally:
+        release.set()
+        worker.join()
+        pool.shutdown()
+    assert results == ["done"]
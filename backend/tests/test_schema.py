@@ -0,0 +1,214 @@
+from datetime import datetime, timedelta
+
+import pytest
+from alembic import command
+from alembic.autogenerate import compare_metadata
+from alembic.migration import MigrationContext
+from alembic.script import ScriptDirectory
+from sqlalchemy import insert, text
+from sqlalchemy.orm import Session
+
+from backend.core.database import Base, create_engine_from_config
+from backend.models.article import Article
+from backend.models.article_search import FTS_TABLE
+from backend.models.schema import HEAD_REVISION, alembic_config, create_schema, schema_is_current
+from backend.models.user import User
+from backend.repositories.auth_repository import AuthRepository
+from backend.repositories.article_repository import (
+    LISTING_COMBINATIONS,
+    ArticleQuery,
+    ArticleRepository,
+    articles_page_statement,
+)
+import backend.models  # noqa: F401 - ensure models are imported for metadata
+
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = create_engine_from_config(f"sqlite:///{tmp_path / 'schema.db'}")
+    create_schema(engine)
+    yield engine
+    engine.dispose()
+
+
+def _ignore_fts(obj, name, type_, reflected, compare_to):
+    return not (type_ == "table" and name.startswith(FTS_TABLE))
+
+
+def test_migrations_match_the_models(engine):
+    with engine.connect() as connection:
+        context = MigrationContext.configure(
+            connection, opts={"include_object": _ignore_fts, "compare_server_default": True}
+        )
+        assert compare_metadata(context, Base.metadata) == []
+
+
+def test_head_revision_matches_the_migrations(engine):
+    assert ScriptDirectory.from_config(alembic_config()).get_heads() == [HEAD_REVISION]
+    with engine.connect() as connection:
+        assert schema_is_current(connection)
+
+
+def test_migrations_downgrade_and_upgrade_again(engine):
+    with engine.begin() as connection:
+        command.downgrade(alembic_config(connection), "base")
+        assert not schema_is_current(connection)
+    create_schema(engine)
+    with engine.connect() as connection:
+        assert connection.execute(text("SELECT count(*) FROM articles")).scalar() == 0
+
+
+def test_backfilled_timestamps_share_the_app_format(tmp_path):
+    engine = create_engine_from_config(f"sqlite:///{tmp_path / 'backfill.db'}")
+    with engine.begin() as connection:
+        command.upgrade(alembic_config(connection), "0001")
+        connection.execute(text("INSERT INTO articles (title, content) VALUES ('Old', 'body')"))
+        command.upgrade(alembic_config(connection), "0002")
+        assert len(connection.execute(text("SELECT created_at FROM articles")).scalar()) == 19
+
+        command.upgrade(alembic_config(connection), "head")
+        stored = connection.execute(text("SELECT created_at FROM articles")).scalar()
+    assert stored.endswith(".000000")
+    with Session(engine) as db:
+        assert db.get(Article, 1).created_at == datetime.fromisoformat(stored)
+    engine.dispose()
+
+
+def test_search_survives_replaying_the_migrations(tmp_path):
+    engine = create_engine_from_config(f"sqlite:///{tmp_path / 'replay.db'}")
+    match = text(f"SELECT rowid FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH 'zebra'")
+    with engine.begin() as connection:
+        command.upgrade(alembic_config(connection), "0003")
+        # Revision 0003 indexes articles through triggers.
+        connection.execute(text("INSERT INTO articles (title, content, created_at) VALUES ('T', 'a zebra', '2026-01-01')"))
+        assert connection.execute(match).scalars().all() == [1]
+
+        command.upgrade(alembic_config(connection), "head")
+        assert connection.execute(match).scalars().all() == [1]
+    with Session(engine) as db:
+        assert [hit.content for hit in ArticleRepository(db).search_articles("zebra")] == ["a zebra"]
+
+    with engine.begin() as connection:
+        command.downgrade(alembic_config(connection), "0003")
+        assert connection.execute(match).scalars().all() == [1]
+        assert connection.execute(text("SELECT content FROM articles")).scalar() == "a zebra"
+    engine.dispose()
+
+
+def test_tokens_used_before_the_split_are_still_caught(tmp_path):
+    engine = create_engine_from_config(f"sqlite:///{tmp_path / 'tokens.db'}")
+    with engine.begin() as connection:
+        command.upgrade(alembic_config(connection), "0007")
+        connection.execute(text(
+            "INSERT INTO revoked_tokens (token_id, expires_at, created_at) "
+            "VALUES ('used-jti', '2099-01-01', '2026-01-01')"
+        ))
+        command.upgrade(alembic_config(connection), "head")
+    with Session(engine) as db:
+        assert not AuthRepository(db).use_refresh_token("used-jti", None, datetime(2099, 1, 1))
+        assert AuthRepository(db).use_refresh_token("fresh-jti", None, datetime(2099, 1, 1))
+
+    with engine.begin() as connection:
+        command.downgrade(alembic_config(connection), "0007")
+        ids = connection.execute(text("SELECT token_id FROM revoked_tokens ORDER BY id")).scalars().all()
+    assert ids == ["used-jti", "fresh-jti"]
+    engine.dispose()
+
+
+def test_sqlite_index_is_rebuilt_to_delete_by_rowid(modern_sqlite_engine, tmp_path):
+    engine = modern_sqlite_engine(f"sqlite:///{tmp_path / 'modern.db'}")
+    ddl = text(f"SELECT sql FROM sqlite_master WHERE name = '{FTS_TABLE}'")
+    with engine.begin() as connection:
+        command.upgrade(alembic_config(connection), "0005")
+    with Session(engine) as db:
+        kept = ArticleRepository(db).create_article("Kept", "a zebra")
+        ArticleRepository(db).create_article("Gone", "another zebra")
+
+    create_schema(engine)
+    with engine.connect() as connection:
+        assert "contentless_delete" in connection.execute(ddl).scalar()
+    with Session(engine) as db:
+        repository = ArticleRepository(db)
+        assert repository.delete_article(kept.id + 1)
+        assert [hit.id for hit in repository.search_articles("zebra")] == [kept.id]
+
+    with engine.begin() as connection:
+        command.downgrade(alembic_config(connection), "0005")
+        assert "contentless_delete" not in connection.execute(ddl).scalar()
+    with Session(engine) as db:
+        assert [hit.id for hit in ArticleRepository(db).search_articles("zebra")] == [kept.id]
+
+
+def _plan(connection, statement) -> str:
+    compiled = statement.compile(connection, compile_kwargs={"literal_binds": True})
+    rows = connection.execute(text(f"EXPLAIN QUERY PLAN {compiled}")).all()
+    return "\n".join(row[-1] for row in rows)
+
+
+def test_listing_queries_are_index_backed(engine):
+    now = datetime(2026, 1, 1)
+    with engine.begin() as connection:
+        connection.execute(insert(User), [{"email": f"a{i}@example.com", "hashed_password": "x"} for i in range(5)])
+        connection.execute(
+            insert(Article),
+            [
+                {"title": f"t{i}", "excerpt": "c", "published": i % 3 != 0, "author_id": i % 5 + 1,
+                 "created_at": now + timedelta(minutes=i)}
+                for i in range(500)
+            ],
+        )
+        connection.execute(text("ANALYZE"))
+
+    filters = {
+        "published": {"published": True},
+        "author_id": {"author_id": 3},
+        "created": {"created_after": now, "created_before": now + timedelta(days=1)},
+        "title_prefix": {"title_prefix": "t1"},
+    }
+    expected_index = {
+        "published": "ix_articles_published_created_at",
+        "author_id": "ix_articles_author_id_created_at",
+        "title_prefix": "ix_articles_title_id",
+    }
+    with engine.connect() as connection:
+        for names, sorts in LISTING_COMBINATIONS.items():
+            arguments = {key: value for name in names for key, value in filters[name].items()}
+            index = next((expected_index[name] for name in names if name in expected_index), None)
+            for sort in sorts:
+                query = ArticleQuery(sort=sort, **arguments)
+                after = {"id": (100,), "title": ("t1", 100)}.get(sort, (now, 100))
+                for statement in (articles_page_statement(20, None, 200, query),
+                                  articles_page_statement(20, after, 200, query)):
+                    plan = _plan(connection, statement)
+                    assert "TEMP B-TREE" not in plan, (names, sort, plan)
+                    if index is not None:
+                        assert f"INDEX {index}" in plan, (names, sort, plan)
+
+
+def test_unsupported_listing_is_refused():
+    with pytest.raises(ValueError):
+        articles_page_statement(20, None, 200, ArticleQuery(published=True, author_id=1))
+    with pytest.raises(ValueError):
+        articles_page_statement(20, None, 200, ArticleQuery(sort="title"))
+
+
+def test_keyset_pages_by_recency(engine):
+    with engine.connect() as connection:
+        repository = ArticleRepository(Session(bind=connection))
+        author = connection.execute(
+            insert(User).values(email="w@example.com", hashed_password="x").returning(User.id)
+        ).scalar()
+        for i in range(5):
+            repository.db.execute(
+                insert(Article).values(
+                    title=f"t{i}", excerpt="c", author_id=author, published=i != 2,
+                    created_at=datetime(2026, 1, 1, 0, i),
+                )
+            )
+        recent = ArticleQuery(published=True, sort="-created_at")
+        first = repository.get_articles_page(2, query=recent)
+        assert [row.title for row in first] == ["t4", "t3", "t1"]
+        rest = repository.get_articles_page(2, after=(first[1].created_at, first[1].id), query=recent)
+        assert [row.title for row in rest] == ["t1", "t0"]
+        by_author = repository.get_articles_page(10, query=ArticleQuery(author_id=author, sort="created_at"))
+        assert [row.title for row in by_author] == ["t0", "t1", "t2", "t3", "t4"]
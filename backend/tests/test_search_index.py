@@ -0,0 +1,75 @@
+from types import SimpleNamespace
+
+import pytest
+
+from backend.core.cache import TTLCache
+from backend.models.article import Article
+from backend.repositories.article_repository import ArticleRepository
+from backend.schemas.article import ArticleCreate
+from backend.services.article_service import ArticleService
+from backend.services.search_index import ArticleSearchEngine, InvertedIndex
+
+
+@pytest.fixture
+def search_engine():
+    return ArticleSearchEngine(cache_size=16, cache_ttl=60)
+
+
+@pytest.fixture
+def article_service(db_session, search_engine):
+    return ArticleService(ArticleRepository(db_session), search_engine=search_engine)
+
+
+def test_inverted_index_prefix_and_ranking():
+    index = InvertedIndex()
+    index.add(1, "Cooking notes", "a short python aside")
+    index.add(2, "Python packaging", "wheels and sdists")
+    index.add(3, "Gardening", "nothing relevant")
+
+    assert [doc for doc, _ in index.search("pyth")] == [2, 1]
+    assert [doc for doc, _ in index.search("python wheel")] == [2]
+    assert index.search("python", limit=1, offset=1)[0][0] == 1
+
+    assert index.remove(2) is True
+    assert [doc for doc, _ in index.search("python")] == [1]
+
+    # A reused id must not inherit the deleted document's terms.
+    index.add(2, "Fresh", "content")
+    assert [doc for doc, _ in index.search("wheels")] == []
+    assert index.stats()["documents"] == 3
+
+
+def test_ttl_cache_evicts_least_recently_used():
+    cache = TTLCache(max_size=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert cache.stats()["evictions"] == 1
+    assert cache.stats()["hits"] == 1
+
+
+def test_service_search_uses_index_and_cache(article_service, db_session, search_engine):
+    db_session.add_all([Article(title="React Tips", content="hooks"), Article(title="Other", content="x")])
+    db_session.commit()
+
+    first = article_service.search_articles("react")
+    assert [r.title for r in first] == ["React Tips"]
+    assert first[0].snippet == "hooks"
+    assert search_engine.built
+
+    # A cache hit never reaches the repository.
+    article_service.article_repository = SimpleNamespace()
+    assert article_service.search_articles("React") == first
+    assert search_engine.stats()["cache"]["hits"] == 1
+
+
+def test_service_writes_update_index_incrementally(article_service, search_engine):
+    article_service.search_articles("anything")
+    created = article_service.create_article(ArticleCreate(title="Zebra facts", content="stripes"))
+    assert [r.id for r in article_service.search_articles("zebra")] == [created.id]
+
+    article_service.delete_article(created.id)
+    assert article_service.search_articles("zebra") == []
+    assert search_engine.index.stats()["documents"] == 0
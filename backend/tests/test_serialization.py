@@ -0,0 +1,36 @@
+import json
+from datetime import datetime
+
+from backend.core.serialization import JSONBytesResponse, dumps
+from backend.schemas.article import ArticlePage, ArticleResponse, ArticleSearchResult, ArticleSummary
+from backend.schemas.auth_schema import TokenResponse, UserResponse
+
+
+def test_dumps_matches_pydantic_json_for_nested_models():
+    page = ArticlePage(
+        items=[ArticleSummary(id=1, title="Café", excerpt="<mark>x</mark> \"quoted\"")],
+        limit=20,
+        next_cursor=None,
+    )
+    results = [ArticleSearchResult(id=2, title="t", snippet="s", score=1.5)]
+
+    assert json.loads(dumps(page)) == page.model_dump(mode="json")
+    assert json.loads(dumps(results)) == [result.model_dump(mode="json") for result in results]
+
+
+
+def test_dumps_matches_pydantic_json_for_auth_responses():
+    tokens = TokenResponse(access_token="a", refresh_token="r", expires_in=3600, csrf_token="c")
+    user = UserResponse(id=1, email="user@example.com", full_name=None, is_active=True,
+                        created_at=datetime(2026, 1, 1, 12, 30, 0, 250000))
+
+    assert json.loads(dumps(tokens)) == tokens.model_dump(mode="json")
+    assert json.loads(dumps(user)) == user.model_dump(mode="json")
+
+
+def test_bytes_response_passes_preserialized_content_through():
+    body = dumps(ArticleResponse(id=1, title="Hello", content="World"))
+
+    assert JSONBytesResponse(body).body is body
+    assert JSONBytesResponse({"id": 1}).body == b'{"id":1}'
+    assert JSONBytesResponse(body).headers["content-type"] == "application/json"
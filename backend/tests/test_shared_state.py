@@ -0,0 +1,80 @@
+import multiprocessing
+import time
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+
+from backend.core.shared_state import SharedCounters
+from backend.schemas.article import ArticleResponse
+from backend.schemas.auth_schema import TokenPayload, UserResponse
+from backend.services.article_cache import ArticleCache, InProcessCacheBackend
+from backend.services.auth_cache import AuthTokenCache
+from backend.services.search_index import ArticleSearchEngine
+
+
+def _bump_many(path, times):
+    counters = SharedCounters(path, slots=8)
+    for _ in range(times):
+        counters.bump(3)
+
+
+def test_counters_are_shared_between_processes(tmp_path):
+    path = str(tmp_path / "state" / "test.counters")
+    counters = SharedCounters(path, slots=8)
+    context = multiprocessing.get_context("spawn")
+    workers = [context.Process(target=_bump_many, args=(path, 200)) for _ in range(3)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    assert counters.get(3) == 600
+    assert counters.get(11) == 600  # same slot
+    assert counters.get(4) == 0
+
+
+@pytest.fixture
+def epochs(tmp_path):
+    counters = SharedCounters(str(tmp_path / "epochs.counters"), slots=64)
+    yield counters
+    counters.close()
+
+
+def test_invalidation_reaches_other_workers_article_caches(epochs):
+    # Two caches over one counter file stand in for two workers.
+    first, second = (
+        ArticleCache(InProcessCacheBackend(max_size=10, ttl=60), ttl=60, epochs=epochs) for _ in range(2)
+    )
+    article = ArticleResponse(id=1, title="Cached", content="body")
+    for cache in (first, second):
+        cache.get_or_load(1, lambda: (article, '"article-1-v1"'))
+    assert second.peek(1) is not None
+
+    first.invalidate(1)
+    assert first.peek(1) is None
+    assert second.peek(1) is None
+    assert second.get_or_load(2, lambda: None) is None
+
+
+def test_search_engine_rebuilds_after_another_workers_write(epochs):
+    rows = [SimpleNamespace(id=1, title="Python tips", content="x")]
+    first, second = (ArticleSearchEngine(cache_size=16, cache_ttl=60, epochs=epochs) for _ in range(2))
+    for engine in (first, second):
+        engine.build(rows)
+
+    first.add(2, "Python internals", "y")
+    first.sync()
+    assert first.built
+    second.sync()
+    assert not second.built
+
+
+def test_deactivation_reaches_other_workers_token_caches(epochs):
+    first, second = (AuthTokenCache(max_size=16, generations=epochs) for _ in range(2))
+    payload = TokenPayload(sub="7", exp=int(time.time()) + 60, type="access", csrf="c")
+    user = UserResponse(id=7, email="user@example.com", is_active=True, created_at=datetime(2026, 1, 1))
+    for cache in (first, second):
+        cache.put("token", payload, user)
+
+    first.invalidate_user(7)
+    assert second.get("token") is None
@@ -0,0 +1,40 @@
+import threading
+import time
+
+from sqlalchemy import func, select
+
+from backend.core.config import Config
+from backend.core.database import create_engine_from_config
+from backend.core.startup import prepare_database, startup_lock
+from backend.models.article import Article
+from backend.seed_data import SEED_ARTICLES
+
+
+def test_prepare_database_migrates_and_seeds_once(tmp_path, monkeypatch):
+    monkeypatch.setattr(Config, "STARTUP_LOCK_FILE", str(tmp_path / "startup.lock"))
+    engine = create_engine_from_config(f"sqlite:///{tmp_path / 'startup.db'}")
+    try:
+        prepare_database(engine, seed=True)
+        prepare_database(engine, seed=True)
+        with engine.connect() as connection:
+            assert connection.execute(select(func.count(Article.id))).scalar() == len(SEED_ARTICLES)
+    finally:
+        engine.dispose()
+
+
+def test_startup_lock_serializes_holders(tmp_path):
+    path = str(tmp_path / "locks" / "startup.lock")
+    events = []
+
+    def worker(name):
+        with startup_lock(path):
+            events.append(f"{name} in")
+            time.sleep(0.05)
+            events.append(f"{name} out")
+
+    threads = [threading.Thread(target=worker, args=(name,)) for name in ("a", "b")]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert events[1].endswith("out") and events[3].endswith("out")
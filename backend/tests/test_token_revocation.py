@@ -0,0 +1,63 @@
+from types import SimpleNamespace
+
+from backend.core.bloom import BloomFilter
+from backend.core.shared_state import SharedCounters
+from backend.services.token_revocation import TokenRevocationList
+
+
+class FakeRepository:
+    """The revocations_since half of AuthRepository, over a list of rows."""
+
+    def __init__(self):
+        self.rows = []
+        self.reads = 0
+
+    def revoke(self, token_id: str) -> None:
+        self.rows.append(SimpleNamespace(id=len(self.rows) + 1, token_id=token_id))
+
+    def revocations_since(self, last_id: int):
+        self.reads += 1
+        return [row for row in self.rows if row.id > last_id]
+
+
+def test_bloom_filter_has_no_false_negatives_and_few_false_positives():
+    bloom = BloomFilter(1000, error_rate=0.01)
+    for i in range(1000):
+        bloom.add(f"in-{i}")
+    assert all(f"in-{i}" in bloom for i in range(1000))
+    false_positives = sum(f"out-{i}" in bloom for i in range(10000))
+    assert false_positives < 300
+    assert not bloom.full
+
+
+def test_workers_pick_up_each_others_revocations():
+    counters = SharedCounters(slots=1)
+    repository = FakeRepository()
+    first = TokenRevocationList(capacity=100, counters=counters)
+    second = TokenRevocationList(capacity=100, counters=counters)
+    first.sync(repository)
+    second.sync(repository)
+
+    repository.revoke("family-a")
+    first.add("family-a")
+
+    assert "family-a" not in second
+    second.sync(repository)
+    assert "family-a" in second
+    reads = repository.reads
+    second.sync(repository)
+    assert repository.reads == reads
+
+
+def test_outgrown_filter_is_rebuilt_larger():
+    repository = FakeRepository()
+    revocations = TokenRevocationList(capacity=10)
+    revocations.sync(repository)
+    for i in range(25):
+        repository.revoke(f"t{i}")
+        revocations.add(f"t{i}")
+
+    revocations.sync(repository)
+
+    assert revocations.pending() is None
+    assert all(f"t{i}" in revocations for i in range(25))
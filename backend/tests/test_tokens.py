@@ -0,0 +1,105 @@
+import base64
+import json
+import time
+
+import jwt
+import pytest
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ec, ed25519
+
+from backend.core.config import Config
+from backend.core.tokens import KeyRing, SigningKey, TokenError, hmac_key, load_key_ring
+
+CLAIMS = {"sub": "7", "type": "access", "exp": int(time.time()) + 60}
+SECRET = b"a-test-secret-of-at-least-32-bytes"
+
+
+def _pem(private_key):
+    private = private_key.private_bytes(
+        serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8, serialization.NoEncryption()
+    ).decode()
+    public = private_key.public_key().public_bytes(
+        serialization.Encoding.PEM, serialization.PublicFormat.SubjectPublicKeyInfo
+    ).decode()
+    return private, public
+
+
+def _segment(data: dict) -> str:
+    return base64.urlsafe_b64encode(json.dumps(data).encode()).rstrip(b"=").decode()
+
+
+def test_rotation_keeps_old_tokens_valid():
+    old, new = hmac_key("2026-01", "HS256", SECRET), hmac_key("2026-07", "HS256", SECRET[::-1])
+    before = KeyRing([old], active="2026-01").encode(CLAIMS)
+    rotated = KeyRing([old, new], active="2026-07")
+
+    assert rotated.decode(before) == CLAIMS
+    after = rotated.encode(CLAIMS)
+    assert json.loads(base64.urlsafe_b64decode(after.split(".")[0] + "=="))["kid"] == "2026-07"
+    with pytest.raises(TokenError):
+        KeyRing([new], active="2026-07").decode(before)
+
+
+@pytest.mark.parametrize(
+    "alg,private_key",
+    [("ES256", ec.generate_private_key(ec.SECP256R1())), ("EdDSA", ed25519.Ed25519PrivateKey.generate())],
+)
+def test_asymmetric_tokens_verify_with_the_public_key_only(tmp_path, alg, private_key):
+    private_pem, public_pem = _pem(private_key)
+    key_file = tmp_path / "key.pem"
+    key_file.write_text(private_pem)
+    ring_file = tmp_path / "keys.json"
+    ring_file.write_text(
+        json.dumps({"active": "k1", "keys": [{"kid": "k1", "alg": alg, "private_key_file": str(key_file)}]})
+    )
+    signer = load_key_ring(str(ring_file))
+    token = signer.encode(CLAIMS)
+
+    verifier = KeyRing(
+        [SigningKey.from_dict({"kid": "k1", "alg": alg, "public_key": public_pem}),
+         hmac_key("local", "HS256", SECRET)],
+        active="local",
+    )
+    assert verifier.decode(token) == CLAIMS
+    assert [jwk["kid"] for jwk in signer.jwks()["keys"]] == ["k1"]
+
+    header, claims, signature = token.split(".")
+    forged = f"{header}.{_segment({**CLAIMS, 'sub': '1'})}.{signature}"
+    with pytest.raises(TokenError):
+        verifier.decode(forged)
+
+
+def test_rejects_algorithm_mismatch_expiry_and_garbage():
+    ring = KeyRing([hmac_key("default", "HS256", SECRET)], active="default", fallback="default")
+    token = ring.encode(CLAIMS)
+    _, claims, signature = token.split(".")
+
+    headers = ({"alg": "none", "kid": "default"}, {"alg": "HS512", "kid": "default"}, {"alg": "HS256", "kid": ["x"]})
+    for header in headers:
+        with pytest.raises(TokenError):
+            ring.decode(f"{_segment(header)}.{claims}.{signature}")
+    with pytest.raises(TokenError):
+        ring.decode(ring.encode({**CLAIMS, "exp": int(time.time()) - 1}))
+    with pytest.raises(TokenError):
+        ring.decode(ring.encode({key: value for key, value in CLAIMS.items() if key != "exp"}))
+    for garbage in ("", "a.b", "not.a.token", "é.é.é"):
+        with pytest.raises(TokenError):
+            ring.decode(garbage)
+
+    # Tokens issued before keys had ids carry no kid and use the fallback key.
+    legacy = jwt.encode(CLAIMS, SECRET, algorithm="HS256")
+    assert ring.decode(legacy) == CLAIMS
+    with pytest.raises(TokenError):
+        KeyRing([hmac_key("default", "HS256", SECRET)], active="default").decode(legacy)
+
+
+def test_asymmetric_algorithm_without_a_key_ring_is_a_configuration_error(monkeypatch):
+    monkeypatch.setattr(Config, "JWT_ALGORITHM", "ES256")
+    with pytest.raises(ValueError, match="JWT_KEYS_FILE"):
+        load_key_ring(None)
+
+
+def test_keys_on_the_wrong_curve_are_refused():
+    private_pem, _ = _pem(ec.generate_private_key(ec.SECP384R1()))
+    with pytest.raises(ValueError, match="key k1"):
+        SigningKey.from_dict({"kid": "k1", "alg": "ES256", "private_key": private_pem})
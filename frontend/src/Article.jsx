@@ -1,8 +1,7 @@
 const Article = ({ article, active = false, onSelect }) => {
-  const snippet =
-    article.content.length > 140
-      ? `${article.content.slice(0, 137).trimEnd()}...`
-      : article.content
+  // Search hits carry a highlighted snippet; plain text is enough for the card.
+  const text = (article.snippet ?? article.excerpt ?? article.content ?? "").replace(/<\/?mark>/g, "")
+  const snippet = text.length > 140 ? `${text.slice(0, 137).trimEnd()}...` : text
 
   return (
     <article
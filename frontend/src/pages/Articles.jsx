@@ -8,6 +8,8 @@ import "../App.css"
 
 const ARTICLES_URL = "/articles/"
 const SEARCH_URL = "/articles/search"
+// Newest published first; served from the (published, created_at) index.
+const LIST_PARAMS = { published: true, sort: "-created_at" }
 
 const Articles = () => {
   const { user } = useAuth()
@@ -18,6 +20,9 @@ const Articles = () => {
   const [creating, setCreating] = useState(false)
   const [deletingId, setDeletingId] = useState(null)
   const [searchTerm, setSearchTerm] = useState("")
+  const [nextCursor, setNextCursor] = useState(null)
+  const [loadingMore, setLoadingMore] = useState(false)
+  const [detail, setDetail] = useState(null)
 
   const selectedArticle = useMemo(
     () => articles.find((article) => article.id === selectedId) || articles[0],
@@ -33,11 +38,14 @@ const Articles = () => {
   }, [])
 
   const fetchArticles = useCallback(
-    async (url) => {
+    async (url, params) => {
       setLoading(true)
       try {
-        const res = await api.get(url)
-        applyArticles(res.data)
+        const res = await api.get(url, { params })
+        // The list endpoint returns a cursor page; search returns a plain array.
+        const page = Array.isArray(res.data) ? { items: res.data, next_cursor: null } : res.data
+        applyArticles(page.items)
+        setNextCursor(page.next_cursor)
         setError("")
       } catch (err) {
         const message = err.response?.data?.detail || err.message || "Failed to load articles"
@@ -52,7 +60,7 @@ const Articles = () => {
   useEffect(() => {
     const term = searchTerm.trim()
     if (term === "") {
-      fetchArticles(ARTICLES_URL)
+      fetchArticles(ARTICLES_URL, LIST_PARAMS)
       return
     }
     const handle = setTimeout(() => {
@@ -62,12 +70,43 @@ const Articles = () => {
     return () => clearTimeout(handle)
   }, [searchTerm, fetchArticles])
 
+  const handleLoadMore = async () => {
+    if (!nextCursor) return
+    setLoadingMore(true)
+    try {
+      const res = await api.get(ARTICLES_URL, { params: { ...LIST_PARAMS, after: nextCursor } })
+      setArticles((prev) => [...prev, ...res.data.items])
+      setNextCursor(res.data.next_cursor)
+    } catch (err) {
+      const message = err.response?.data?.detail || err.message || "Failed to load articles"
+      setError(message)
+    } finally {
+      setLoadingMore(false)
+    }
+  }
+
+  useEffect(() => {
+    const id = selectedArticle?.id
+    if (id == null) {
+      setDetail(null)
+      return
+    }
+    let cancelled = false
+    api
+      .get(`${ARTICLES_URL}${id}`)
+      .then((res) => !cancelled && setDetail(res.data))
+      .catch(() => !cancelled && setDetail(null))
+    return () => {
+      cancelled = true
+    }
+  }, [selectedArticle?.id])
+
   const handleCreate = async (payload) => {
     setCreating(true)
     try {
       const res = await api.post(ARTICLES_URL, payload)
       const created = res.data
-      setArticles((prev) => [created, ...prev])
+      setArticles((prev) => [{ ...created, excerpt: created.content }, ...prev])
       setSelectedId(created.id)
       setError("")
       return { ok: true }
@@ -181,6 +220,11 @@ const Articles = () => {
                   onSelect={() => setSelectedId(article.id)}
                 />
               ))}
+              {nextCursor && (
+                <button className="ghost" type="button" onClick={handleLoadMore} disabled={loadingMore}>
+                  {loadingMore ? "Loading..." : "Load more"}
+                </button>
+              )}
               {!articles.length && (
                 <div className="panel empty">
                   <p>No articles yet.</p>
@@ -197,7 +241,9 @@ const Articles = () => {
             <div className="detail">
               <p className="kicker">Focus</p>
               <h3>{selectedArticle.title}</h3>
-              <p className="detail-body">{selectedArticle.content}</p>
+              <p className="detail-body">
+                {detail?.id === selectedArticle.id ? detail.content : selectedArticle.excerpt}
+              </p>
               <div className="detail-actions">
                 <button
                   className="ghost danger"